@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def backfill_unread_notification_count(apps, schema_editor):
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    Notification = apps.get_model("notifications", "Notification")
+
+    counted = (
+        Notification.objects.filter(read=False)
+        .values_list("recipient_id")
+        .annotate(unread=Count("id"))
+        .order_by()
+    )
+    for recipient_id, unread in counted.iterator():
+        CustomUser.objects.filter(id=recipient_id).update(unread_notification_count=unread)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_customuser_unread_notification_count'),
+        ('notifications', '0003_notification_notif_recipient_read_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_unread_notification_count, migrations.RunPython.noop),
+    ]
@@ -33,6 +33,9 @@ class CustomUser(AbstractUser):
     follower_count = models.PositiveIntegerField(default=0)
     following_count = models.PositiveIntegerField(default=0)
 
+    # 🔔 Unread notifications badge (kept in sync by notifications/unread.py)
+    unread_notification_count = models.PositiveIntegerField(default=0)
+
     def save(self, *args, **kwargs):
         """Auto-assign virtual ID and phone prefix from country code."""
         if not self.virtual_id:
@@ -79,6 +82,10 @@ class Follow(models.Model):
     class Meta:
         unique_together = ("follower", "following")
         ordering = ["-created_at"]
+        indexes = [
+            # follower fan-out: WHERE following_id = ? ORDER BY follower_id (notifications/fanout.py)
+            models.Index(fields=["following", "follower"], name="follow_following_follower_idx"),
+        ]
 
     def __str__(self):
         return f"{self.follower} → {self.following}"
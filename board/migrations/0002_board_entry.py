@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0001_initial'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('summary', models.CharField(blank=True, max_length=300)),
+                ('author_name', models.CharField(blank=True, max_length=255)),
+                ('location', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('added_at', models.DateTimeField(auto_now_add=True)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='board.board')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['board', '-created_at', '-id'], name='board_entry_board_idx'), models.Index(fields=['-created_at', '-id'], name='board_entry_recent_idx')],
+                'constraints': [models.UniqueConstraint(fields=('board', 'content_type', 'object_id'), name='board_entry_item_uniq')],
+            },
+        ),
+    ]
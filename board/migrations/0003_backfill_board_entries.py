@@ -0,0 +1,59 @@
+from django.db import migrations
+
+
+def location_label(obj):
+    places = [
+        obj.post_town.name if obj.post_town_id else (obj.post_town_input or ""),
+        obj.post_state.name if obj.post_state_id else "",
+        obj.post_country.name if obj.post_country_id else "",
+    ]
+    return ", ".join(p for p in places if p and p != "Unspecified")[:255]
+
+
+def backfill_board_entries(apps, schema_editor):
+    Board = apps.get_model("board", "Board")
+    BoardEntry = apps.get_model("board", "BoardEntry")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    post_type, _ = ContentType.objects.get_or_create(app_label="posts", model="post")
+    seeker_type, _ = ContentType.objects.get_or_create(app_label="seekers", model="seekerpost")
+
+    for board in Board.objects.all():
+        related = (
+            (board.posts, post_type, "product_name"),
+            (board.seeker_posts, seeker_type, "title"),
+        )
+        for manager, content_type, title_field in related:
+            items = manager.filter(status="approved").select_related(
+                "author", "post_town", "post_state", "post_country"
+            )
+            BoardEntry.objects.bulk_create(
+                [
+                    BoardEntry(
+                        board=board,
+                        content_type=content_type,
+                        object_id=obj.pk,
+                        title=(getattr(obj, title_field) or "Untitled")[:255],
+                        summary=(obj.description or "")[:300],
+                        author_name=(obj.business_name or obj.author.username)[:255],
+                        location=location_label(obj),
+                        created_at=obj.created_at,
+                    )
+                    for obj in items.iterator(chunk_size=1000)
+                ],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0002_board_entry'),
+        ('posts', '0005_backfill_post_audience_key'),
+        ('seekers', '0003_backfill_seekerpost_audience_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_board_entries, migrations.RunPython.noop),
+    ]
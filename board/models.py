@@ -4,6 +4,16 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from posts.models import Post
 from seekers.models import SeekerPost
+from .widget_cache import invalidate_board_widget
+
+POST_BOARD = "PostBoard"
+SEEKERS_BOARD = "SeekersBoard"
+BOARD_DESCRIPTIONS = {
+    POST_BOARD: "Board for all approved posts.",
+    SEEKERS_BOARD: "Board for all approved seeker requests.",
+}
+
+_named_boards = {}  # name → Board, per process; board.signals drops deleted boards
 
 
 class Board(models.Model):
@@ -28,20 +38,133 @@ class Board(models.Model):
     def __str__(self):
         return f"{self.name}"
 
+    @classmethod
+    def named(cls, name):
+        """The board called `name`, created on first use; cached per process."""
+        board = _named_boards.get(name)
+        if board is None:
+            board, _ = cls.objects.get_or_create(
+                name=name, defaults={"description": BOARD_DESCRIPTIONS.get(name, "")}
+            )
+            _named_boards[name] = board
+        return board
+
+    @staticmethod
+    def membership(obj):
+        """(M2M through model, column) holding obj's board memberships."""
+        if isinstance(obj, Post):
+            return Board.posts.through, "post_id"
+        if isinstance(obj, SeekerPost):
+            return Board.seeker_posts.through, "seekerpost_id"
+        raise TypeError(f"Unsupported object type: {type(obj).__name__}")
+
     # ✅ NEW HELPER METHOD
     def add_item(self, obj):
         """
-        Add a Post or SeekerPost instance to the correct relation.
+        Add a Post or SeekerPost instance to the correct relation,
+        and upsert its BoardEntry (what the board pages actually read).
+        Idempotent: two statements, however big the board is.
         """
-        from posts.models import Post
-        from seekers.models import SeekerPost
+        through, column = self.membership(obj)
+        through.objects.bulk_create(
+            [through(board_id=self.pk, **{column: obj.pk})], ignore_conflicts=True
+        )
+        BoardEntry.upsert(self, obj)
+        invalidate_board_widget()
 
-        if isinstance(obj, Post):
-            self.posts.add(obj)
-        elif isinstance(obj, SeekerPost):
-            self.seeker_posts.add(obj)
-        else:
-            raise TypeError(f"Unsupported object type: {type(obj).__name__}")
-
-        self.save()
-        print(f"[INFO] Added {obj.__class__.__name__} {obj.pk} to board '{self.name}'")
+    def remove_item(self, obj):
+        """Take obj off this board (no-op if it isn't on it)."""
+        through, column = self.membership(obj)
+        through.objects.filter(board_id=self.pk, **{column: obj.pk}).delete()
+        removed, _ = BoardEntry.objects.filter(
+            board=self, content_type=ContentType.objects.get_for_model(obj.__class__), object_id=obj.pk
+        ).delete()
+        if removed:
+            invalidate_board_widget()
+
+
+class BoardEntry(models.Model):
+    """
+    One item on a board, with everything the board pages show copied in
+    (title, summary, author, location), so the widget and the unified board
+    are a single range scan on (created_at, id) with no joins.
+
+    created_at is the item's own created_at (boards list newest posts first).
+    Rows exist only while the item is approved and not deleted: the board
+    sync signals (posts.signals, seekers.signals) call Board.add_item() to
+    upsert and Board.remove_item() to delete.
+    """
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="entries")
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey("content_type", "object_id")
+
+    title = models.CharField(max_length=255)
+    summary = models.CharField(max_length=300, blank=True)
+    author_name = models.CharField(max_length=255, blank=True)
+    location = models.CharField(max_length=255, blank=True)
+
+    created_at = models.DateTimeField()
+    added_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+        constraints = [
+            models.UniqueConstraint(fields=["board", "content_type", "object_id"], name="board_entry_item_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["board", "-created_at", "-id"], name="board_entry_board_idx"),
+            models.Index(fields=["-created_at", "-id"], name="board_entry_recent_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.board_id}: {self.title}"
+
+    @property
+    def type(self):
+        """'post' or 'seekerpost' (content types are cached, no query)."""
+        return ContentType.objects.get_for_id(self.content_type_id).model
+
+    @staticmethod
+    def snapshot(obj):
+        """The denormalized fields for a Post or SeekerPost."""
+        from custom_search.gazetteer import UNSPECIFIED_ID, get_gazetteer
+
+        title = obj.product_name if isinstance(obj, Post) else obj.title
+
+        gazetteer = get_gazetteer()
+        places = []
+        town = gazetteer.get("town", obj.post_town_id) if obj.post_town_id != UNSPECIFIED_ID else None
+        places.append(town.name if town else (obj.post_town_input or ""))
+        for level in ("state", "country"):
+            pk = getattr(obj, f"post_{level}_id")
+            place = gazetteer.get(level, pk) if pk != UNSPECIFIED_ID else None
+            places.append(place.name if place else "")
+
+        return {
+            "title": (title or "Untitled")[:255],
+            "summary": (obj.description or "")[:300],
+            "author_name": (obj.business_name or obj.author.username)[:255],
+            "location": ", ".join(p for p in places if p)[:255],
+            "created_at": obj.created_at,
+        }
+
+    @classmethod
+    def build(cls, board, obj):
+        return cls(
+            board=board,
+            content_type=ContentType.objects.get_for_model(obj.__class__),
+            object_id=obj.pk,
+            **cls.snapshot(obj),
+        )
+
+    @classmethod
+    def upsert(cls, board, obj):
+        """Insert or refresh obj's entry on board in one statement."""
+        cls.objects.bulk_create(
+            [cls.build(board, obj)],
+            update_conflicts=True,
+            unique_fields=["board", "content_type", "object_id"],
+            update_fields=["title", "summary", "author_name", "location", "created_at"],
+        )
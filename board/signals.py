@@ -0,0 +1,11 @@
+# board/signals.py
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import Board, _named_boards
+
+
+@receiver(post_delete, sender=Board)
+def forget_deleted_board(sender, instance, **kwargs):
+    """Board.named() caches boards per process; don't hand out a deleted one."""
+    _named_boards.pop(instance.name, None)
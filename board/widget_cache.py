@@ -0,0 +1,53 @@
+# board/widget_cache.py
+"""
+Cache for the "Recent" board widget shown next to the home feeds.
+
+The widget is the same for every visitor, so its BoardEntry rows are cached
+once (per item count) and shared by every feed page render: zero queries on a
+hit. Entries carry everything the widget shows, so the cached list is used as is.
+
+Invalidation is by version counter, like posts/feed_cache.py: every board
+membership change (Board.add_item / remove_item, remove_from_board) bumps
+VERSION_KEY after commit, which orphans the cached lists; they age out after
+BOARD_WIDGET_CACHE_TIMEOUT.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+BOARD_WIDGET_CACHE_TIMEOUT = getattr(settings, "BOARD_WIDGET_CACHE_TIMEOUT", 600)
+VERSION_KEY = "board:widget:v"
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # start from the clock so a new counter never matches old entries
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def cached_board_items(limit=7):
+    """The latest `limit` BoardEntry rows across all boards, newest first."""
+    from .models import BoardEntry
+
+    key = f"board:widget:{limit}:{_version()}"
+    items = cache.get(key)
+    if items is None:
+        items = list(BoardEntry.objects.order_by("-created_at", "-id")[:limit])
+        cache.set(key, items, BOARD_WIDGET_CACHE_TIMEOUT)
+    return items
+
+
+def invalidate_board_widget():
+    """Drop the cached widget lists once the current transaction commits."""
+    def bump():
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:  # counter not in the cache → nothing cached against it
+            pass
+
+    transaction.on_commit(bump)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CustomSearchConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'custom_search'
+
+    def ready(self):
+        import custom_search.signals  # noqa: F401
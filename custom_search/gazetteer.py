@@ -0,0 +1,252 @@
+# custom_search/gazetteer.py
+"""
+In-memory gazetteer: the whole Continent → Country → State → Town tree, loaded
+once per process and served without touching the database.
+
+Each level is stored as compact parallel arrays (ids / names / codes / parent
+ids) plus:
+  - slot:     id → position in the arrays
+  - children: parent id → child ids, already sorted by name
+  - by_name:  lowercased name → ids (names repeat across states/countries)
+  - prefixes: sorted (lowercased text from each word start, name) pairs,
+              bisected for autocomplete
+
+The tree is loaded lazily on first use. Any save/delete of a location row
+(custom_search.signals) bumps a version number in the shared cache, and every
+process reloads its copy the next time it sees a newer version. With the default
+per-process LocMem cache that version is not shared, so every copy is also
+reloaded once it is older than GAZETTEER_MAX_AGE seconds: that bounds how long
+another worker can serve a stale tree. Bulk writes that skip signals (loaders,
+bulk_create) must call invalidate() themselves.
+"""
+import bisect
+import re
+import threading
+import time
+from array import array
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Continent, Country, State, Town
+
+LEVELS = ("continent", "country", "state", "town")
+MODELS = {"continent": Continent, "country": Country, "state": State, "town": Town}
+PARENT = {"continent": None, "country": "continent", "state": "country", "town": "state"}
+CHILD = {"continent": "country", "country": "state", "state": "town", "town": None}
+
+UNSPECIFIED_ID = 0  # the seeded "Unspecified" row on every level
+
+VERSION_KEY = "gazetteer:version"
+DEFAULT_MAX_AGE = 300  # seconds
+WORD_START_RE = re.compile(r"\b\w")
+
+Place = namedtuple("Place", "id name code parent_id")
+
+
+class Level:
+    __slots__ = ("name", "ids", "names", "codes", "parents", "slot", "children", "by_name", "prefixes")
+
+    def __init__(self, name, rows):
+        # rows: (id, name, code, parent_id), ordered by name
+        self.name = name
+        self.ids = array("q")
+        self.parents = array("q")
+        self.names, self.codes = [], []
+        self.slot, self.children, self.by_name = {}, {}, {}
+        self.prefixes = []
+
+        for pk, place_name, code, parent_id in rows:
+            self.slot[pk] = len(self.ids)
+            self.ids.append(pk)
+            self.parents.append(-1 if parent_id is None else parent_id)
+            self.names.append(place_name)
+            self.codes.append(code)
+            self.children.setdefault(parent_id, []).append(pk)
+            if place_name:
+                lowered = place_name.lower()
+                self.by_name.setdefault(lowered, []).append(pk)
+                # "lagos island" is found by "lag…" and by "isl…"
+                self.prefixes.extend((lowered[m.start():], place_name) for m in WORD_START_RE.finditer(lowered))
+        self.prefixes.sort()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def get(self, pk):
+        i = self.slot.get(pk)
+        if i is None:
+            return None
+        parent = self.parents[i]
+        return Place(pk, self.names[i], self.codes[i], None if parent == -1 else parent)
+
+
+class Gazetteer:
+    def __init__(self, version=None):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.levels = {}
+        for level in LEVELS:
+            model = MODELS[level]
+            parent = PARENT[level]
+            fields = ["id", "name", "code"] + ([f"{parent}_id"] if parent else [])
+            rows = model.objects.order_by("name", "id").values_list(*fields)
+            if not parent:
+                rows = ((*row, None) for row in rows)
+            self.levels[level] = Level(level, rows)
+
+    # ---------------- lookups ----------------
+
+    def get(self, level, pk):
+        """Place(id, name, code, parent_id) or None."""
+        try:
+            return self.levels[level].get(int(pk))
+        except (TypeError, ValueError):
+            return None
+
+    def exists(self, level, pk):
+        return self.get(level, pk) is not None
+
+    def children(self, level, parent_id=None):
+        """Places on `level` under parent_id, sorted by name (continents: parent_id=None)."""
+        lvl = self.levels[level]
+        if PARENT[level] is None:
+            ids = lvl.children.get(None, [])
+        else:
+            try:
+                ids = lvl.children.get(int(parent_id), [])
+            except (TypeError, ValueError):
+                ids = []
+        return [lvl.get(pk) for pk in ids]
+
+    def ancestors(self, level, pk):
+        """{level: id} for pk and every level above it, e.g. a town → its state, country, continent."""
+        chain = {}
+        place = self.get(level, pk)
+        while place is not None:
+            chain[level] = place.id
+            level = PARENT[level]
+            if level is None or place.parent_id is None:
+                break
+            place = self.get(level, place.parent_id)
+        return chain
+
+    def options(self, level, parent_id=None):
+        """
+        Dropdown data for the location APIs: [{"id", "name"}] sorted by name,
+        "Unspecified" (id=0) always included.
+        """
+        places = self.children(level, parent_id)
+        unspecified = self.get(level, UNSPECIFIED_ID)
+        if unspecified and all(p.id != UNSPECIFIED_ID for p in places):
+            places = sorted([unspecified, *places], key=lambda p: p.name or "")
+        return [{"id": p.id, "name": p.name} for p in places]
+
+    def scoped_choices(self, level, parent_id=None, selected_id=None):
+        """
+        (id, name) choices for one location <select>: the options under
+        parent_id, plus selected_id if it isn't among them. Without a parent
+        (below the top level) only Unspecified and the selection are offered;
+        the rest is fetched by location_dropdown.js once a parent is picked.
+        """
+        if PARENT[level] is None or parent_id not in (None, ""):
+            options = self.options(level, parent_id)
+        else:
+            unspecified = self.get(level, UNSPECIFIED_ID)
+            options = [{"id": unspecified.id, "name": unspecified.name}] if unspecified else []
+
+        selected = self.get(level, selected_id)
+        if selected and all(o["id"] != selected.id for o in options):
+            options.append({"id": selected.id, "name": selected.name})
+        return [(o["id"], o["name"]) for o in options]
+
+    # ---------------- names ----------------
+
+    def resolve(self, level, name, parent_id=None):
+        """Case-insensitive exact name → list of ids (optionally only under parent_id)."""
+        if not name:
+            return []
+        ids = self.levels[level].by_name.get(name.strip().lower(), [])
+        if parent_id is not None:
+            ids = [pk for pk in ids if self.get(level, pk).parent_id == int(parent_id)]
+        return list(ids)
+
+    def search(self, level, query, limit=10):
+        """Names with a word starting with query (case-insensitive), for autocomplete."""
+        query = (query or "").strip().lower()
+        lvl = self.levels[level]
+        if not query:
+            return lvl.names[:limit]
+        prefixes = lvl.prefixes
+        matches = []
+        i = bisect.bisect_left(prefixes, (query,))
+        while i < len(prefixes) and len(matches) < limit and prefixes[i][0].startswith(query):
+            name = prefixes[i][1]
+            if name not in matches:
+                matches.append(name)
+            i += 1
+        return matches
+
+    # ---------------- model instances ----------------
+
+    def instance(self, level, pk):
+        """
+        Model instance built from memory (other fields deferred), e.g. for
+        form initial values and FK assignment. None if pk doesn't exist.
+        """
+        place = self.get(level, pk)
+        if place is None:
+            return None
+        model = MODELS[level]
+        parent = PARENT[level]
+        known = {"id": place.id, "name": place.name, "code": place.code}
+        if parent:
+            known[f"{parent}_id"] = place.parent_id
+        # from_db() expects values in concrete-field order
+        fields = [f.attname for f in model._meta.concrete_fields if f.attname in known]
+        return model.from_db("default", fields, [known[f] for f in fields])
+
+
+_gazetteer = None
+_lock = threading.Lock()
+
+
+def current_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _is_current(gazetteer, version):
+    max_age = getattr(settings, "GAZETTEER_MAX_AGE", DEFAULT_MAX_AGE)
+    return (
+        gazetteer is not None
+        and gazetteer.version == version
+        and time.monotonic() - gazetteer.loaded_at < max_age
+    )
+
+
+def get_gazetteer():
+    """The process-wide gazetteer, (re)loaded when the version moves or it reaches GAZETTEER_MAX_AGE."""
+    global _gazetteer
+    version = current_version()
+    gazetteer = _gazetteer
+    if _is_current(gazetteer, version):
+        return gazetteer
+    with _lock:
+        if not _is_current(_gazetteer, version):
+            _gazetteer = Gazetteer(version)
+        return _gazetteer
+
+
+def invalidate():
+    """Location rows changed: every process reloads on its next lookup."""
+    global _gazetteer
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+    _gazetteer = None
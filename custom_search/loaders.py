@@ -0,0 +1,178 @@
+# custom_search/loaders.py
+"""
+Bulk loaders for the location datasets in data_generator/raw/.
+
+The JSON arrays are streamed one object at a time (no json.load of the whole
+file), parents are resolved from in-memory id maps, and rows are written with
+bulk_create(update_conflicts=True) in batches, all inside one transaction.
+Re-running a loader updates rows in place (matched on id).
+
+bulk_create skips save() and signals, so the loaders fill in what
+Country.save() would have (phone_code) and refresh the gazetteer themselves.
+"""
+import json
+import os
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import transaction
+
+from person.utils.phone_codes import PHONE_CODES
+
+from . import gazetteer
+from .models import Continent, Country, State
+
+RAW_DATA_DIR = os.path.join(settings.BASE_DIR, "data_generator", "raw")
+
+_decoder = json.JSONDecoder()
+
+
+@dataclass
+class LoadResult:
+    written: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.written / self.seconds if self.seconds else float(self.written)
+
+
+def iter_json_array(path, chunk_size=64 * 1024):
+    """Yield the items of a top-level JSON array without loading the whole file."""
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        started = False
+        eof = False
+        while True:
+            pos = 0
+            while True:
+                # skip whitespace, the opening bracket and separators
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if not started and pos < len(buffer):
+                    if buffer[pos] != "[":
+                        raise ValueError(f"{path}: expected a JSON array")
+                    started = True
+                    pos += 1
+                    continue
+                if pos < len(buffer) and buffer[pos] == "]":
+                    return
+                try:
+                    item, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    break  # item continues in the next chunk
+                yield item
+                pos = end
+
+            chunk = f.read(chunk_size)
+            buffer = buffer[pos:] + chunk
+            eof = not chunk
+
+
+def _write_batches(model, rows, update_fields, batch_size):
+    """bulk_create rows (an iterable of unsaved instances) batch by batch; returns the count."""
+    written = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            model.objects.bulk_create(
+                batch, update_conflicts=True, unique_fields=["id"], update_fields=update_fields
+            )
+            written += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(
+            batch, update_conflicts=True, unique_fields=["id"], update_fields=update_fields
+        )
+        written += len(batch)
+    return written
+
+
+def load_countries(path=None, batch_size=1000, on_skip=None):
+    """
+    Upsert Country rows from countries.json (id, iso2, name, region_id).
+    on_skip(entry, reason) is called for rows that can't be placed.
+    """
+    path = path or os.path.join(RAW_DATA_DIR, "countries.json")
+    result = LoadResult()
+    started = time.monotonic()
+
+    continent_ids = set(Continent.objects.values_list("id", flat=True))
+
+    def rows():
+        for entry in iter_json_array(path):
+            if entry.get("region_id") not in continent_ids:
+                result.skipped += 1
+                if on_skip:
+                    on_skip(entry, f"Continent with ID {entry.get('region_id')} not found")
+                continue
+            iso2 = (entry.get("iso2") or "").upper()
+            phone_code = PHONE_CODES.get(iso2)
+            if not phone_code and entry.get("phonecode"):
+                phone_code = "+" + str(entry["phonecode"]).lstrip("+")
+            yield Country(
+                id=entry["id"],
+                code=iso2,
+                name=entry["name"],
+                country_code=iso2,
+                continent_id=entry["region_id"],
+                phone_code=phone_code or "",
+            )
+
+    with transaction.atomic():
+        result.written = _write_batches(
+            Country, rows(),
+            ["code", "name", "country_code", "continent", "phone_code"],
+            batch_size,
+        )
+        transaction.on_commit(gazetteer.invalidate)
+
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def load_states(path=None, batch_size=1000, on_skip=None):
+    """
+    Upsert State rows from states.json (id, name, iso2, country_id / country_code).
+
+    State codes are unique: a state keeps its iso2 unless another state already
+    holds it (in the DB or earlier in the file), otherwise it gets
+    "<country code>_<state id>".
+    """
+    path = path or os.path.join(RAW_DATA_DIR, "states.json")
+    result = LoadResult()
+    started = time.monotonic()
+
+    country_codes = dict(Country.objects.values_list("id", "code"))
+    country_by_code = {code: pk for pk, code in country_codes.items() if code}
+    code_owner = {code: pk for pk, code in State.objects.values_list("id", "code")}
+
+    def rows():
+        for item in iter_json_array(path):
+            country_id = item.get("country_id")
+            if country_id not in country_codes:
+                country_id = country_by_code.get(item.get("country_code"))
+            if country_id is None:
+                result.skipped += 1
+                if on_skip:
+                    on_skip(item, "no country match")
+                continue
+
+            code = item.get("iso2")
+            if not code or code_owner.get(code, item["id"]) != item["id"]:
+                code = f"{country_codes[country_id]}_{item['id']}"  # always unique
+            code_owner[code] = item["id"]
+
+            yield State(id=item["id"], code=code, name=item.get("name"), country_id=country_id)
+
+    with transaction.atomic():
+        result.written = _write_batches(State, rows(), ["code", "name", "country"], batch_size)
+        transaction.on_commit(gazetteer.invalidate)
+
+    result.seconds = time.monotonic() - started
+    return result
@@ -0,0 +1,62 @@
+import hashlib
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from media_app.blobs import store_upload
+from media_app.models import MediaBlob, MediaFile
+
+
+class Command(BaseCommand):
+    help = "Move media stored before de-duplication into the content-addressed blob store"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only hash files and report the duplicates")
+
+    def handle(self, *args, **options):
+        legacy = MediaFile.objects.filter(blob__isnull=True).order_by("pk")
+        self.stdout.write(f"🔎 Checking {legacy.count()} media files...")
+
+        moved = missing = duplicates = freed = unthumbed = 0
+        seen = set()
+        for media in legacy.iterator(chunk_size=500):
+            storage = media.file.storage
+            if not media.file or not storage.exists(media.file.name):
+                missing += 1
+                continue
+
+            if options["dry_run"]:
+                digest = hashlib.sha256()
+                with storage.open(media.file.name, "rb") as f:
+                    for chunk in File(f).chunks():
+                        digest.update(chunk)
+                sha256 = digest.hexdigest()
+                if sha256 in seen or MediaBlob.objects.filter(sha256=sha256).exists():
+                    duplicates += 1
+                    freed += media.file.size
+                seen.add(sha256)
+                continue
+
+            old_names = [media.file.name] + [
+                name for names in (media.variants or {}).values() for name in names.values()
+            ]
+            with transaction.atomic():
+                with storage.open(media.file.name, "rb") as f:
+                    blob = store_upload(File(f, name=media.file.name))
+                shared = (
+                    MediaFile.objects.filter(blob=blob).exclude(variants={})
+                    .values_list("variants", flat=True).first()
+                )
+                MediaFile.objects.filter(pk=media.pk).update(blob=blob, file=blob.file.name, variants=shared or {})
+                transaction.on_commit(lambda names=old_names: [storage.delete(name) for name in names])
+            moved += 1
+            unthumbed += media.file_type == "image" and not shared
+            if blob.ref_count > 1:
+                duplicates += 1
+                freed += blob.size
+
+        verb = "would free" if options["dry_run"] else "freed"
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 Done! {moved} moved, {duplicates} duplicates ({verb} {freed / 1_048_576:.1f} MB), {missing} missing"
+        ))
+        if unthumbed:
+            self.stdout.write("🖼️  Run generate_media_variants to rebuild thumbnails for the moved images.")
@@ -21,9 +21,8 @@ class Command(BaseCommand):
         with transaction.atomic():
             for post in seeker_expired:
                 # delete attached media
-                for media in post.mediafile_set.all():
-                    if media.file:
-                        media.file.delete(save=False)  # delete from storage
+                # (storage is cleaned up by MediaFile's post_delete: files can be shared)
+                for media in post.media_files.all():
                     media.delete()
 
                 post.status = "expired"
@@ -39,9 +38,7 @@ class Command(BaseCommand):
         with transaction.atomic():
             for post in posts_expired:
                 # delete attached media
-                for media in post.mediafile_set.all():
-                    if media.file:
-                        media.file.delete(save=False)
+                for media in post.media_files.all():
                     media.delete()
 
                 post.status = "expired"
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from media_app.models import MediaFile
+from media_app.variants import generate_variants
+
+
+class Command(BaseCommand):
+    help = "Generate WebP/JPEG thumbnail variants for MediaFile images (backfill or rebuild)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Rebuild images that already have variants too")
+        parser.add_argument("--workers", type=int, default=4, help="Images processed in parallel")
+
+    def handle(self, *args, **options):
+        images = MediaFile.objects.filter(file_type="image")
+        if not options["all"]:
+            images = images.filter(variants={})
+        ids = list(images.order_by("pk").values_list("pk", flat=True))
+        self.stdout.write(f"🖼️  Building variants for {len(ids)} images...")
+
+        def build(pk):
+            close_old_connections()
+            try:
+                media = MediaFile.objects.filter(pk=pk).first()
+                return bool(media and generate_variants(media, reuse=not options["all"]))
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as pool:
+            done = sum(pool.map(build, ids))
+
+        self.stdout.write(self.style.SUCCESS(f"🎉 Done! {done} images processed, {len(ids) - done} skipped"))
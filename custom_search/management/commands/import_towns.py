@@ -0,0 +1,34 @@
+import csv
+import time
+from django.core.management.base import BaseCommand, CommandError
+from custom_search.loaders import iter_json_array
+from custom_search.towns import ingest_towns
+
+
+class Command(BaseCommand):
+    help = "Bulk-create towns from a CSV or JSON file (state_id, name, optional type)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="a .csv with a header row, or a .json array of objects")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path.lower().endswith((".csv", ".json")):
+            raise CommandError("Expected a .csv or .json file")
+
+        started = time.monotonic()
+        try:
+            if path.lower().endswith(".json"):
+                result = ingest_towns(iter_json_array(path), batch_size=options["batch_size"])
+            else:
+                with open(path, newline="", encoding="utf-8") as f:
+                    result = ingest_towns(csv.DictReader(f), batch_size=options["batch_size"])
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not import {path}: {e}")
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🏘 Done! Towns created: {result.created}, already existed: {result.existing}, "
+            f"skipped (no name / unknown state): {result.skipped} in {elapsed:.2f}s"
+        ))
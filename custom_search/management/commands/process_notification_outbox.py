@@ -0,0 +1,29 @@
+import time
+from django.core.management.base import BaseCommand
+from notifications.outbox import process_outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver queued notifications from the notification outbox (run continuously or once from cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain what is due and exit")
+        parser.add_argument("--limit", type=int, default=100, help="Entries claimed per pass")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Notifications written per transaction")
+        parser.add_argument("--sleep", type=float, default=2.0, help="Seconds to wait when the outbox is empty")
+
+    def handle(self, *args, **options):
+        while True:
+            stats = process_outbox(limit=options["limit"], batch_size=options["batch_size"])
+            worked = sum(stats.values())
+            if worked:
+                self.stdout.write(
+                    f"📬 Outbox: {stats['done']} delivered, {stats['retry']} to retry, {stats['failed']} failed"
+                )
+
+            if options["once"]:
+                if worked < options["limit"]:
+                    break
+                continue
+            if not worked:
+                time.sleep(options["sleep"])
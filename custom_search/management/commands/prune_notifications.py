@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from notifications.retention import prune_notifications, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = "Delete (optionally archive) read notifications older than the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Keep read notifications this many days (default: NOTIFICATION_RETENTION_DAYS)")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Primary-key range handled per transaction")
+        parser.add_argument("--archive", action="store_true", help="Roll pruned rows into per-user monthly NotificationArchive totals")
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between chunks")
+        parser.add_argument("--dry-run", action="store_true", help="Only count what would be deleted")
+
+    def handle(self, *args, **options):
+        cutoff = retention_cutoff(options["days"])
+        self.stdout.write(f"🧹 Pruning read notifications created before {cutoff:%Y-%m-%d %H:%M}")
+
+        def progress(result):
+            self.stdout.write(f"   … {result.deleted} deleted ({result.rows_per_second:.0f} rows/s)")
+
+        result = prune_notifications(
+            days=options["days"],
+            chunk_size=options["chunk_size"],
+            archive=options["archive"],
+            dry_run=options["dry_run"],
+            pause=options["sleep"],
+            on_chunk=progress,
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run: {result.deleted} notifications would be deleted"))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"\n🎉 Done! Deleted: {result.deleted}, Archive rows: {result.archived}, "
+            f"Chunks: {result.chunks} in {result.seconds:.2f}s ({result.rows_per_second:.0f} rows/s)"
+        ))
@@ -0,0 +1,21 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from media_app.blobs import prune_orphan_blob_files
+
+
+class Command(BaseCommand):
+    help = "Delete stored media files that no MediaBlob row refers to (left by rolled-back uploads)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours", type=int, default=1,
+            help="Only files older than this many hours are removed (default: 1)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only list the orphaned files")
+
+    def handle(self, *args, **options):
+        removed = prune_orphan_blob_files(timedelta(hours=options["hours"]), dry_run=options["dry_run"])
+        for name in removed:
+            self.stdout.write(f"🗑️  {name}")
+        verb = "would be removed" if options["dry_run"] else "removed"
+        self.stdout.write(self.style.SUCCESS(f"🎉 Done! {len(removed)} orphaned file(s) {verb}"))
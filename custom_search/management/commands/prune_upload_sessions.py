@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from media_app.uploads import prune_upload_sessions
+
+
+class Command(BaseCommand):
+    help = "Delete abandoned chunked-upload sessions and their partial files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours", type=int, default=None,
+            help="Sessions untouched this long are removed (default: settings.MEDIA_UPLOAD_SESSION_HOURS)",
+        )
+
+    def handle(self, *args, **options):
+        removed = prune_upload_sessions(options["hours"])
+        self.stdout.write(self.style.SUCCESS(f"🎉 Done! {removed} stale upload session(s) removed"))
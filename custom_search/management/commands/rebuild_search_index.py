@@ -0,0 +1,20 @@
+import time
+from django.core.management.base import BaseCommand
+from posts.models import Post
+from postfinder.indexing import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the postfinder keyword index (PostSearchToken) for all posts"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        processed = rebuild_index(Post.objects.all(), batch_size=options["batch_size"])
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Indexed {processed} post(s) in {elapsed:.1f}s."
+        ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from notifications.coalesce import send_digests
+
+
+class Command(BaseCommand):
+    help = "Send the daily notification digest to users who chose digest mode (run once a day from cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Recipients written per transaction")
+
+    def handle(self, *args, **options):
+        sent = send_digests(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"📰 Sent {sent} notification digests"))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_search', '0002_alter_town_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TownIdSequence',
+            fields=[
+                ('name', models.CharField(default='town', max_length=20, primary_key=True, serialize=False)),
+                ('next_id', models.BigIntegerField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_search', '0003_town_id_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='town',
+            name='name_key',
+            field=models.CharField(default='', editable=False, max_length=150),
+        ),
+    ]
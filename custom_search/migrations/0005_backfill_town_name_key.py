@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+def town_name_key(name):
+    return " ".join((name or "").split()).casefold()
+
+
+def backfill_town_name_keys(apps, schema_editor):
+    """
+    Fill name_key for existing towns. Duplicates already in a state keep their
+    rows (posts point at them) but only the lowest id gets the plain key; the
+    others get "<key>#<id>" so the unique constraint can be added.
+    """
+    Town = apps.get_model("custom_search", "Town")
+    seen = set()
+    batch = []
+    for town in Town.objects.order_by("id").only("id", "name", "state_id").iterator(chunk_size=2000):
+        key = town_name_key(town.name)
+        if (town.state_id, key) in seen:
+            key = f"{key}#{town.pk}"
+        seen.add((town.state_id, key))
+        town.name_key = key[:150]
+        batch.append(town)
+        if len(batch) >= 2000:
+            Town.objects.bulk_update(batch, ["name_key"])
+            batch = []
+    Town.objects.bulk_update(batch, ["name_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_search', '0004_town_name_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_town_name_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_search', '0005_backfill_town_name_key'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='town',
+            constraint=models.UniqueConstraint(fields=('state', 'name_key'), name='town_state_name_key_uniq'),
+        ),
+    ]
@@ -46,6 +46,11 @@ class State(models.Model):
         return self.name
 
 
+def town_name_key(name):
+    """'  Port   HARCOURT ' → 'port harcourt': the per-state uniqueness key of a town name."""
+    return " ".join((name or "").split()).casefold()
+
+
 class Town(models.Model):
     id = models.IntegerField(primary_key=True)  # manually assigned
     code = models.CharField(max_length=5, db_index=True, default="TEMP")
@@ -57,9 +62,32 @@ class Town(models.Model):
         default="town",
         db_index=True
     )
+    # town_name_key(name), kept in step by save(); unique per state so two
+    # concurrent approvals of the same typed town can't create it twice
+    name_key = models.CharField(max_length=150, editable=False, default="")
 
     class Meta:
         ordering = ['name']
+        constraints = [
+            models.UniqueConstraint(fields=["state", "name_key"], name="town_state_name_key_uniq"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.type})"
+
+    def save(self, *args, **kwargs):
+        self.name_key = town_name_key(self.name)
+        super().save(*args, **kwargs)
+
+
+class TownIdSequence(models.Model):
+    """
+    Single-row counter for new Town ids (Town.id is assigned manually).
+    custom_search.towns.allocate_town_ids() hands out whole blocks from it, so
+    concurrent approvals/imports never compute the same "max id + 1".
+    """
+    name = models.CharField(max_length=20, primary_key=True, default="town")
+    next_id = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.name}: next id {self.next_id}"
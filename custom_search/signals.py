@@ -0,0 +1,20 @@
+# custom_search/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import gazetteer
+from .models import Continent, Country, State, Town
+
+
+# 🗺️ Any location change → every process reloads its in-memory gazetteer
+@receiver(post_save, sender=Continent)
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=State)
+@receiver(post_save, sender=Town)
+@receiver(post_delete, sender=Continent)
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=State)
+@receiver(post_delete, sender=Town)
+def refresh_gazetteer(sender, **kwargs):
+    transaction.on_commit(gazetteer.invalidate)
@@ -0,0 +1,169 @@
+# custom_search/towns.py
+"""
+Town ingestion: bulk creation of towns from a file or from a batch of
+pending location requests.
+
+- Ids come from TownIdSequence in blocks (one row update per batch), never
+  from "highest id + 1", so concurrent moderators can't collide.
+- Towns are de-duplicated on (state, Town.name_key) against each other and
+  against the existing towns with those names. The unique constraint on
+  (state, name_key) settles races: inserts use ignore_conflicts and the rows
+  that actually exist are read back, so two concurrent approvals of the same
+  typed town end up pointing at one Town.
+- Work is done batch_size keys at a time (one lookup, one bulk_create, one
+  read-back each); bulk_create skips signals, so the gazetteer is refreshed on
+  commit.
+"""
+from dataclasses import dataclass, field
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Max
+
+from . import gazetteer
+from .models import State, Town, TownIdSequence, town_name_key
+
+SEQUENCE_NAME = "town"
+
+
+def normalize_town_name(name):
+    """'  port   harcourt ' → 'Port Harcourt' (the form towns are stored in)."""
+    return " ".join((name or "").split()).title()
+
+
+def town_key(state_id, name):
+    return (int(state_id), town_name_key(name))
+
+
+def allocate_town_ids(count):
+    """
+    Reserve `count` consecutive Town ids and return them as a range.
+    The sequence row is bumped with a single UPDATE, which row-locks it until
+    the surrounding transaction ends.
+    """
+    if count <= 0:
+        return range(0)
+    with transaction.atomic():
+        updated = TownIdSequence.objects.filter(name=SEQUENCE_NAME).update(
+            next_id=F("next_id") + count
+        )
+        if not updated:
+            _create_sequence()
+            TownIdSequence.objects.filter(name=SEQUENCE_NAME).update(next_id=F("next_id") + count)
+        end = TownIdSequence.objects.values_list("next_id", flat=True).get(name=SEQUENCE_NAME)
+    return range(end - count, end)
+
+
+def _create_sequence():
+    """First use: start after the highest existing town id."""
+    start = (Town.objects.aggregate(top=Max("id"))["top"] or 0) + 1
+    try:
+        with transaction.atomic():
+            TownIdSequence.objects.create(name=SEQUENCE_NAME, next_id=start)
+    except IntegrityError:
+        pass  # another process created it first
+
+
+@dataclass
+class IngestResult:
+    towns: dict = field(default_factory=dict)  # town_key → Town
+    created: int = 0
+    existing: int = 0
+    skipped: int = 0
+
+    def town_for(self, state_id, name):
+        return self.towns.get(town_key(state_id, name))
+
+
+def ingest_towns(entries, batch_size=1000):
+    """
+    Create the missing towns for entries: an iterable of dicts with
+    "state_id", "name" and optionally "type". Entries with no name or an
+    unknown state are skipped. Returns an IngestResult whose .towns maps every
+    (state, name) key to its Town, new or existing.
+    """
+    result = IngestResult()
+    wanted = {}
+    for entry in entries:
+        name = normalize_town_name(entry.get("name"))
+        try:
+            key = town_key(entry.get("state_id"), name)
+        except (TypeError, ValueError):
+            key = None
+        if not name or key is None:
+            result.skipped += 1
+            continue
+        wanted.setdefault(key, (name, entry.get("type") or "town"))
+
+    state_ids = {state_id for state_id, _ in wanted}
+    known_states = set(State.objects.filter(id__in=state_ids).values_list("id", flat=True))
+    keys = []
+    for key in wanted:
+        if key[0] in known_states:
+            keys.append(key)
+        else:
+            result.skipped += 1
+
+    with transaction.atomic():
+        for start in range(0, len(keys), batch_size):
+            result.created += _ingest_batch(keys[start:start + batch_size], wanted, result)
+        result.existing = len(result.towns) - result.created
+        if result.created:
+            transaction.on_commit(gazetteer.invalidate)
+
+    return result
+
+
+def _towns_for(keys):
+    """{town_key: Town} for the existing towns among keys (only those names are read)."""
+    found = {}
+    rows = Town.objects.filter(
+        state_id__in={state_id for state_id, _ in keys},
+        name_key__in={name_key for _, name_key in keys},
+    )
+    for town in rows:
+        key = (town.state_id, town.name_key)
+        if key in keys:
+            found[key] = town
+    return found
+
+
+def _ingest_batch(keys, wanted, result):
+    """Look up, insert and read back one batch of keys. Returns how many towns this call created."""
+    keys = set(keys)
+    found = _towns_for(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        new_towns = []
+        for pk, key in zip(allocate_town_ids(len(missing)), missing):
+            name, town_type = wanted[key]
+            new_towns.append(Town(
+                id=pk, code=f"{name[:2].lower()}{pk}", name=name, name_key=key[1], state_id=key[0], type=town_type,
+            ))
+        # a concurrent ingest may have created some of them since the lookup
+        Town.objects.bulk_create(new_towns, ignore_conflicts=True)
+        found = _towns_for(keys)
+        created = sum(1 for town in new_towns if found[(town.state_id, town.name_key)].pk == town.pk)
+    else:
+        created = 0
+    result.towns.update(found)
+    return created
+
+
+def ingest_pending_requests(pending_requests):
+    """
+    Towns for a batch of PendingLocationRequest rows (posts, seekers or person).
+    Returns (IngestResult, {pending.pk: Town}); requests without a typed town
+    or parent state are left out of the mapping.
+    """
+    pending_requests = list(pending_requests)
+    result = ingest_towns(
+        {"state_id": pending.parent_state_id, "name": pending.typed_town}
+        for pending in pending_requests
+    )
+    towns = {}
+    for pending in pending_requests:
+        if pending.typed_town and pending.parent_state_id is not None:
+            town = result.town_for(pending.parent_state_id, pending.typed_town)
+            if town is not None:
+                towns[pending.pk] = town
+    return result, towns
@@ -9,6 +9,7 @@ from .models import Continent, Country, State, Town
 from person.models import Person
 from posts.models import Post
 from .forms import CustomSearchForm
+from .gazetteer import get_gazetteer
 
 from django.http import JsonResponse
 
@@ -91,17 +92,18 @@ def approve_location_single(request, person_id, location_type):
 
     return HttpResponseRedirect(reverse('approve_locations'))
 
+# 🗺️ Dropdown APIs: children of the selected parent, straight from the in-memory gazetteer
 def countries_by_continent(request):
     continent_id = request.GET.get("continent") or request.GET.get("continent_id")
-    countries = Country.objects.filter(continent_id=continent_id).values("id", "name") if continent_id else []
-    return JsonResponse(list(countries), safe=False)
+    countries = get_gazetteer().children("country", continent_id) if continent_id else []
+    return JsonResponse([{"id": c.id, "name": c.name} for c in countries], safe=False)
 
 def states_by_country(request):
     country_id = request.GET.get("country") or request.GET.get("country_id")
-    states = State.objects.filter(country_id=country_id).values("id", "name") if country_id else []
-    return JsonResponse(list(states), safe=False)
+    states = get_gazetteer().children("state", country_id) if country_id else []
+    return JsonResponse([{"id": s.id, "name": s.name} for s in states], safe=False)
 
 def towns_by_state(request):
     state_id = request.GET.get("state") or request.GET.get("state_id")
-    towns = Town.objects.filter(state_id=state_id).values("id", "name") if state_id else []
-    return JsonResponse(list(towns), safe=False)
+    towns = get_gazetteer().children("town", state_id) if state_id else []
+    return JsonResponse([{"id": t.id, "name": t.name} for t in towns], safe=False)
@@ -69,6 +69,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'notifications.context_processors.unread_notifications',
             ],
         },
     },
@@ -84,6 +85,45 @@ DATABASES = {
     }
 }
 
+# 🔎 Full-text search backend: "sqlite_fts", "postgres" or "keyword".
+# Leave unset to pick from the database engine (see search/backends.py).
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND') or None
+
+# 🗄️ Cache (home feed pages: posts/feed_cache.py). LocMem is per-process, so
+# with several workers set REDIS_URL to share it (needs the `redis` package).
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+FEED_CACHE_TIMEOUT = 300  # seconds; upper bound on how stale a missed invalidation can be
+BOARD_WIDGET_CACHE_TIMEOUT = 600  # seconds; the "Recent" board widget (board/widget_cache.py)
+GAZETTEER_MAX_AGE = 300  # seconds; each process reloads its location tree at least this often
+
+# Live notification stream: "memory" (single process) or "cache" (shared cache as broker)
+NOTIFICATION_BROKER = os.getenv('NOTIFICATION_BROKER', 'memory')
+
+# The stream (/notifications/stream/) needs an ASGI server, e.g.
+#   uvicorn django_project.asgi:application
+# Leave it off for WSGI deployments: browsers then poll /notifications/unread-count/.
+NOTIFICATION_STREAM = os.getenv('NOTIFICATION_STREAM') == '1'
+NOTIFICATION_STREAM_MAX_SECONDS = 300  # each stream closes after this; the browser reconnects
+
+# Follower notifications with the same event and actor inside this many seconds
+# merge into one row (notifications/coalesce.py); 0 turns coalescing off
+NOTIFICATION_COALESCE_WINDOW = int(os.getenv('NOTIFICATION_COALESCE_WINDOW', 3600))
+
+# prune_notifications deletes read notifications older than this many days
+NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', 90))
+
 # Custom user model
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
@@ -107,6 +147,18 @@ STATICFILES_DIRS = [BASE_DIR / "static"]  # Optional global static dir
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Resized WebP/JPEG copies of uploaded images (media_app/variants.py)
+MEDIA_VARIANT_WIDTHS = (320, 640, 1080)
+MEDIA_VARIANT_WORKERS = int(os.getenv('MEDIA_VARIANT_WORKERS', 2))  # background threads per process
+MEDIA_VALIDATION_WORKERS = int(os.getenv('MEDIA_VALIDATION_WORKERS', 4))  # parallel upload checks (and pooled clamd sessions)
+CLAMD_HOST = os.getenv('CLAMD_HOST', '127.0.0.1')
+CLAMD_PORT = int(os.getenv('CLAMD_PORT', 3310))
+
+# Resumable chunked uploads (media_app/uploads.py)
+MEDIA_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024  # largest chunk accepted per request
+MEDIA_UPLOAD_TEMP_DIR = os.getenv('MEDIA_UPLOAD_TEMP_DIR', str(BASE_DIR / 'tmp_uploads'))
+MEDIA_UPLOAD_SESSION_HOURS = 24  # prune_upload_sessions removes sessions idle longer
+
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
 # Authentication redirects
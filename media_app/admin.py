@@ -3,7 +3,7 @@ from django.contrib import admin, messages
 from django.utils.html import format_html
 from django.urls import reverse
 
-from .models import MediaFile
+from .models import MediaBlob, MediaFile, UploadSession
 
 
 @admin.register(MediaFile)
@@ -25,7 +25,7 @@ class MediaFileAdmin(admin.ModelAdmin):
         "owner__username",
         "owner__email",
     )
-    readonly_fields = ("uploaded_at", "file_preview")
+    readonly_fields = ("uploaded_at", "file_preview", "blob")
     actions = ["make_public", "make_private"]
 
     def get_owner_display(self, obj):
@@ -92,3 +92,19 @@ class MediaFileAdmin(admin.ModelAdmin):
             f"🔒 {updated} media file(s) marked as Private.",
             level=messages.WARNING,
         )
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    """Content-addressed files (read-only: ref_count is maintained by media_app/blobs.py)."""
+    list_display = ("id", "sha256", "size", "ref_count", "created_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("sha256", "file", "size", "ref_count", "created_at")
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = ("id", "filename", "owner", "file_type", "offset", "size", "status", "updated_at")
+    list_filter = ("status", "file_type")
+    search_fields = ("filename", "owner__username")
+    readonly_fields = ("offset", "receiving_until", "media", "created_at", "updated_at")
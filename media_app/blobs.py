@@ -0,0 +1,176 @@
+# media_app/blobs.py
+"""
+Content-addressed storage for uploads.
+
+Every new MediaFile goes through store_upload() (called from MediaFile.save):
+the upload is streamed chunk by chunk into a temporary file while it is hashed,
+and the sha256 decides where it lives:
+
+- a MediaBlob with that hash already exists → its ref_count goes up and the
+  temporary copy is thrown away (nothing new on disk);
+- otherwise the temporary file is moved to blobs/<ab>/<cd>/<sha256><ext> and a
+  MediaBlob row with ref_count=1 is created.
+
+MediaFile.file then simply names the blob's file, so URLs, templates and image
+variants (which are built beside it and shared too) work unchanged.
+release_blob() is the other half: deleting a MediaFile drops one reference and
+the last one removes the blob row and its files once the transaction commits.
+
+A new blob's file is written before its row commits. When the save that
+created it fails, MediaFile.save deletes the file straight away
+(discard_new_blob); when a caller's own transaction rolls back later,
+nothing tells us, so prune_orphan_blob_files() (the prune_orphan_blobs
+command) sweeps files that no MediaBlob row names.
+"""
+import hashlib
+import logging
+import os
+from datetime import timedelta
+
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import MediaBlob
+
+logger = logging.getLogger(__name__)
+
+
+def _claim(sha256):
+    """Add a reference to an existing blob; None when there is no blob with that hash."""
+    if MediaBlob.objects.filter(sha256=sha256).update(ref_count=F("ref_count") + 1):
+        return MediaBlob.objects.get(sha256=sha256)
+    return None
+
+
+def store_upload(upload):
+    """
+    Hash and store an uploaded file (any django File). Returns the MediaBlob
+    now holding one more reference for the caller.
+    """
+    filename = os.path.basename(upload.name or "upload")
+    content_type = getattr(upload, "content_type", None) or "application/octet-stream"
+    digest = hashlib.sha256()
+    size = 0
+
+    temp = TemporaryUploadedFile(filename, content_type, 0, None)
+    try:
+        if hasattr(upload, "seek"):
+            upload.seek(0)  # validation (magic/PIL) may have read part of it already
+        for chunk in upload.chunks():
+            digest.update(chunk)
+            temp.write(chunk)
+            size += len(chunk)
+        temp.flush()
+        temp.size = size
+        sha256 = digest.hexdigest()
+
+        blob = _claim(sha256)
+        if blob is not None:
+            return blob
+
+        blob = MediaBlob(sha256=sha256, size=size, ref_count=1)
+        blob.file.save(filename, temp, save=False)  # moves the temporary file into place
+        try:
+            with transaction.atomic():
+                blob.save()
+            return blob
+        except IntegrityError:
+            # the same bytes were stored concurrently: keep theirs, drop ours
+            blob.file.storage.delete(blob.file.name)
+            return _claim(sha256)
+        except Exception:
+            blob.file.storage.delete(blob.file.name)
+            raise
+    finally:
+        temp.close()  # deletes the temporary file unless it was moved
+
+
+def discard_new_blob(blob):
+    """
+    Delete the file of a blob whose creating transaction rolled back. Only a
+    blob store_upload() just created (ref_count 1) has a file of its own;
+    a claimed blob's file belongs to the rows already pointing at it.
+    """
+    if blob.ref_count != 1:
+        return
+    try:
+        blob.file.storage.delete(blob.file.name)
+    except OSError as e:
+        logger.warning("Could not delete blob file %s: %s", blob.file.name, e)
+
+
+def _delete_blob_files(storage, name):
+    """Remove a blob's file and every variant built beside it ("<sha>__w640.webp"...)."""
+    folder, basename = os.path.split(name)
+    stem = os.path.splitext(basename)[0]
+    try:
+        _, files = storage.listdir(folder)
+    except (FileNotFoundError, NotImplementedError):
+        files = [basename]
+    for filename in files:
+        if filename == basename or filename.startswith(f"{stem}__w"):
+            try:
+                storage.delete(os.path.join(folder, filename))
+            except OSError as e:
+                logger.warning("Could not delete blob file %s: %s", filename, e)
+
+
+def _is_blob_file(filename, stored):
+    """The blob's own file, or a variant built beside it ("<stem>__w640.webp")."""
+    stem = filename.split("__w", 1)[0]
+    return filename in stored or any(os.path.splitext(name)[0] == stem for name in stored)
+
+
+def prune_orphan_blob_files(min_age=timedelta(hours=1), dry_run=False):
+    """
+    Delete files under blobs/ that no MediaBlob row names (left behind when
+    the transaction that stored them rolled back). Files younger than
+    min_age are skipped: their row may simply not be committed yet.
+    Returns the names removed (or that would be, with dry_run).
+    """
+    storage = MediaBlob._meta.get_field("file").storage
+    cutoff = timezone.now() - min_age
+    removed = []
+    try:
+        first_levels, _ = storage.listdir("blobs")
+    except (FileNotFoundError, NotImplementedError):
+        return removed
+    for first in first_levels:
+        for second in storage.listdir(os.path.join("blobs", first))[0]:
+            folder = os.path.join("blobs", first, second)
+            filenames = storage.listdir(folder)[1]
+            if not filenames:
+                continue
+            stored = {
+                os.path.basename(name)
+                for name in MediaBlob.objects.filter(sha256__startswith=first + second)
+                .values_list("file", flat=True)
+            }
+            for filename in filenames:
+                name = os.path.join(folder, filename)
+                if _is_blob_file(filename, stored) or storage.get_modified_time(name) > cutoff:
+                    continue
+                if not dry_run:
+                    storage.delete(name)
+                removed.append(name)
+    return removed
+
+
+def release_blob(blob_id):
+    """
+    Drop one reference to a blob. The last reference deletes the row and, after
+    commit, the files. Returns True when the blob was removed.
+    """
+    with transaction.atomic():
+        blob = MediaBlob.objects.select_for_update().filter(pk=blob_id).first()
+        if blob is None:
+            return False
+        if blob.ref_count > 1:
+            MediaBlob.objects.filter(pk=blob_id).update(ref_count=F("ref_count") - 1)
+            return False
+        storage, name = blob.file.storage, blob.file.name
+        blob.delete()
+        transaction.on_commit(lambda: _delete_blob_files(storage, name))
+    return True
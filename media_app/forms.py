@@ -5,15 +5,10 @@ import logging
 from django import forms
 from django.core.exceptions import ValidationError
 from .models import MediaFile
+from .validation import scan_file
 from PIL import Image, UnidentifiedImageError
 import magic  # pip install python-magic-bin (Windows) or python-magic (Linux)
 
-try:
-    import clamd  # optional, only works if ClamAV daemon is running
-    CLAMD_AVAILABLE = True
-except ImportError:
-    CLAMD_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
 
@@ -61,18 +56,8 @@ class MediaFileForm(forms.ModelForm):
         if ext not in valid_exts:
             raise ValidationError("File extension does not match required type.")
 
-        # ✅ Step 4: Antivirus scan (optional, safe fallback)
-        if CLAMD_AVAILABLE:
-            try:
-                cd = clamd.ClamdNetworkSocket(host="127.0.0.1", port=3310)
-                result = cd.instream(uploaded_file)
-                uploaded_file.seek(0)
-                if result and "FOUND" in result.get("stream", [""])[1]:
-                    raise ValidationError("Malware detected in uploaded file.")
-            except Exception as e:
-                logger.warning("ClamAV not running or unreachable: %s", e)
-        else:
-            logger.info("ClamAV not installed — skipping virus scan.")
+        # ✅ Step 4: Antivirus scan (pooled clamd session; skipped if ClamAV is down)
+        scan_file(uploaded_file)
 
         # ✅ Step 5: Extra image checks
         if file_type == "image":
@@ -1,6 +1,7 @@
 # media_app/models.py
 import os
-from django.db import models
+import uuid
+from django.db import models, transaction
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -17,6 +18,8 @@ def media_upload_path(instance, filename):
         posts/videos/user_7/clip.mp4
         person/images/user_3/avatar.jpg
     Ensures per-app, per-user organization with safe fallback.
+    New uploads are content-addressed instead (MediaBlob / media_app/blobs.py);
+    this path is kept for files stored before that.
     """
     folder = "videos" if instance.file_type == "video" else "images"
 
@@ -30,6 +33,31 @@ def media_upload_path(instance, filename):
     return os.path.join(app_label, folder, f"user_{owner_id}", filename)
 
 
+def blob_upload_path(instance, filename):
+    """
+    Content-addressed location, fanned out over two directory levels:
+        blobs/<ab>/<cd>/<sha256><ext>
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    sha = instance.sha256
+    return os.path.join("blobs", sha[:2], sha[2:4], f"{sha}{extension}")
+
+
+class MediaBlob(models.Model):
+    """
+    One stored file, shared by every MediaFile whose upload had the same bytes.
+    ref_count is the number of MediaFile rows pointing here (media_app/blobs.py).
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to=blob_upload_path, max_length=255)
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes, {self.ref_count} refs)"
+
+
 class MediaFile(models.Model):
     # Who uploaded the file (optional, for better organization)
     owner = models.ForeignKey(
@@ -53,9 +81,123 @@ class MediaFile(models.Model):
     is_public = models.BooleanField(default=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    # Resized copies of images (media_app/variants.py), stored beside the original:
+    # {"webp": {"320": "<storage name>", ...}, "jpeg": {...}}; empty until generated
+    variants = models.JSONField(default=dict, blank=True)
+
+    # Shared content-addressed copy of `file` (null for files stored before de-duplication)
+    blob = models.ForeignKey(
+        MediaBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="media_files",
+    )
+
     class Meta:
         ordering = ["-uploaded_at"]
 
     def __str__(self):
         owner = getattr(self.owner, "username", "anonymous")
         return f"{self.file.name} ({self.file_type}) by {owner}"
+
+    def save(self, *args, **kwargs):
+        # A fresh upload is stored once per distinct content: point `file` at the shared blob
+        if self.blob_id is None and self.file and not self.file._committed:
+            from .blobs import discard_new_blob, store_upload
+
+            try:
+                with transaction.atomic():
+                    self.blob = store_upload(self.file)
+                    self.file.name = self.blob.file.name
+                    self.file._committed = True
+                    super().save(*args, **kwargs)
+            except Exception:
+                if self.blob_id is not None:
+                    discard_new_blob(self.blob)  # its row was rolled back with ours
+                    self.blob = None
+                raise
+            return
+        super().save(*args, **kwargs)
+
+    # ---- responsive images (for <picture>/srcset in templates) ----
+    def _variant_urls(self, fmt):
+        """[(width, url)] for one format, narrowest first."""
+        names = (self.variants or {}).get(fmt) or {}
+        storage = self.file.storage
+        return [(int(width), storage.url(name)) for width, name in sorted(names.items(), key=lambda i: int(i[0]))]
+
+    @property
+    def has_variants(self):
+        return bool(self.variants)
+
+    @property
+    def webp_srcset(self):
+        return ", ".join(f"{url} {width}w" for width, url in self._variant_urls("webp"))
+
+    @property
+    def jpeg_srcset(self):
+        return ", ".join(f"{url} {width}w" for width, url in self._variant_urls("jpeg"))
+
+    @property
+    def display_url(self):
+        """Widest JPEG variant (fallback src), or the original until variants exist."""
+        urls = self._variant_urls("jpeg")
+        return urls[-1][1] if urls else self.file.url
+
+    @property
+    def thumb_url(self):
+        """Small (320px) JPEG for thumbnails/grids."""
+        return self.thumbnail_url(320)
+
+    def thumbnail_url(self, width=320):
+        """Smallest JPEG variant at least `width` wide (else the widest), or the original."""
+        urls = self._variant_urls("jpeg")
+        for variant_width, url in urls:
+            if variant_width >= width:
+                return url
+        return urls[-1][1] if urls else self.file.url
+
+
+class UploadSession(models.Model):
+    """
+    A resumable, chunked upload (media_app/uploads.py). Chunks are appended to
+    a part file at `offset`; when offset reaches size the file is validated and
+    becomes a MediaFile attached to content_object.
+    """
+    UPLOADING = "uploading"
+    COMPLETE = "complete"
+    FAILED = "failed"
+    STATUS_CHOICES = (
+        (UPLOADING, "Uploading"),
+        (COMPLETE, "Complete"),
+        (FAILED, "Failed"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="upload_sessions")
+
+    # where the finished MediaFile gets attached
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey("content_type", "object_id")
+
+    filename = models.CharField(max_length=255)
+    file_type = models.CharField(max_length=10, choices=MediaFile.FILE_CHOICES)
+    caption = models.CharField(max_length=255, blank=True, null=True)
+    size = models.PositiveBigIntegerField()
+    offset = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=UPLOADING)
+    error = models.CharField(max_length=255, blank=True)
+    # a chunk is being written until then (guards against two concurrent writers)
+    receiving_until = models.DateTimeField(null=True, blank=True)
+    media = models.ForeignKey(MediaFile, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "updated_at"], name="upload_session_stale_idx")]
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size}) {self.status}"
@@ -0,0 +1,194 @@
+# media_app/probe.py
+"""
+Header-only container probing: a video's duration without decoding it.
+
+MP4 / QuickTime (.mp4, .m4v, .mov): walk the top-level boxes to 'moov' and read
+the timescale/duration pair from its 'mvhd' box (or 'mvex/mehd' for fragmented
+files). Boxes in between, including a multi-gigabyte 'mdat', are skipped with a
+seek, so it does not matter whether 'moov' comes first or last.
+
+WebM / Matroska: read EBML element headers down to Segment → Info and take
+Duration × TimecodeScale.
+
+Only a few hundred bytes are read either way. Temporary uploads on disk are
+memory-mapped; in-memory uploads are read in place. Anything unrecognised
+returns None, like a failed probe.
+"""
+import logging
+import mmap
+import os
+import struct
+
+logger = logging.getLogger(__name__)
+
+MP4_TOP_LEVEL = {b"ftyp", b"moov", b"mdat", b"free", b"skip", b"wide", b"pnot", b"uuid"}
+EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+
+# Matroska element ids
+SEGMENT = 0x18538067
+INFO = 0x1549A966
+CLUSTER = 0x1F43B675
+TIMECODE_SCALE = 0x2AD7B1
+DURATION = 0x4489
+UNKNOWN_SIZE = -1
+
+MAX_BOXES = 1000  # a corrupt file must not keep us walking forever
+
+
+class ProbeError(ValueError):
+    """The container header is truncated or malformed."""
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ProbeError("unexpected end of file")
+    return data
+
+
+# ---------------------------------------------------------------- MP4 ----
+
+def _boxes(f, start, end):
+    """Yield (type, payload offset, payload end) for the boxes in [start, end)."""
+    offset = start
+    for _ in range(MAX_BOXES):
+        if end - offset < 8:
+            return
+        f.seek(offset)
+        size, box_type = struct.unpack(">I4s", _read_exact(f, 8))
+        header = 8
+        if size == 1:  # 64-bit largesize follows
+            size = struct.unpack(">Q", _read_exact(f, 8))[0]
+            header = 16
+        elif size == 0:  # box runs to the end of the file
+            size = end - offset
+        if size < header:
+            raise ProbeError(f"bad box size for {box_type!r}")
+        yield box_type, offset + header, min(offset + size, end)
+        offset += size
+
+
+def _full_box_value(f, offset, v0_layout, v1_layout):
+    """Unpack a 'full box' payload: 1 byte version, 3 bytes flags, then the versioned layout."""
+    f.seek(offset)
+    version = _read_exact(f, 4)[0]
+    layout = v1_layout if version == 1 else v0_layout
+    return struct.unpack(layout, _read_exact(f, struct.calcsize(layout)))
+
+
+def mp4_duration(f, length):
+    for box_type, start, end in _boxes(f, 0, length):
+        if box_type != b"moov":
+            continue
+        timescale = duration = fragment_duration = None
+        for child, child_start, child_end in _boxes(f, start, end):
+            if child == b"mvhd":
+                # creation/modification times, timescale, duration
+                *_, timescale, duration = _full_box_value(f, child_start, ">IIII", ">QQIQ")
+            elif child == b"mvex":
+                for grandchild, gc_start, _ in _boxes(f, child_start, child_end):
+                    if grandchild == b"mehd":
+                        (fragment_duration,) = _full_box_value(f, gc_start, ">I", ">Q")
+        if not timescale:
+            return None
+        if duration in (0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):  # fragmented / unknown
+            duration = fragment_duration
+        return duration / timescale if duration else None
+    return None
+
+
+# ----------------------------------------------------------- Matroska ----
+
+def _vint(f, keep_marker):
+    """EBML variable-length integer (element ids keep their length marker, sizes do not)."""
+    first = _read_exact(f, 1)[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        length += 1
+        mask >>= 1
+    if length > 8:
+        raise ProbeError("bad EBML varint")
+    value = first if keep_marker else first & (mask - 1)
+    all_ones = value == mask - 1
+    for byte in _read_exact(f, length - 1):
+        value = (value << 8) | byte
+        all_ones = all_ones and byte == 0xFF
+    if not keep_marker and all_ones:
+        return UNKNOWN_SIZE
+    return value
+
+
+def _elements(f, start, end):
+    """Yield (id, data offset, data size) for the EBML elements in [start, end)."""
+    offset = start
+    for _ in range(MAX_BOXES):
+        if offset >= end:
+            return
+        f.seek(offset)
+        element_id = _vint(f, keep_marker=True)
+        size = _vint(f, keep_marker=False)
+        data_start = f.tell()
+        yield element_id, data_start, size
+        if size == UNKNOWN_SIZE:
+            return  # only Segment/Cluster use it; nothing after can be located
+        offset = data_start + size
+
+
+def matroska_duration(f, length):
+    for element_id, start, size in _elements(f, 0, length):
+        if element_id != SEGMENT:
+            continue
+        segment_end = length if size == UNKNOWN_SIZE else min(start + size, length)
+        for child_id, child_start, child_size in _elements(f, start, segment_end):
+            if child_id == CLUSTER:
+                return None  # media data began before any Info
+            if child_id != INFO or child_size == UNKNOWN_SIZE:
+                continue
+            scale, duration = 1_000_000, None  # TimecodeScale defaults to 1ms
+            for info_id, info_start, info_size in _elements(f, child_start, child_start + child_size):
+                if info_id not in (TIMECODE_SCALE, DURATION) or not 0 < info_size <= 8:
+                    continue
+                f.seek(info_start)
+                data = _read_exact(f, info_size)
+                if info_id == TIMECODE_SCALE:
+                    scale = int.from_bytes(data, "big")
+                elif info_size in (4, 8):
+                    duration = struct.unpack(">f" if info_size == 4 else ">d", data)[0]
+            return duration * scale / 1e9 if duration else None
+    return None
+
+
+# ---------------------------------------------------------------- API ----
+
+def probe_duration_from(f, length):
+    """Duration in seconds from a seekable binary file object of `length` bytes, or None."""
+    f.seek(0)
+    head = f.read(8)
+    if head[:4] == EBML_MAGIC:
+        return matroska_duration(f, length)
+    if head[4:8] in MP4_TOP_LEVEL:
+        return mp4_duration(f, length)
+    return None
+
+
+def probe_duration(uploaded_file):
+    """
+    Duration in seconds of an uploaded video (django UploadedFile, or any
+    seekable file with .size), or None when it cannot be determined.
+    The file position is reset to 0 afterwards.
+    """
+    try:
+        if hasattr(uploaded_file, "temporary_file_path"):
+            path = uploaded_file.temporary_file_path()
+            length = os.path.getsize(path)
+            if not length:
+                return None
+            with open(path, "rb") as raw, mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return probe_duration_from(mapped, length)
+        return probe_duration_from(uploaded_file, uploaded_file.size)
+    except (ProbeError, struct.error, OSError, ValueError) as e:
+        logger.info("Could not probe %s: %s", getattr(uploaded_file, "name", "video"), e)
+        return None
+    finally:
+        uploaded_file.seek(0)
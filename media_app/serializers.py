@@ -0,0 +1,36 @@
+# media_app/serializers.py
+from rest_framework import serializers
+from .models import UploadSession
+from .uploads import UPLOAD_TARGETS, chunk_size
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """Start (target, object_id, filename, size, caption) and status of a chunked upload."""
+    target = serializers.ChoiceField(choices=sorted(UPLOAD_TARGETS), write_only=True)
+    chunk_size = serializers.SerializerMethodField()
+    media_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            "id",
+            "target",
+            "object_id",
+            "filename",
+            "size",
+            "caption",
+            "file_type",
+            "offset",
+            "status",
+            "error",
+            "chunk_size",
+            "media",
+            "media_url",
+        ]
+        read_only_fields = ["id", "file_type", "offset", "status", "error", "media"]
+
+    def get_chunk_size(self, obj):
+        return chunk_size()
+
+    def get_media_url(self, obj):
+        return obj.media.file.url if obj.media_id else None
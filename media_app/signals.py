@@ -0,0 +1,31 @@
+# media_app/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import MediaFile
+from .blobs import release_blob
+from .variants import delete_variants, schedule_variants
+
+
+@receiver(post_save, sender=MediaFile)
+def build_image_variants(sender, instance, created, **kwargs):
+    """New images get their thumbnails in the background (media_app/variants.py)."""
+    if created:
+        schedule_variants(instance)
+
+
+def _delete_own_files(media):
+    delete_variants(media)
+    media.file.storage.delete(media.file.name)
+
+
+@receiver(post_delete, sender=MediaFile)
+def remove_media_files(sender, instance, **kwargs):
+    """Storage cleanup for a deleted MediaFile; callers must not delete the file themselves."""
+    if instance.blob_id:
+        # shared file and variants go only with the blob's last reference
+        release_blob(instance.blob_id)
+    elif instance.file:
+        # stored before de-duplication: the file is this row's alone
+        transaction.on_commit(lambda: _delete_own_files(instance))
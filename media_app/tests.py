@@ -1,3 +1,111 @@
-from django.test import TestCase
+import struct
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.test import SimpleTestCase
+
+from .probe import probe_duration
+
+
+# ---- hand-built container headers ----
+
+def box(box_type, payload):
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def mvhd_v0(timescale, duration):
+    return box(b"mvhd", b"\0\0\0\0" + struct.pack(">IIII", 0, 0, timescale, duration) + b"\0" * 80)
+
+
+def mvhd_v1(timescale, duration):
+    return box(b"mvhd", b"\1\0\0\0" + struct.pack(">QQIQ", 0, 0, timescale, duration) + b"\0" * 80)
+
+
+def element(element_id, data):
+    """EBML element with a 2-byte size."""
+    return element_id + struct.pack(">H", 0x4000 | len(data)) + data
+
+
+FTYP = box(b"ftyp", b"isom\0\0\0\0isomavc1")
+MDAT = box(b"mdat", b"\0" * 100_000)
+
+EBML_HEADER = element(b"\x1a\x45\xdf\xa3", element(b"\x42\x82", b"webm"))
+SEGMENT = b"\x18\x53\x80\x67"
+INFO = b"\x15\x49\xa9\x66"
+TIMECODE_SCALE = b"\x2a\xd7\xb1"
+DURATION = b"\x44\x89"
+CLUSTER = b"\x1f\x43\xb6\x75"
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+
+
+def probe(data, name="clip.mp4"):
+    return probe_duration(SimpleUploadedFile(name, data))
+
+
+class Mp4ProbeTests(SimpleTestCase):
+    def test_mvhd_version_0(self):
+        self.assertEqual(probe(FTYP + box(b"moov", mvhd_v0(1000, 95_500)) + MDAT), 95.5)
+
+    def test_mvhd_version_1(self):
+        self.assertEqual(probe(FTYP + box(b"moov", mvhd_v1(600, 600 * 42)) + MDAT, "clip.mov"), 42.0)
+
+    def test_moov_after_mdat(self):
+        data = FTYP + MDAT + box(b"moov", mvhd_v0(1000, 95_500) + box(b"trak", b"x" * 50))
+        self.assertEqual(probe(data), 95.5)
+
+    def test_mdat_with_64_bit_size(self):
+        mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + 1000) + b"\0" * 1000
+        self.assertEqual(probe(FTYP + mdat + box(b"moov", mvhd_v0(1000, 3_000))), 3.0)
+
+    def test_fragmented_file_uses_mehd(self):
+        mehd = box(b"mehd", b"\0\0\0\0" + struct.pack(">I", 90_000 * 12))
+        moov = box(b"moov", mvhd_v0(90_000, 0) + box(b"mvex", mehd))
+        self.assertEqual(probe(FTYP + moov), 12.0)
+
+    def test_no_duration_anywhere(self):
+        self.assertIsNone(probe(FTYP + box(b"moov", mvhd_v0(90_000, 0))))
+
+    def test_temporary_upload_is_memory_mapped(self):
+        data = FTYP + MDAT + box(b"moov", mvhd_v0(1000, 95_500))
+        upload = TemporaryUploadedFile("clip.mp4", "video/mp4", len(data), None)
+        self.addCleanup(upload.close)
+        upload.write(data)
+        upload.flush()
+        self.assertEqual(probe_duration(upload), 95.5)
+
+
+class WebmProbeTests(SimpleTestCase):
+    def test_info_in_segment_of_unknown_size(self):
+        info = element(INFO, element(TIMECODE_SCALE, (1_000_000).to_bytes(3, "big"))
+                       + element(DURATION, struct.pack(">d", 61_234.0)))
+        seek_head = element(b"\x11\x4d\x9b\x74", b"\0" * 20)
+        data = EBML_HEADER + SEGMENT + UNKNOWN_SIZE + seek_head + info + CLUSTER + b"\xff" + b"\0" * 500
+        self.assertAlmostEqual(probe(data, "clip.webm"), 61.234)
+
+    def test_float_duration_with_default_timecode_scale(self):
+        segment = element(SEGMENT, element(INFO, element(DURATION, struct.pack(">f", 2_500.0))))
+        self.assertEqual(probe(EBML_HEADER + segment, "clip.webm"), 2.5)
+
+    def test_cluster_before_info(self):
+        data = EBML_HEADER + SEGMENT + UNKNOWN_SIZE + CLUSTER + b"\xff" + b"\0" * 100
+        self.assertIsNone(probe(data, "clip.webm"))
+
+
+class BadInputTests(SimpleTestCase):
+    def test_garbage(self):
+        self.assertIsNone(probe(b"hello world" * 10))
+
+    def test_truncated_mp4(self):
+        data = FTYP + box(b"moov", mvhd_v1(600, 600 * 42))
+        self.assertIsNone(probe(data[:60]))
+
+    def test_truncated_webm(self):
+        segment = element(SEGMENT, element(INFO, element(DURATION, struct.pack(">d", 61_234.0))))
+        self.assertIsNone(probe((EBML_HEADER + segment)[:-4], "clip.webm"))
+
+    def test_empty(self):
+        self.assertIsNone(probe(b""))
+
+    def test_position_is_reset(self):
+        upload = SimpleUploadedFile("clip.mp4", FTYP + box(b"moov", mvhd_v0(1000, 1_000)))
+        probe_duration(upload)
+        self.assertEqual(upload.tell(), 0)
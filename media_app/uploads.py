@@ -0,0 +1,246 @@
+# media_app/uploads.py
+"""
+Resumable, chunked uploads for large files (mainly videos from mobile).
+
+    POST   /media-api/uploads/        start: target, object_id, filename, size → session id
+    PATCH  /media-api/uploads/<id>/   raw chunk bytes, "Upload-Offset: <n>" header
+    GET    /media-api/uploads/<id>/   current offset / status (where to resume)
+    DELETE /media-api/uploads/<id>/   cancel
+
+Each chunk is streamed straight from the request into a part file under
+MEDIA_UPLOAD_TEMP_DIR (never buffered by Django's upload handlers), and the
+session's offset advances by what was actually written, so a dropped
+connection resumes from the last byte received instead of from zero. A request
+only holds a worker for one chunk (MEDIA_UPLOAD_CHUNK_SIZE).
+
+When the last byte arrives the assembled file goes through the same checks as
+a form upload (media_app.validation.check_file, plus the duration limit for
+videos) straight from disk, and becomes a MediaFile on the session's target.
+Size, duration and gallery limits are the gallery form's own (person.views).
+Abandoned sessions are removed by the prune_upload_sessions command.
+"""
+import logging
+import os
+import tempfile
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import MediaFile, UploadSession
+from .utils import validate_video_duration
+from .validation import ALLOWED_EXTENSIONS, check_file
+
+logger = logging.getLogger(__name__)
+
+# "app_label.model" a session may attach to → the field holding its owner
+UPLOAD_TARGETS = {
+    "posts.post": "author",
+    "seekers.seekerpost": "author",
+    "person.person": "user",
+}
+DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024
+COPY_BUFFER = 64 * 1024
+RECEIVE_TIMEOUT = timedelta(minutes=2)  # a crashed writer's claim on a session lapses after this
+
+
+class UploadConflict(Exception):
+    """The chunk does not start at the session's offset (or the session is busy/finished)."""
+
+    def __init__(self, offset, message="Upload offset mismatch."):
+        super().__init__(message)
+        self.offset = offset
+
+
+def chunk_size():
+    return getattr(settings, "MEDIA_UPLOAD_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+
+def upload_dir():
+    path = getattr(settings, "MEDIA_UPLOAD_TEMP_DIR", None) or os.path.join(tempfile.gettempdir(), "media_uploads")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def max_size(file_type):
+    # imported here: person.views imports media_app
+    from person.views import MAX_IMAGE_SIZE, MAX_VIDEO_SIZE
+
+    return MAX_VIDEO_SIZE if file_type == "video" else MAX_IMAGE_SIZE
+
+
+def check_gallery_room(content_type, object_id):
+    """Gallery uploads (person.person) stop at the form's MAX_GALLERY_ITEMS."""
+    if (content_type.app_label, content_type.model) != ("person", "person"):
+        return
+    from person.views import MAX_GALLERY_ITEMS
+
+    if MediaFile.objects.filter(content_type=content_type, object_id=object_id).count() >= MAX_GALLERY_ITEMS:
+        raise ValidationError("Gallery limit reached.")
+
+
+def part_path(session):
+    return os.path.join(upload_dir(), f"{session.pk}.part")
+
+
+def _discard_part(session):
+    try:
+        os.remove(part_path(session))
+    except FileNotFoundError:
+        pass
+
+
+class AssembledFile(File):
+    """A finished part file, readable like an upload (probe_duration memory-maps it)."""
+
+    def __init__(self, path, name):
+        super().__init__(open(path, "rb"), name=name)
+        self.path = path
+
+    def temporary_file_path(self):
+        return self.path
+
+
+def start_upload(user, target, object_id, filename, size, caption=None):
+    """Open a session for `filename` (`size` bytes) to attach to one of the user's objects."""
+    filename = os.path.basename(filename)
+    extension = os.path.splitext(filename)[1].lower()
+    file_type = next((kind for kind, exts in ALLOWED_EXTENSIONS.items() if extension in exts), None)
+    if file_type is None:
+        raise ValidationError("Unsupported file type.")
+    if not 0 < size <= max_size(file_type):
+        raise ValidationError(f"File must be under {max_size(file_type) // (1024 * 1024)}MB.")
+
+    model = apps.get_model(target)
+    obj = model.objects.filter(pk=object_id, **{UPLOAD_TARGETS[target]: user}).first()
+    if obj is None:
+        raise ValidationError("Upload target not found.")
+    content_type = ContentType.objects.get_for_model(model)
+    check_gallery_room(content_type, obj.pk)
+
+    session = UploadSession.objects.create(
+        owner=user,
+        content_type=content_type,
+        object_id=obj.pk,
+        filename=filename,
+        file_type=file_type,
+        caption=caption or None,
+        size=size,
+    )
+    open(part_path(session), "wb").close()
+    return session
+
+
+def receive_chunk(session, offset, stream, length):
+    """
+    Append `length` bytes read from `stream` at `offset`. Whatever arrives
+    before a disconnect is kept; the last chunk finishes the upload.
+    Raises UploadConflict (resume from .offset) or ValidationError.
+    """
+    if session.status != UploadSession.UPLOADING or offset != session.offset:
+        raise UploadConflict(session.offset)
+    if length <= 0 or length > chunk_size() or offset + length > session.size:
+        raise ValidationError(f"Chunks must be 1–{chunk_size()} bytes and stay within the declared size.")
+
+    now = timezone.now()
+    claimed = (
+        UploadSession.objects.filter(pk=session.pk, status=UploadSession.UPLOADING, offset=offset)
+        .filter(Q(receiving_until__isnull=True) | Q(receiving_until__lt=now))
+        .update(receiving_until=now + RECEIVE_TIMEOUT)
+    )
+    if not claimed:
+        session.refresh_from_db()
+        raise UploadConflict(session.offset, "Another chunk is being received for this upload.")
+
+    written = 0
+    try:
+        with open(part_path(session), "r+b") as part:
+            part.seek(offset)
+            part.truncate()  # drop any tail left by an interrupted writer
+            while written < length:
+                try:
+                    data = stream.read(min(COPY_BUFFER, length - written))
+                except OSError:
+                    break  # client went away; keep what we have
+                if not data:
+                    break
+                part.write(data)
+                written += len(data)
+    finally:
+        session.offset = offset + written
+        UploadSession.objects.filter(pk=session.pk).update(
+            offset=session.offset, receiving_until=None, updated_at=timezone.now()
+        )
+
+    if session.offset == session.size:
+        finish_upload(session)
+    return session
+
+
+def finish_upload(session):
+    """Validate the assembled file and turn it into a MediaFile (or mark the session failed)."""
+    assembled = AssembledFile(part_path(session), session.filename)
+    try:
+        check_file(assembled, session.file_type)
+        if session.file_type == "video":
+            from person.views import MAX_VIDEO_DURATION
+
+            is_valid, _, error_msg = validate_video_duration(assembled, MAX_VIDEO_DURATION)
+            if not is_valid:
+                raise ValidationError(error_msg)
+
+        with transaction.atomic():
+            # lock the target so parallel finishes can't both take the last gallery slot
+            target = session.content_type.model_class()
+            target.objects.select_for_update().filter(pk=session.object_id).first()
+            check_gallery_room(session.content_type, session.object_id)
+            session.media = MediaFile.objects.create(
+                owner=session.owner,
+                content_type_id=session.content_type_id,
+                object_id=session.object_id,
+                file=assembled,
+                file_type=session.file_type,
+                caption=session.caption,
+                is_public=True,
+            )
+            session.status = UploadSession.COMPLETE
+            session.save(update_fields=["media", "status", "updated_at"])
+    except ValidationError as e:
+        session.status = UploadSession.FAILED
+        session.error = " ".join(e.messages)[:255]
+        session.save(update_fields=["status", "error", "updated_at"])
+        logger.warning("Chunked upload %s rejected: %s", session.pk, session.error)
+    except Exception:
+        # the part file is discarded below, so the session must not stay "uploading"
+        logger.exception("Chunked upload %s could not be saved", session.pk)
+        session.media = None
+        session.status = UploadSession.FAILED
+        session.error = "Upload could not be saved."
+        session.save(update_fields=["status", "error", "updated_at"])
+    finally:
+        assembled.close()
+        _discard_part(session)
+    return session
+
+
+def cancel_upload(session):
+    _discard_part(session)
+    session.delete()
+
+
+def prune_upload_sessions(hours=None):
+    """Delete sessions untouched for `hours` (default MEDIA_UPLOAD_SESSION_HOURS) and their part files."""
+    if hours is None:
+        hours = getattr(settings, "MEDIA_UPLOAD_SESSION_HOURS", 24)
+    stale = UploadSession.objects.filter(updated_at__lt=timezone.now() - timedelta(hours=hours))
+    removed = 0
+    for session in stale.iterator():
+        cancel_upload(session)
+        removed += 1
+    return removed
@@ -7,4 +7,6 @@ app_name = "media_app"
 urlpatterns = [
     path("upload/", views.upload_media, name="upload_media"),  # optional if you want a separate upload
     path("delete/<int:pk>/", views.delete_media, name="delete_media"),
+    path("uploads/", views.UploadSessionCreateView.as_view(), name="upload_session_create"),
+    path("uploads/<uuid:pk>/", views.UploadSessionView.as_view(), name="upload_session"),
 ]
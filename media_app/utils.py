@@ -1,8 +1,8 @@
 # media_app/utils.py
-import tempfile
-import os
 import logging
 
+from .probe import probe_duration
+
 logger = logging.getLogger(__name__)
 
 
@@ -10,35 +10,14 @@ def get_video_duration(uploaded_file):
     """
     Get video duration in seconds from an uploaded file.
     Returns None if unable to determine duration.
+
+    Reads only the container header (MP4 'mvhd' / WebM 'Duration', see
+    media_app/probe.py), so no temp copy and no ffmpeg is involved.
     """
-    try:
-        from moviepy.editor import VideoFileClip
-        
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-            for chunk in uploaded_file.chunks():
-                tmp_file.write(chunk)
-            tmp_file_path = tmp_file.name
-        
-        # Get duration
-        try:
-            clip = VideoFileClip(tmp_file_path)
-            duration = clip.duration
-            clip.close()
-            return duration
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
-            # Reset file pointer for later use
-            uploaded_file.seek(0)
-                
-    except ImportError:
-        logger.warning("moviepy not installed. Video duration validation skipped.")
-        return None
-    except Exception as e:
-        logger.error(f"Error getting video duration: {e}")
-        return None
+    duration = probe_duration(uploaded_file)
+    if duration is None:
+        logger.warning("Could not read duration from %s", getattr(uploaded_file, "name", "video"))
+    return duration
 
 
 def validate_video_duration(uploaded_file, max_duration_seconds=90):
@@ -0,0 +1,239 @@
+# media_app/validation.py
+"""
+Upload validation pipeline for multi-file submissions.
+
+validate_files() runs one check per file on a bounded, per-process thread pool
+(MEDIA_VALIDATION_WORKERS) and returns a FileCheck per file, in upload order.
+The checks are I/O bound (libmagic, the ClamAV socket, Pillow's decoder), so a
+ten-photo upload takes about as long as its slowest file rather than the sum.
+Only validation runs in the pool: saving MediaFile rows stays in the request
+thread.
+
+Virus scans go through ClamdPool, which keeps a few clamd connections open in
+IDSESSION mode and reuses them across files and requests instead of opening a
+socket per file. When clamd is unreachable the scan is skipped (as before) and
+the daemon is not retried for CLAMD_RETRY_SECONDS, so a batch does not wait on
+ten connection timeouts.
+"""
+import logging
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import magic
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from PIL import Image, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_MIME_TYPES = {
+    "image": ["image/jpeg", "image/png", "image/webp"],
+    "video": ["video/mp4", "video/webm", "video/ogg"],
+}
+ALLOWED_EXTENSIONS = {
+    "image": [".jpg", ".jpeg", ".png", ".webp"],
+    "video": [".mp4", ".webm", ".ogg"],
+}
+
+CLAMD_CHUNK_SIZE = 64 * 1024
+CLAMD_RETRY_SECONDS = 30
+
+
+class ClamdUnavailable(Exception):
+    """clamd could not be reached or could not scan the stream."""
+
+
+class _ClamdSession:
+    """One clamd connection in IDSESSION mode: several INSTREAM scans, one socket."""
+
+    def __init__(self, host, port, timeout):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.sendall(b"zIDSESSION\0")
+
+    def scan(self, uploaded_file):
+        """Signature name when infected, None when clean."""
+        self.sock.sendall(b"zINSTREAM\0")
+        uploaded_file.seek(0)
+        for chunk in uploaded_file.chunks(CLAMD_CHUNK_SIZE):
+            self.sock.sendall(struct.pack("!L", len(chunk)) + chunk)
+        self.sock.sendall(struct.pack("!L", 0))
+        uploaded_file.seek(0)
+
+        reply = b""
+        while not reply.endswith(b"\0"):
+            data = self.sock.recv(4096)
+            if not data:
+                raise ConnectionError("clamd closed the session")
+            reply += data
+        # "<request id>: stream: OK" / "...: stream: Eicar-Signature FOUND" / "...: <reason> ERROR"
+        status = reply.rstrip(b"\0").decode(errors="replace").split(": ", 1)[-1]
+        if status.endswith("FOUND"):
+            return status[len("stream: "):-len(" FOUND")].strip() or "unknown"
+        if status.endswith("ERROR"):
+            raise ClamdUnavailable(status)
+        return None
+
+    def close(self):
+        try:
+            self.sock.sendall(b"zEND\0")
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class ClamdPool:
+    """Up to `size` reusable clamd sessions shared by all request threads."""
+
+    def __init__(self, host="127.0.0.1", port=3310, size=4, timeout=10):
+        self.host, self.port, self.timeout = host, port, timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._down_until = 0.0
+
+    def _connect(self):
+        return _ClamdSession(self.host, self.port, self.timeout)
+
+    def scan(self, uploaded_file):
+        """Signature name or None; raises ClamdUnavailable when no scan was possible."""
+        if time.monotonic() < self._down_until:
+            raise ClamdUnavailable("clamd was unreachable recently")
+        with self._slots:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                session = None
+            for attempt in range(2):  # an idle session may have been closed by clamd's IdleTimeout
+                try:
+                    if session is None:
+                        session = self._connect()
+                    found = session.scan(uploaded_file)
+                    self._idle.put(session)
+                    return found
+                except OSError as e:
+                    if session is not None:
+                        session.close()
+                        session = None
+                    if attempt:
+                        self._down_until = time.monotonic() + CLAMD_RETRY_SECONDS
+                        raise ClamdUnavailable(str(e)) from e
+                except ClamdUnavailable:
+                    session.close()
+                    raise
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_clamd_pool = None
+_executor = None
+_lock = threading.Lock()
+
+
+def get_clamd_pool():
+    global _clamd_pool
+    with _lock:
+        if _clamd_pool is None:
+            _clamd_pool = ClamdPool(
+                host=getattr(settings, "CLAMD_HOST", "127.0.0.1"),
+                port=getattr(settings, "CLAMD_PORT", 3310),
+                size=getattr(settings, "MEDIA_VALIDATION_WORKERS", 4),
+            )
+        return _clamd_pool
+
+
+def get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "MEDIA_VALIDATION_WORKERS", 4),
+                thread_name_prefix="media-validation",
+            )
+        return _executor
+
+
+def scan_file(uploaded_file):
+    """Antivirus scan: raises ValidationError when infected; skipped (logged) without clamd."""
+    try:
+        found = get_clamd_pool().scan(uploaded_file)
+    except ClamdUnavailable as e:
+        logger.warning("ClamAV not running or unreachable — skipping antivirus scan: %s", e)
+        return
+    if found:
+        logger.warning("Malware %s detected in %s", found, uploaded_file.name)
+        raise ValidationError("Malware detected in uploaded file.")
+
+
+def check_file(uploaded_file, file_type):
+    """MIME sniffing, extension, antivirus and image integrity checks for one upload."""
+    # 1️⃣ Confirm MIME type again
+    mime = magic.from_buffer(uploaded_file.read(4096), mime=True)
+    uploaded_file.seek(0)
+    if mime not in ALLOWED_MIME_TYPES[file_type]:
+        raise ValidationError(f"Invalid {file_type} format detected at runtime.")
+
+    # 2️⃣ Confirm extension
+    ext = os.path.splitext(uploaded_file.name)[1].lower()
+    if ext not in ALLOWED_EXTENSIONS[file_type]:
+        raise ValidationError("File extension mismatch at runtime.")
+
+    # 3️⃣ Antivirus scan (ClamAV)
+    scan_file(uploaded_file)
+
+    # 4️⃣ Additional image checks
+    if file_type == "image":
+        try:
+            img = Image.open(uploaded_file)
+            img.verify()  # Ensure it's not corrupted
+        except UnidentifiedImageError:
+            raise ValidationError("Uploaded image is invalid.")
+        except Exception:
+            raise ValidationError("Failed to verify uploaded image.")
+        finally:
+            uploaded_file.seek(0)
+
+
+@dataclass
+class FileCheck:
+    file: object
+    file_type: str
+    error: str = None
+    detail: object = None  # whatever the check returned (e.g. a video's duration)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _run_check(check, uploaded_file, file_type):
+    try:
+        return FileCheck(uploaded_file, file_type, detail=check(uploaded_file, file_type))
+    except ValidationError as e:
+        return FileCheck(uploaded_file, file_type, error=" ".join(e.messages))
+    except Exception as e:
+        logger.error("Validation of %s failed: %s", uploaded_file.name, e)
+        return FileCheck(uploaded_file, file_type, error="Upload error")
+
+
+def validate_files(files, check=check_file):
+    """
+    Run check(file, file_type) for every (file, file_type) pair in parallel.
+    The check raises ValidationError to reject a file. Returns FileChecks in
+    the order given.
+    """
+    files = list(files)
+    if len(files) <= 1:
+        return [_run_check(check, f, file_type) for f, file_type in files]
+    executor = get_executor()
+    futures = [executor.submit(_run_check, check, f, file_type) for f, file_type in files]
+    return [future.result() for future in futures]
@@ -0,0 +1,154 @@
+# media_app/variants.py
+"""
+Responsive image variants for MediaFile.
+
+Every image gets WebP and JPEG copies at VARIANT_WIDTHS, saved beside the
+original (same media_upload_path folder, "<name>__w640.webp"), and recorded in
+MediaFile.variants. Templates serve them through MediaFile.webp_srcset /
+jpeg_srcset / display_url, so a feed card downloads a ~640px JPEG/WebP instead
+of the multi-megabyte original.
+
+Files de-duplicated into a MediaBlob share one set of variants: an image whose
+blob already has them just copies the names (see generate_variants' reuse).
+
+Generation never runs in the upload request: media_app.signals calls
+schedule_variants() on commit, which hands the work to a small per-process
+thread pool (MEDIA_VARIANT_WORKERS). Until it finishes, templates fall back to
+the original. generate_media_variants backfills existing files.
+"""
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+VARIANT_WIDTHS = tuple(getattr(settings, "MEDIA_VARIANT_WIDTHS", (320, 640, 1080)))
+VARIANT_FORMATS = {
+    # name: (Pillow format, extension, save options)
+    "webp": ("WEBP", ".webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", ".jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "MEDIA_VARIANT_WORKERS", 2),
+                thread_name_prefix="media-variants",
+            )
+        return _executor
+
+
+def variant_name(original_name, width, extension):
+    stem, _ = os.path.splitext(original_name)
+    return f"{stem}__w{width}{extension}"
+
+
+def _target_widths(original_width):
+    """Configured widths below the original; an image narrower than all of them gets one copy at its own width."""
+    widths = [w for w in VARIANT_WIDTHS if w < original_width]
+    return widths or [original_width]
+
+
+def _encode(image, fmt):
+    pil_format, _, options = VARIANT_FORMATS[fmt]
+    if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def generate_variants(media, reuse=True):
+    """
+    Write all variants of one MediaFile image and record them. Returns the
+    variants dict ({} for videos / unreadable images). Safe to re-run: old
+    variant files are replaced. With reuse, an image sharing its blob with one
+    that already has variants takes those instead of rebuilding them.
+    """
+    from .models import MediaFile
+
+    if media.file_type != "image" or not media.file:
+        return {}
+
+    if reuse and media.blob_id:
+        shared = (
+            MediaFile.objects.filter(blob_id=media.blob_id)
+            .exclude(pk=media.pk).exclude(variants={})
+            .values_list("variants", flat=True).first()
+        )
+        if shared:
+            MediaFile.objects.filter(pk=media.pk).update(variants=shared)
+            media.variants = shared
+            return shared
+
+    storage = media.file.storage
+    try:
+        with storage.open(media.file.name, "rb") as f:
+            original = ImageOps.exif_transpose(Image.open(f))
+            original.load()
+    except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
+        logger.warning("Cannot build variants for media %s: %s", media.pk, e)
+        return {}
+
+    if original.mode not in ("RGB", "RGBA", "L"):
+        original = original.convert("RGBA" if "A" in original.getbands() else "RGB")
+
+    variants = {fmt: {} for fmt in VARIANT_FORMATS}
+    for width in _target_widths(original.width):
+        height = max(1, round(original.height * width / original.width))
+        resized = original if width == original.width else original.resize((width, height), Image.LANCZOS)
+        for fmt, (_, extension, _) in VARIANT_FORMATS.items():
+            name = variant_name(media.file.name, width, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            variants[fmt][str(width)] = storage.save(name, ContentFile(_encode(resized, fmt)))
+
+    # update() so no save() signals fire again for this row
+    MediaFile.objects.filter(pk=media.pk).update(variants=variants)
+    media.variants = variants
+    return variants
+
+
+def delete_variants(media):
+    storage = media.file.storage
+    for names in (media.variants or {}).values():
+        for name in names.values():
+            try:
+                storage.delete(name)
+            except OSError as e:
+                logger.warning("Could not delete variant %s: %s", name, e)
+
+
+def _generate_in_worker(media_id):
+    from .models import MediaFile
+
+    close_old_connections()
+    try:
+        media = MediaFile.objects.filter(pk=media_id).first()
+        if media is not None:
+            generate_variants(media)
+    except Exception:
+        logger.exception("Variant generation failed for media %s", media_id)
+    finally:
+        close_old_connections()
+
+
+def schedule_variants(media):
+    """Queue variant generation for `media` once the surrounding transaction commits."""
+    if media.file_type != "image":
+        return
+    media_id = media.pk
+    transaction.on_commit(lambda: get_executor().submit(_generate_in_worker, media_id))
@@ -3,51 +3,17 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from .models import MediaFile
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .models import MediaFile, UploadSession
 from .forms import MediaFileForm
-from PIL import Image, UnidentifiedImageError
-import magic
-import clamd
-import os
-import re
-
-# Helper for additional runtime validation
-def secure_file_check(uploaded_file, file_type):
-    # 1️⃣ Confirm MIME type again
-    mime = magic.from_buffer(uploaded_file.read(4096), mime=True)
-    uploaded_file.seek(0)
-    
-    if file_type == "image" and mime not in ["image/jpeg", "image/png", "image/webp"]:
-        raise ValidationError("Invalid image format detected at runtime.")
-    if file_type == "video" and mime not in ["video/mp4", "video/webm", "video/ogg"]:
-        raise ValidationError("Invalid video format detected at runtime.")
-
-    # 2️⃣ Confirm extension
-    ext = os.path.splitext(uploaded_file.name)[1].lower()
-    valid_exts = [".jpg", ".jpeg", ".png", ".webp"] if file_type == "image" else [".mp4", ".webm", ".ogg"]
-    if ext not in valid_exts:
-        raise ValidationError("File extension mismatch at runtime.")
-
-    # 3️⃣ Antivirus scan (ClamAV)
-    try:
-        cd = clamd.ClamdNetworkSocket(host="127.0.0.1", port=3310)
-        result = cd.instream(uploaded_file)
-        uploaded_file.seek(0)
-        if result and "FOUND" in result.get("stream", [""])[1]:
-            raise ValidationError("Malware detected in uploaded file.")
-    except Exception:
-        print("⚠️ ClamAV not running — skipping antivirus scan.")
-
-    # 4️⃣ Additional image checks
-    if file_type == "image":
-        try:
-            img = Image.open(uploaded_file)
-            img.verify()  # Ensure it's not corrupted
-            uploaded_file.seek(0)
-        except UnidentifiedImageError:
-            raise ValidationError("Uploaded image is invalid.")
-        except Exception:
-            raise ValidationError("Failed to verify uploaded image.")
+from .serializers import UploadSessionSerializer
+from .uploads import UploadConflict, cancel_upload, receive_chunk, start_upload
+from .validation import check_file, validate_files
+
+# Helper for additional runtime validation (the checks live in media_app/validation.py)
+secure_file_check = check_file
 
 @login_required
 def upload_media(request):
@@ -57,15 +23,16 @@ def upload_media(request):
             messages.error(request, "No files selected.")
             return render(request, "media_app/upload.html", {"form": MediaFileForm()})
 
-        for f in files:
-            file_type = "video" if f.content_type.startswith("video") else "image"
-            try:
-                secure_file_check(f, file_type)
-                media = MediaFile(owner=request.user, file=f, file_type=file_type)
-                media.save()
-            except ValidationError as e:
-                messages.error(request, f"Upload failed for {f.name}: {e}")
+        # validate all files in parallel, then save the good ones here
+        checks = validate_files(
+            (f, "video" if f.content_type.startswith("video") else "image") for f in files
+        )
+        for result in checks:
+            if not result.ok:
+                messages.error(request, f"Upload failed for {result.file.name}: {result.error}")
                 continue  # Skip bad files but keep processing others
+            media = MediaFile(owner=request.user, file=result.file, file_type=result.file_type)
+            media.save()
 
         messages.success(request, "Media upload complete!")
         return redirect("media_list")
@@ -87,3 +54,59 @@ def delete_media(request, pk):
         messages.success(request, "Media deleted successfully!")
         return redirect("media_list")
     return render(request, "media_app/confirm_delete.html", {"media": media})
+
+
+# ---- resumable chunked uploads (media_app/uploads.py) ----
+
+class UploadSessionCreateView(APIView):
+    """POST: open a chunked upload. URL: /media-api/uploads/"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = UploadSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            session = start_upload(request.user, **serializer.validated_data)
+        except ValidationError as e:
+            return Response({"detail": " ".join(e.messages)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_201_CREATED)
+
+
+class UploadSessionView(APIView):
+    """
+    GET: where to resume. PATCH: raw chunk body with an Upload-Offset header.
+    DELETE: cancel. URL: /media-api/uploads/<id>/
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_session(self, request, pk):
+        return get_object_or_404(UploadSession, pk=pk, owner=request.user)
+
+    def respond(self, session, code=status.HTTP_200_OK):
+        response = Response(UploadSessionSerializer(session).data, status=code)
+        response["Upload-Offset"] = str(session.offset)
+        return response
+
+    def get(self, request, pk):
+        return self.respond(self.get_session(request, pk))
+
+    def patch(self, request, pk):
+        session = self.get_session(request, pk)
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except (KeyError, ValueError):
+            return Response({"detail": "Upload-Offset and Content-Length headers are required."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            # read the body straight from the WSGI stream; request.data is never touched
+            receive_chunk(session, offset, request._request, length)
+        except UploadConflict:
+            return self.respond(session, status.HTTP_409_CONFLICT)
+        except ValidationError as e:
+            return Response({"detail": " ".join(e.messages)}, status=status.HTTP_400_BAD_REQUEST)
+        return self.respond(session)
+
+    def delete(self, request, pk):
+        cancel_upload(self.get_session(request, pk))
+        return Response(status=status.HTTP_204_NO_CONTENT)
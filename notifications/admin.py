@@ -1,6 +1,8 @@
 from django.contrib import admin
-from .models import Notification, NotificationPreference
-from board.models import Board
+from .models import (
+    Notification, NotificationArchive, NotificationDigestItem, NotificationOutbox, NotificationPreference,
+)
+from board.models import Board, BoardEntry
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
@@ -10,6 +12,7 @@ class NotificationAdmin(admin.ModelAdmin):
         "actor_display",
         "verb",
         "read",
+        "group_count",
         "created_at",
         "target_content_type",
         "target_object_id",
@@ -31,10 +34,35 @@ class NotificationAdmin(admin.ModelAdmin):
 
 @admin.register(NotificationPreference)
 class NotificationPreferenceAdmin(admin.ModelAdmin):
-    list_display = ("user", "allow_global_posts", "allow_comments", "mode")
+    list_display = ("user", "allow_global_posts", "allow_comments", "allow_follower_posts", "mode", "digest_mode")
+    list_filter = ("digest_mode",)
     search_fields = ("user__username", "user__email")
 
 @admin.register(Board)
 class BoardAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "description")
-    search_fields = ("name",)
\ No newline at end of file
+    search_fields = ("name",)
+
+@admin.register(NotificationDigestItem)
+class NotificationDigestItemAdmin(admin.ModelAdmin):
+    list_display = ("id", "recipient", "coalesce_key", "count", "first_at", "last_at")
+    search_fields = ("recipient__username", "coalesce_key")
+
+@admin.register(BoardEntry)
+class BoardEntryAdmin(admin.ModelAdmin):
+    list_display = ("id", "board", "content_type", "object_id", "title", "created_at")
+    list_filter = ("board", "content_type")
+    search_fields = ("title", "author_name")
+
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+    list_display = ("id", "recipient", "month", "notifications", "events", "updated_at")
+    search_fields = ("recipient__username",)
+    date_hierarchy = "month"
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = ("id", "event", "idempotency_key", "attempts", "created_at", "processed_at", "failed_at")
+    list_filter = ("event",)
+    search_fields = ("idempotency_key", "last_error")
+    readonly_fields = ("created_at",)
@@ -0,0 +1,191 @@
+"""
+notifications/coalesce.py
+
+Coalescing and daily digests for follower fan-out (the outbox's follower
+batches; direct notifications to the author are never merged).
+
+Every follower notification carries coalesce_key = "<event>:<actor id>". For
+each recipient in a batch, write_grouped() does one of three things:
+
+- the recipient chose the daily digest → the event is folded into their
+  NotificationDigestItem for that key, sent later by send_digests();
+- they still have an unread notification with the same key from the last
+  NOTIFICATION_COALESCE_WINDOW seconds → that row absorbs the event
+  (group_count + 1, target id appended, verb switches to the group verb);
+- otherwise → a new row, as before.
+
+The lookups are one query per batch each, so ten approvals in an hour cost each
+follower one row instead of ten.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Notification, NotificationDigestItem
+from .preferences import digest_recipient_ids
+from .pubsub import publish
+from .unread import bump_unread
+
+DEFAULT_WINDOW_SECONDS = 3600
+MAX_TARGET_IDS = 50  # group_count keeps counting past this
+
+
+def coalesce_key(event, actor_id):
+    return f"{event}:{actor_id or 0}"
+
+
+def coalesce_window():
+    """timedelta, or None when coalescing is switched off (window 0)."""
+    seconds = getattr(settings, "NOTIFICATION_COALESCE_WINDOW", DEFAULT_WINDOW_SECONDS)
+    return timedelta(seconds=seconds) if seconds else None
+
+
+def group_text(group_verb, count, fallback):
+    """'{count}' in group_verb → count (plain replace: usernames may contain braces)."""
+    if count > 1 and group_verb:
+        return group_verb.replace("{count}", str(count))
+    return fallback
+
+
+def _with_target(target_ids, target_id):
+    if target_id is None:
+        return list(target_ids or [])
+    ids = [pk for pk in (target_ids or []) if pk != target_id] + [target_id]
+    return ids[-MAX_TARGET_IDS:]
+
+
+def write_grouped(notifications, group_verb=""):
+    """
+    Write unsaved notifications that share one coalesce_key and target (one
+    follower batch of an outbox entry). Run inside a transaction.
+    Returns (created, merged): new rows and existing rows that absorbed an event.
+    """
+    if not notifications:
+        return [], []
+    now = timezone.now()
+    key = notifications[0].coalesce_key
+    pending = {n.recipient_id: n for n in notifications}
+
+    digest_ids = digest_recipient_ids(pending)
+    if digest_ids:
+        _hold_for_digest([pending.pop(pk) for pk in digest_ids], group_verb, now)
+
+    merged = []
+    window = coalesce_window()
+    if window and pending:
+        recent = (
+            Notification.objects.select_for_update()
+            .filter(recipient_id__in=pending, coalesce_key=key, read=False, last_event_at__gte=now - window)
+            .order_by("recipient_id", "-last_event_at")
+        )
+        for row in recent:
+            new = pending.pop(row.recipient_id, None)
+            if new is None:
+                continue  # this recipient's newest row already took it
+            row.group_count += 1
+            row.target_ids = _with_target(row.target_ids, new.target_object_id)
+            row.target_object_id = new.target_object_id
+            row.verb = group_text(group_verb, row.group_count, new.verb)
+            row.extra = new.extra
+            row.link = new.link
+            row.last_event_at = now  # surfaces at the top of the list again
+            merged.append(row)
+        Notification.objects.bulk_update(
+            merged,
+            ["group_count", "target_ids", "target_object_id", "verb", "extra", "link", "last_event_at"],
+        )
+
+    created = list(pending.values())
+    for n in created:
+        n.target_ids = _with_target([], n.target_object_id)
+        n.last_event_at = now
+    Notification.objects.bulk_create(created)
+    return created, merged
+
+
+def _hold_for_digest(notifications, group_verb, now):
+    key = notifications[0].coalesce_key
+    items = {
+        item.recipient_id: item
+        for item in NotificationDigestItem.objects.select_for_update().filter(
+            recipient_id__in=[n.recipient_id for n in notifications], coalesce_key=key
+        )
+    }
+    new_items = []
+    for n in notifications:
+        item = items.get(n.recipient_id)
+        if item is None:
+            new_items.append(NotificationDigestItem(
+                recipient_id=n.recipient_id,
+                actor_id=n.actor_id,
+                coalesce_key=key,
+                verb=n.verb,
+                group_verb=group_verb,
+                target_content_type=n.target_content_type,
+                target_ids=_with_target([], n.target_object_id),
+                first_at=now,
+                last_at=now,
+            ))
+            continue
+        item.count += 1
+        item.verb = n.verb
+        item.target_ids = _with_target(item.target_ids, n.target_object_id)
+        item.last_at = now
+    NotificationDigestItem.objects.bulk_update(list(items.values()), ["count", "verb", "target_ids", "last_at"])
+    NotificationDigestItem.objects.bulk_create(new_items)
+
+
+def _digest_notification(recipient_id, items):
+    lines = [group_text(item.group_verb, item.count, item.verb) for item in items]
+    return Notification(
+        recipient_id=recipient_id,
+        actor=None,
+        verb="Your daily digest: " + " · ".join(lines),
+        coalesce_key="digest",
+        group_count=sum(item.count for item in items),
+        extra={
+            "digest": True,
+            "items": [
+                {
+                    "actor_id": item.actor_id,
+                    "count": item.count,
+                    "target_content_type": item.target_content_type,
+                    "target_ids": item.target_ids,
+                }
+                for item in items
+            ],
+        },
+    )
+
+
+def send_digests(batch_size=500):
+    """
+    One digest Notification per recipient with held items, written
+    batch_size recipients per transaction. Returns the number sent.
+    """
+    recipient_ids = list(
+        NotificationDigestItem.objects.order_by("recipient_id")
+        .values_list("recipient_id", flat=True).distinct()
+    )
+    sent = 0
+    for start in range(0, len(recipient_ids), batch_size):
+        chunk = recipient_ids[start:start + batch_size]
+        with transaction.atomic():
+            items = list(
+                NotificationDigestItem.objects.select_for_update()
+                .filter(recipient_id__in=chunk)
+                .order_by("recipient_id", "first_at")
+            )
+            by_recipient = {}
+            for item in items:
+                by_recipient.setdefault(item.recipient_id, []).append(item)
+            digests = [_digest_notification(pk, rows) for pk, rows in by_recipient.items()]
+
+            Notification.objects.bulk_create(digests)
+            bump_unread([n.recipient_id for n in digests])
+            NotificationDigestItem.objects.filter(pk__in=[item.pk for item in items]).delete()
+            transaction.on_commit(lambda digests=digests: publish(digests))
+        sent += len(digests)
+    return sent
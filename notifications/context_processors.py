@@ -0,0 +1,13 @@
+# notifications/context_processors.py
+from django.conf import settings
+
+
+def unread_notifications(request):
+    """Badge count for every template, straight off the user row (no query)."""
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return {"unread_notification_count": 0}
+    return {
+        "unread_notification_count": user.unread_notification_count,
+        "notification_stream": settings.NOTIFICATION_STREAM,
+    }
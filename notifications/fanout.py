@@ -0,0 +1,29 @@
+"""
+notifications/fanout.py
+
+Follower fan-out without materializing the follower list.
+
+Follower ids are read from one server-side cursor (QuerySet.iterator) in
+ascending id order, walking the (following, follower) index, and handed out in
+fixed-size chunks. Callers write Notification(recipient_id=...) per chunk, so
+no User rows are loaded and memory stays at one chunk whatever the follower
+count.
+"""
+from itertools import islice
+
+from accounts.models import Follow
+
+
+def iter_follower_id_chunks(user_id, chunk_size=1000, after=0):
+    """Yield lists of up to chunk_size follower ids of user_id, ascending, ids > after."""
+    follower_ids = (
+        Follow.objects.filter(following_id=user_id, follower_id__gt=after)
+        .order_by("follower_id")
+        .values_list("follower_id", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+    while True:
+        chunk = list(islice(follower_ids, chunk_size))
+        if not chunk:
+            return
+        yield chunk
@@ -4,16 +4,16 @@ Handles notification creation for post status changes.
 This module sends structured, clickable notifications when a post is approved or rejected.
 It automatically:
 - Notifies the post author with a clickable link to their post.
-- Notifies the admin board (not general users) when a post is approved.
 - Notifies only followers of the author about new approved posts.
+
+Notifications are not written here: they are queued in the notification
+outbox (notifications/outbox.py) in the caller's transaction and delivered by
+the process_notification_outbox worker.
 """
 
 from django.conf import settings
 from django.urls import reverse
-from notifications.models import Notification
-from accounts.models import Follow
-from notifications.utils import remove_from_board  # ✅ import cleanup helper
-from board.models import Board
+from notifications.outbox import enqueue
 User = settings.AUTH_USER_MODEL
 
 
@@ -35,67 +35,43 @@ def make_clickable_link(text, url):
 def notify_post_approved(post):
     """
     Notify only the author and followers when a post is approved.
-    Also adds the post to the central 'PostBoard' for public display.
+    (The central 'PostBoard' is kept in sync by posts.signals.sync_post_board.)
     """
     author = post.author
     post_url = get_post_url(post)
     product_name = post.product_name or "Untitled Post"
     clickable_title = make_clickable_link(product_name, post_url)
 
-    # 1️⃣ Add the approved post to the public board
-    board = Board.objects.filter(name="PostBoard").first()
-    if board:
-        board.add_item(post)
-
-    # 2️⃣ Notify the author
-    Notification.objects.create(
-        recipient=author,
-        actor=None,
-        verb=f"Your post {clickable_title} has been approved",
-        target_content_type="post",
-        target_object_id=post.pk,
+    # Queue the author + follower notifications (sent by process_notification_outbox)
+    enqueue(
+        "post_approved",
+        post,
+        notifications=[{
+            "recipient_id": author.pk,
+            "verb": f"Your post {clickable_title} has been approved",
+        }],
+        followers_of=author.pk,
+        follower_actor_id=author.pk,
+        follower_verb=f"{author.username} made a new post: {clickable_title}.",
+        follower_group_verb=f"{author.username} made {{count}} new posts.",
         extra={"link": post_url},
     )
 
-    # 3️⃣ Notify followers of the author
-    follower_ids = list(
-        Follow.objects.filter(following=author).values_list("follower_id", flat=True)
-    )
-
-    if follower_ids:
-        followers = author.__class__.objects.filter(id__in=follower_ids)
-        Notification.objects.bulk_create([
-            Notification(
-                recipient=follower,
-                actor=author,
-                verb=f"{author.username} made a new post: {clickable_title}.",
-                target_object_id=post.pk,
-                target_content_type="post",
-                extra={"link": post_url},
-            )
-            for follower in followers
-        ])
-
 def notify_post_rejected(post):
     """
-    Notify the post author if their post was rejected or unapproved,
-    and ensure it’s removed from the Board.
+    Notify the post author if their post was rejected or unapproved.
     """
     post_url = get_post_url(post)
     product_name = post.product_name or "Untitled Post"
     clickable_title = make_clickable_link(product_name, post_url)
 
-    # 📨 Notify the author
-    Notification.objects.create(
-        recipient=post.author,
-        actor=None,
-        verb=f"Your post {clickable_title} was rejected or reverted.",
-        target_content_type="post",
-        target_object_id=post.pk,
+    # 📨 Notify the author (via the outbox)
+    enqueue(
+        "post_rejected",
+        post,
+        notifications=[{
+            "recipient_id": post.author_id,
+            "verb": f"Your post {clickable_title} was rejected or reverted.",
+        }],
         extra={"link": post_url},
     )
-    # 🧹 Remove from board (if it exists there)
-    try:
-        remove_from_board(post)
-    except Exception as e:
-        print(f"[WARN] Failed to remove post from board: {e}")
@@ -4,16 +4,17 @@ Handles notification creation for seeker request status changes.
 This module sends notifications when a seeker request or related town
 is approved or rejected. It ensures that:
 - The seeker author is notified directly with a clickable link.
-- The Seekers board is informed of all new approvals.
 - Only followers of the author are notified about new seeker requests.
+
+Approval/rejection notifications go through the notification outbox
+(notifications/outbox.py) and are delivered by process_notification_outbox.
 """
 
 from django.urls import reverse
 from notifications.models import Notification
-from accounts.models import Follow
+from notifications.outbox import enqueue
 from django.contrib.auth import get_user_model
-from notifications.utils import remove_from_board  # ✅ import cleanup helper
-from board.models import Board
+from board.models import Board, SEEKERS_BOARD
 
 User = get_user_model()
 
@@ -22,11 +23,7 @@ def get_seekers_board():
     """
     Retrieve or create the board that aggregates all approved seeker requests.
     """
-    board, _ = Board.objects.get_or_create(
-        name="SeekersBoard",
-        defaults={"description": "Board for all approved seeker requests."}
-    )
-    return board
+    return Board.named(SEEKERS_BOARD)
 
 
 def get_seeker_url(seeker_post):
@@ -49,45 +46,29 @@ def make_clickable_link(text, url):
 
 def notify_seeker_approved(seeker_post):
     """
-    Notify the author, add the seeker to SeekersBoard, and notify followers.
+    Notify the author and followers.
+    (SeekersBoard is kept in sync by seekers.signals.sync_seekerpost_board.)
     """
     author = seeker_post.author
     seeker_url = get_seeker_url(seeker_post)
     title = seeker_post.title or "Untitled Request"
     clickable_title = make_clickable_link(title, seeker_url)
 
-    # ✅ 1. Add seeker post to SeekersBoard (visible to everyone)
-    seekers_board = get_seekers_board()
-    seekers_board.add_item(seeker_post)
-
-    Notification.objects.create(
-        recipient=author,
-        actor=None,
-        verb=f"Your seeker request {clickable_title} has been approved.",
-        target_object_id=seeker_post.pk,
-        target_content_type="seekerpost",
+    # 🔔 Queue the author + follower notifications (sent by process_notification_outbox)
+    enqueue(
+        "seeker_approved",
+        seeker_post,
+        notifications=[{
+            "recipient_id": author.pk,
+            "verb": f"Your seeker request {clickable_title} has been approved.",
+        }],
+        followers_of=author.pk,
+        follower_actor_id=author.pk,
+        follower_verb=f"Someone you follow made a new seeker request, check it out: {clickable_title}.",
+        follower_group_verb=f"{author.username} made {{count}} new seeker requests.",
         extra={"link": seeker_url},
     )
 
-    # 🔔 3. Notify followers of the author
-    follower_ids = list(
-        Follow.objects.filter(following=author).values_list("follower_id", flat=True)
-    )
-
-    if follower_ids:
-        followers = author.__class__.objects.filter(id__in=follower_ids)
-        Notification.objects.bulk_create([
-            Notification(
-                recipient=follower,
-                actor=author,
-                verb=f"Someone you follow made a new seeker request, check it out: {clickable_title}.",
-                target_object_id=seeker_post.pk,
-                target_content_type="seekerpost",
-                extra={"link": seeker_url},
-            )
-            for follower in followers
-        ])
-
 def notify_seeker_rejected(seeker_post):
     """
     Notify the author if their seeker request was rejected or reverted.
@@ -96,19 +77,15 @@ def notify_seeker_rejected(seeker_post):
     title = seeker_post.title or "Untitled Request"
     clickable_title = make_clickable_link(title, seeker_url)
 
-    Notification.objects.create(
-        recipient=seeker_post.author,
-        actor=None,
-        verb=f"Your seeker request {clickable_title} was rejected or reverted.",
-        target_object_id=seeker_post.pk,
-        target_content_type="seekerpost",
+    enqueue(
+        "seeker_rejected",
+        seeker_post,
+        notifications=[{
+            "recipient_id": seeker_post.author_id,
+            "verb": f"Your seeker request {clickable_title} was rejected or reverted.",
+        }],
         extra={"link": seeker_url},
     )
-        # 🧹 Remove from board (if it exists there)
-    try:
-        remove_from_board(seeker_post)
-    except Exception as e:
-        print(f"[WARN] Failed to remove post from board: {e}")
 
 
 def notify_seeker_town_approved(seeker_post, town_name):
@@ -0,0 +1,28 @@
+"""
+notifications/links.py
+
+Where a notification points to, worked out once when it's written
+(Notification.link) instead of on every API read.
+"""
+from django.urls import NoReverseMatch, reverse
+
+# target_content_type ("post", "posts.post", ...) → URL name of its detail page
+DETAIL_URL_NAMES = {
+    "post": "post_detail",
+    "seekerpost": "seekers:seeker_detail",
+}
+
+
+def build_link(target_content_type, target_object_id, extra=None):
+    """An explicit extra["link"] from the hook wins; else the target's detail page; else ""."""
+    if extra and extra.get("link"):
+        return extra["link"]
+    if not target_content_type or not target_object_id:
+        return ""
+    url_name = DETAIL_URL_NAMES.get(target_content_type.split(".")[-1])
+    if not url_name:
+        return ""
+    try:
+        return reverse(url_name, args=[target_object_id])
+    except NoReverseMatch:
+        return ""
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:50
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(max_length=50)),
+                ('idempotency_key', models.CharField(max_length=255)),
+                ('target_content_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('target_object_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('cursor', models.BigIntegerField(blank=True, null=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('failed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Notification outbox entry',
+                'verbose_name_plural': 'Notification outbox',
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('failed_at__isnull', True), ('processed_at__isnull', True)), fields=['available_at', 'id'], name='notif_outbox_pending_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('failed_at__isnull', True), ('processed_at__isnull', True)), fields=('idempotency_key',), name='notif_outbox_pending_key_uniq')],
+            },
+        ),
+    ]
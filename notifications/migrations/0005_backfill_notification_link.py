@@ -0,0 +1,34 @@
+from django.db import migrations
+
+from notifications.links import build_link
+
+
+def backfill_notification_link(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+
+    batch = []
+    rows = Notification.objects.filter(link="").only(
+        "id", "target_content_type", "target_object_id", "extra"
+    )
+    for notification in rows.iterator(chunk_size=2000):
+        notification.link = build_link(
+            notification.target_content_type, notification.target_object_id, notification.extra
+        )
+        if notification.link:
+            batch.append(notification)
+        if len(batch) >= 2000:
+            Notification.objects.bulk_update(batch, ["link"])
+            batch = []
+    if batch:
+        Notification.objects.bulk_update(batch, ["link"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_link'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_notification_link, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:58
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_backfill_notification_link'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='coalesce_key',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='group_count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='target_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='notificationpreference',
+            name='digest_mode',
+            field=models.CharField(choices=[('instant', 'As they happen'), ('daily', 'Daily digest')], default='instant', help_text='Daily: follower activity is collected and sent once a day (send_notification_digests).', max_length=10),
+        ),
+        migrations.CreateModel(
+            name='NotificationDigestItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('coalesce_key', models.CharField(max_length=100)),
+                ('verb', models.CharField(max_length=255)),
+                ('group_verb', models.CharField(blank=True, max_length=255)),
+                ('count', models.PositiveIntegerField(default=1)),
+                ('target_content_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('target_ids', models.JSONField(blank=True, default=list)),
+                ('first_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_digest_items', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['recipient', 'first_at'],
+                'constraints': [models.UniqueConstraint(fields=('recipient', 'coalesce_key'), name='notif_digest_item_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:30
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notification_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='notification',
+            options={'ordering': ['-last_event_at'], 'verbose_name': 'Notification', 'verbose_name_plural': 'Notifications'},
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notif_recipient_read_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notif_recipient_page_idx',
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='last_event_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'read', '-last_event_at'], name='notif_recipient_read_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-last_event_at', '-id'], name='notif_recipient_page_idx'),
+        ),
+    ]
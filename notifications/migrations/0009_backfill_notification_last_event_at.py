@@ -0,0 +1,19 @@
+from django.db import migrations
+from django.db.models import F
+
+
+def backfill_last_event_at(apps, schema_editor):
+    # until now coalescing moved created_at forward, so it holds the last event
+    Notification = apps.get_model("notifications", "Notification")
+    Notification.objects.update(last_event_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_notification_last_event_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_last_event_at, migrations.RunPython.noop),
+    ]
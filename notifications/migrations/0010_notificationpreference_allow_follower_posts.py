@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0009_backfill_notification_last_event_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationpreference',
+            name='allow_follower_posts',
+            field=models.BooleanField(default=True, help_text='Receive notifications when someone you follow publishes a post.'),
+        ),
+    ]
@@ -5,6 +5,8 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
+from .links import build_link
+
 User = settings.AUTH_USER_MODEL
 
 class Notification(models.Model):
@@ -44,15 +46,38 @@ class Notification(models.Model):
     # Optional payload for frontend (JSON-serializable: post title, excerpt, etc.)
     extra = models.JSONField(default=dict, blank=True)
 
+    # Precomputed target URL (notifications/links.py), filled on save / bulk write
+    link = models.CharField(max_length=500, blank=True, default="")
+
+    # Coalescing (notifications/coalesce.py): repeated "<event>:<actor>" events
+    # within the window merge into one row; group_count / target_ids say how many.
+    coalesce_key = models.CharField(max_length=100, blank=True, default="")
+    group_count = models.PositiveIntegerField(default=1)
+    target_ids = models.JSONField(default=list, blank=True)
+
     # Read/unread state
     read = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    # When the latest event arrived: created_at, moved forward each time the row
+    # absorbs another event. Lists are ordered (and paged) on this.
+    last_event_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-last_event_at"]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
+        indexes = [
+            # "my notifications" / "my unread notifications", newest first
+            models.Index(fields=["recipient", "read", "-last_event_at"], name="notif_recipient_read_idx"),
+            # the API's keyset pages: (last_event_at, id) within one recipient
+            models.Index(fields=["recipient", "-last_event_at", "-id"], name="notif_recipient_page_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self.link:
+            self.link = build_link(self.target_content_type, self.target_object_id, self.extra)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         """Readable fallback for admin and logs."""
@@ -83,9 +108,17 @@ class Notification(models.Model):
             return f"{actor_name} {verb.replace('_', ' ')}."
 
     def mark_as_read(self):
-        """Mark this notification as read."""
+        """
+        Mark this notification as read. Returns False if it already was; the
+        conditional UPDATE makes sure only one caller decrements the counter.
+        """
+        from .unread import decrement_unread
+
+        updated = Notification.objects.filter(pk=self.pk, read=False).update(read=True)
         self.read = True
-        self.save(update_fields=["read"])
+        if updated:
+            decrement_unread(self.recipient_id)
+        return bool(updated)
 
     @staticmethod
     def notify(recipient, actor, verb, target, extra=None):
@@ -111,21 +144,7 @@ class Notification(models.Model):
 
     def get_target_url(self):
         """Return a direct URL to the notification target if possible."""
-        if not self.target_content_type or not self.target_object_id:
-            return None
-
-        model = self.target_content_type.split(".")[-1]
-        obj_id = self.target_object_id
-
-        # Adjust these names to match your actual URL names
-        if model == "post":
-            return reverse("post_detail", args=[obj_id])
-        elif model == "seekerpost":
-            return reverse("seekerpost_detail", args=[obj_id])
-        elif model == "board":
-            return reverse("board_detail", args=[obj_id])
-
-        return None
+        return self.link or build_link(self.target_content_type, self.target_object_id) or None
     # def get_target_url(self):
     #     """
     #     Return a URL to the target object if supported.
@@ -162,6 +181,10 @@ class NotificationPreference(models.Model):
         default=True,
         help_text="Receive notifications when someone comments on your post."
     )
+    allow_follower_posts = models.BooleanField(
+        default=True,
+        help_text="Receive notifications when someone you follow publishes a post."
+    )
 
     # UI preference (affects frontend display style)
     mode = models.CharField(
@@ -170,9 +193,153 @@ class NotificationPreference(models.Model):
         help_text="Frontend tone: playful, professional, or minimal."
     )
 
+    # Delivery of "someone you follow posted" notifications
+    DIGEST_INSTANT = "instant"
+    DIGEST_DAILY = "daily"
+    DIGEST_CHOICES = [
+        (DIGEST_INSTANT, "As they happen"),
+        (DIGEST_DAILY, "Daily digest"),
+    ]
+    digest_mode = models.CharField(
+        max_length=10,
+        choices=DIGEST_CHOICES,
+        default=DIGEST_INSTANT,
+        help_text="Daily: follower activity is collected and sent once a day (send_notification_digests)."
+    )
+
     class Meta:
         verbose_name = "Notification Preference"
         verbose_name_plural = "Notification Preferences"
 
     def __str__(self):
         return f"NotifPrefs({self.user})"
+
+
+class NotificationDigestItem(models.Model):
+    """
+    Follower activity held back for a daily-digest recipient.
+
+    One row per (recipient, coalesce_key), i.e. per followed actor and event;
+    repeats only bump `count`. send_notification_digests turns a recipient's
+    rows into a single Notification and deletes them.
+    """
+
+    recipient = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="notification_digest_items",
+    )
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    coalesce_key = models.CharField(max_length=100)
+    verb = models.CharField(max_length=255)          # the latest single-event verb
+    group_verb = models.CharField(max_length=255, blank=True)  # "{count} new posts" form
+    count = models.PositiveIntegerField(default=1)
+    target_content_type = models.CharField(max_length=100, null=True, blank=True)
+    target_ids = models.JSONField(default=list, blank=True)
+
+    first_at = models.DateTimeField(default=timezone.now)
+    last_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["recipient", "first_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["recipient", "coalesce_key"], name="notif_digest_item_uniq"),
+        ]
+
+    def __str__(self):
+        return f"Digest({self.recipient_id}): {self.coalesce_key} ×{self.count}"
+
+
+class NotificationArchive(models.Model):
+    """
+    Compact history of pruned notifications: one row per recipient per month
+    (see notifications/retention.py, prune_notifications --archive).
+
+    - notifications: rows deleted for that month
+    - events: what those rows stood for, counting coalesced groups in full
+    """
+
+    recipient = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="notification_archives",
+    )
+    month = models.DateField(help_text="First day of the month the notifications were created in.")
+    notifications = models.PositiveIntegerField(default=0)
+    events = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["recipient", "-month"]
+        verbose_name = "Notification archive"
+        verbose_name_plural = "Notification archive"
+        constraints = [
+            models.UniqueConstraint(fields=["recipient", "month"], name="notif_archive_month_uniq"),
+        ]
+
+    def __str__(self):
+        return f"Archive({self.recipient_id}, {self.month:%Y-%m}): {self.notifications}"
+
+
+class NotificationOutbox(models.Model):
+    """
+    Durable queue of notification work (see notifications/outbox.py).
+
+    The approval/rejection hooks write one row here inside the same transaction
+    as the status change; the process_notification_outbox worker turns it into
+    Notification rows later, fanning out to followers in batches.
+
+    - idempotency_key: enqueuing the same event twice while it's still pending
+      is a no-op (partial unique constraint below).
+    - cursor: fan-out progress, saved in the same transaction as each batch, so
+      a retried row picks up where it stopped instead of notifying twice.
+      None = direct recipients not done yet; otherwise the last follower id sent.
+    """
+
+    event = models.CharField(max_length=50)
+    idempotency_key = models.CharField(max_length=255)
+
+    target_content_type = models.CharField(max_length=100, null=True, blank=True)
+    target_object_id = models.PositiveIntegerField(null=True, blank=True)
+
+    # What to send: {"extra", "notifications": [{recipient_id, actor_id, verb}],
+    #                "followers_of", "follower_actor_id", "follower_verb"}
+    payload = models.JSONField(default=dict, blank=True)
+
+    cursor = models.BigIntegerField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    failed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "Notification outbox entry"
+        verbose_name_plural = "Notification outbox"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["idempotency_key"],
+                condition=models.Q(processed_at__isnull=True, failed_at__isnull=True),
+                name="notif_outbox_pending_key_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["available_at", "id"],
+                condition=models.Q(processed_at__isnull=True, failed_at__isnull=True),
+                name="notif_outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        state = "done" if self.processed_at else "failed" if self.failed_at else "pending"
+        return f"{self.event} ({self.idempotency_key}) – {state}"
@@ -0,0 +1,193 @@
+"""
+notifications/outbox.py
+
+Transactional outbox for notification fan-out.
+
+Hooks call enqueue() inside the request/admin transaction: it's one INSERT, so
+approving a post costs the same whether the author has 0 or 50k followers.
+The process_notification_outbox command drains the table:
+
+- followers are streamed in chunks (notifications/fanout.py), and every chunk
+  commits together with the entry's cursor, so a crash or retry never
+  notifies anybody twice;
+- followers who turned off new-post notifications are dropped in bulk
+  (notifications/preferences.py);
+- follower notifications go through notifications/coalesce.py, which merges
+  repeats into recent unread rows and holds them for daily-digest users;
+- a failing entry is retried with exponential backoff and parked (failed_at)
+  after MAX_ATTEMPTS;
+- rows are claimed with select_for_update(skip_locked=True) plus a lease on
+  available_at, so several workers can run side by side.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .coalesce import coalesce_key, write_grouped
+from .fanout import iter_follower_id_chunks
+from .links import build_link
+from .models import Notification, NotificationOutbox
+from .preferences import CATEGORY_FOLLOWER_POSTS, allowed_recipients
+from .pubsub import publish
+from .unread import bump_unread
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30
+LEASE_SECONDS = 300  # how long a claimed entry stays hidden from other workers
+
+
+def enqueue(event, target, notifications=(), followers_of=None, follower_actor_id=None,
+            follower_verb="", follower_group_verb="", extra=None, key=None):
+    """
+    Queue notifications about `target` (a Post/SeekerPost, stored like
+    Notification.target_*). `notifications` are direct recipients:
+    dicts with recipient_id, actor_id (optional) and verb. `followers_of` is a
+    user id whose followers all get `follower_verb`; when several such events
+    coalesce, the row's verb becomes `follower_group_verb` with "{count}" filled in.
+
+    Enqueuing the same key again while the first entry is still pending is
+    ignored. The default key is "<event>:<content type>:<pk>".
+    """
+    content_type = target._meta.model_name
+    key = key or f"{event}:{content_type}:{target.pk}"
+    NotificationOutbox.objects.bulk_create([
+        NotificationOutbox(
+            event=event,
+            idempotency_key=key,
+            target_content_type=content_type,
+            target_object_id=target.pk,
+            payload={
+                "extra": extra or {},
+                "notifications": list(notifications),
+                "followers_of": followers_of,
+                "follower_actor_id": follower_actor_id,
+                "follower_verb": follower_verb,
+                "follower_group_verb": follower_group_verb,
+            },
+        )
+    ], ignore_conflicts=True)
+
+
+def _notification(entry, recipient_id, actor_id, verb, link, key=""):
+    # bulk_create skips Notification.save(), so the link is filled in here
+    return Notification(
+        recipient_id=recipient_id,
+        actor_id=actor_id,
+        verb=verb,
+        target_content_type=entry.target_content_type,
+        target_object_id=entry.target_object_id,
+        extra=entry.payload.get("extra") or {},
+        link=link,
+        coalesce_key=key,
+    )
+
+
+def _claim(entry_id):
+    """
+    Take the entry if it's still due: pushing available_at out by LEASE_SECONDS
+    hides it from other workers while this one fans it out.
+    """
+    with transaction.atomic():
+        entry = (
+            NotificationOutbox.objects.select_for_update(skip_locked=True)
+            .filter(
+                pk=entry_id, processed_at__isnull=True, failed_at__isnull=True,
+                available_at__lte=timezone.now(),
+            )
+            .first()
+        )
+        if entry is not None:
+            entry.available_at = timezone.now() + timedelta(seconds=LEASE_SECONDS)
+            entry.save(update_fields=["available_at"])
+        return entry
+
+
+def _commit_batch(entry, notifications, cursor, group_verb=None):
+    """
+    Write one batch and the entry's new cursor atomically (and renew the lease).
+    group_verb=None writes the rows as they are; a string coalesces them
+    (follower batches, see coalesce.write_grouped).
+    """
+    with transaction.atomic():
+        if group_verb is None:
+            created, merged = Notification.objects.bulk_create(notifications), []
+        else:
+            created, merged = write_grouped(notifications, group_verb)
+        bump_unread([n.recipient_id for n in created])
+        written = created + merged
+        if written:
+            transaction.on_commit(lambda: publish(written))
+        entry.cursor = cursor
+        entry.available_at = timezone.now() + timedelta(seconds=LEASE_SECONDS)
+        entry.save(update_fields=["cursor", "available_at"])
+
+
+def process_entry(entry_id, batch_size=1000):
+    """
+    Work one outbox entry to completion, one committed batch at a time.
+    Returns "done", "retry", "failed" or None (already taken/finished).
+    """
+    entry = _claim(entry_id)
+    if entry is None:
+        return None
+
+    try:
+        payload = entry.payload
+        link = build_link(entry.target_content_type, entry.target_object_id, payload.get("extra"))
+        if entry.cursor is None:
+            _commit_batch(entry, [
+                _notification(entry, n["recipient_id"], n.get("actor_id"), n["verb"], link)
+                for n in payload.get("notifications", [])
+            ], cursor=0)
+
+        if payload.get("followers_of"):
+            actor_id = payload.get("follower_actor_id")
+            key = coalesce_key(entry.event, actor_id)
+            chunks = iter_follower_id_chunks(
+                payload["followers_of"], chunk_size=batch_size, after=entry.cursor
+            )
+            for follower_ids in chunks:
+                recipient_ids = allowed_recipients(follower_ids, CATEGORY_FOLLOWER_POSTS)
+                _commit_batch(entry, [
+                    _notification(entry, follower_id, actor_id, payload["follower_verb"], link, key)
+                    for follower_id in recipient_ids
+                ], cursor=follower_ids[-1], group_verb=payload.get("follower_group_verb") or "")
+
+        entry.processed_at = timezone.now()
+        entry.save(update_fields=["processed_at"])
+        return "done"
+    except Exception as e:
+        return _record_failure(entry_id, e)
+
+
+def _record_failure(entry_id, error):
+    entry = NotificationOutbox.objects.filter(pk=entry_id).first()
+    if entry is None:
+        return None
+    entry.attempts += 1
+    entry.last_error = f"{error.__class__.__name__}: {error}"
+    if entry.attempts >= MAX_ATTEMPTS:
+        entry.failed_at = timezone.now()
+        status = "failed"
+    else:
+        entry.available_at = timezone.now() + timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (entry.attempts - 1))
+        status = "retry"
+    entry.save(update_fields=["attempts", "last_error", "available_at", "failed_at"])
+    print(f"[WARN] Notification outbox entry {entry_id} ({status}): {entry.last_error}")
+    return status
+
+
+def process_outbox(limit=100, batch_size=1000):
+    """Drain up to `limit` due entries. Returns {"done": n, "retry": n, "failed": n}."""
+    stats = {"done": 0, "retry": 0, "failed": 0}
+    due = list(
+        NotificationOutbox.objects.filter(
+            processed_at__isnull=True, failed_at__isnull=True, available_at__lte=timezone.now()
+        ).order_by("available_at", "id").values_list("id", flat=True)[:limit]
+    )
+    for entry_id in due:
+        status = process_entry(entry_id, batch_size=batch_size)
+        if status:
+            stats[status] += 1
+    return stats
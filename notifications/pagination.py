@@ -0,0 +1,59 @@
+"""
+notifications/pagination.py
+
+DRF pagination for NotificationListView on top of posts.pagination.keyset_page:
+pages are cut on (last_event_at, id), newest first, so the bell only ever loads
+one page and "older" is the same index scan however far back you go.
+last_event_at rather than created_at because coalescing moves a grouped row
+back to the top; created_at never changes.
+
+Response: {"next": <url or null>, "results": [...]}
+"""
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from posts.pagination import keyset_page
+
+
+class NotificationCursorPagination(BasePagination):
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        rows, self.next_cursor = keyset_page(
+            queryset,
+            cursor=request.query_params.get(self.cursor_query_param),
+            page_size=self.get_page_size(request),
+            field="last_event_at",
+        )
+        return rows
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,134 @@
+"""
+notifications/preferences.py
+
+Batched, cached NotificationPreference lookups for the notification paths.
+
+resolve_preferences(user_ids) answers for a whole recipient set with at most
+one query (for the ids not already cached); users without a preference row get
+DEFAULT_PREFERENCES. Answers are kept in a per-process LRU:
+
+- saving or deleting a NotificationPreference drops that user's entry
+  (receivers in notifications.signals);
+- entries also expire after PREFS_CACHE_TTL seconds, which bounds how stale
+  another process (or a queryset.update()) can leave them.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+
+from .models import NotificationPreference
+
+PREFS_CACHE_SIZE = 10000
+PREFS_CACHE_TTL = 300  # seconds
+
+# categories a notification can belong to → the preference flag that gates it
+CATEGORY_NEW_POSTS = "new_posts"
+CATEGORY_COMMENTS = "comments"
+CATEGORY_FOLLOWER_POSTS = "follower_posts"
+CATEGORY_FLAGS = {
+    CATEGORY_NEW_POSTS: "allow_global_posts",
+    CATEGORY_COMMENTS: "allow_comments",
+    CATEGORY_FOLLOWER_POSTS: "allow_follower_posts",
+}
+
+Preferences = namedtuple(
+    "Preferences", ["allow_global_posts", "allow_comments", "allow_follower_posts", "digest_mode", "mode"]
+)
+DEFAULT_PREFERENCES = Preferences(
+    allow_global_posts=True,
+    allow_comments=True,
+    allow_follower_posts=True,
+    digest_mode=NotificationPreference.DIGEST_INSTANT,
+    mode="playful",
+)
+
+
+class _PreferenceCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # user id → (expires_at, Preferences)
+
+    @property
+    def max_size(self):
+        return getattr(settings, "NOTIFICATION_PREFS_CACHE_SIZE", PREFS_CACHE_SIZE)
+
+    def get_many(self, user_ids):
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for pk in user_ids:
+                entry = self._entries.get(pk)
+                if entry is None:
+                    continue
+                if entry[0] < now:
+                    del self._entries[pk]
+                    continue
+                self._entries.move_to_end(pk)
+                found[pk] = entry[1]
+        return found
+
+    def set_many(self, values):
+        expires_at = time.monotonic() + PREFS_CACHE_TTL
+        with self._lock:
+            for pk, prefs in values.items():
+                self._entries[pk] = (expires_at, prefs)
+                self._entries.move_to_end(pk)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = _PreferenceCache()
+
+
+def resolve_preferences(user_ids):
+    """{user_id: Preferences} for every id given; one query at most."""
+    user_ids = set(user_ids)
+    found = _cache.get_many(user_ids)
+    missing = user_ids - found.keys()
+    if missing:
+        loaded = {pk: DEFAULT_PREFERENCES for pk in missing}
+        rows = NotificationPreference.objects.filter(user_id__in=missing).values_list(
+            "user_id", *Preferences._fields
+        )
+        for user_id, *values in rows:
+            loaded[user_id] = Preferences(*values)
+        _cache.set_many(loaded)
+        found.update(loaded)
+    return found
+
+
+def resolve_preference(user_id):
+    return resolve_preferences([user_id])[user_id]
+
+
+def allowed_recipients(user_ids, category):
+    """The ids (order kept) whose preferences allow notifications of `category`."""
+    user_ids = list(user_ids)
+    flag = CATEGORY_FLAGS.get(category)
+    if not flag or not user_ids:
+        return user_ids
+    prefs = resolve_preferences(user_ids)
+    return [pk for pk in user_ids if getattr(prefs[pk], flag)]
+
+
+def digest_recipient_ids(user_ids):
+    prefs = resolve_preferences(user_ids)
+    return {pk for pk, p in prefs.items() if p.digest_mode == NotificationPreference.DIGEST_DAILY}
+
+
+def invalidate_preferences(user_id=None):
+    """Drop one user's cached preferences, or everything when user_id is None."""
+    if user_id is None:
+        _cache.clear()
+    else:
+        _cache.discard(user_id)
@@ -0,0 +1,158 @@
+"""
+notifications/pubsub.py
+
+Pub/sub feeding the live notification stream (views.notification_stream).
+
+publish() is called from ordinary sync code (signals, the outbox worker) once
+the notification rows are committed; listen() is an async generator consumed
+by the SSE view. Two brokers, picked with settings.NOTIFICATION_BROKER:
+
+- "memory" (default): subscribers live in this process, messages are handed
+  to their event loop with call_soon_threadsafe. Zero infrastructure, but
+  only reaches clients connected to the same process as the publisher.
+- "cache": a stand-in for a real broker when web and worker processes are
+  separate. Messages go into the shared cache (Redis when REDIS_URL is set) as
+  a short per-user log; listeners poll their own log every POLL_SECONDS.
+  Only users with an open stream (presence key) are written to.
+"""
+import asyncio
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+
+POLL_SECONDS = 1.0
+HEARTBEAT_SECONDS = 15.0
+LOG_TTL = 120        # seconds a message stays readable in the cache broker
+PRESENCE_TTL = 60    # seconds a stream counts as connected without refresh
+
+
+class MemoryBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # user id → {(loop, queue)}
+
+    def online(self, user_ids):
+        with self._lock:
+            return {pk for pk in user_ids if self._subscribers.get(pk)}
+
+    def publish_many(self, messages):
+        for user_id, payload in messages:
+            with self._lock:
+                targets = list(self._subscribers.get(user_id, ()))
+            for loop, queue in targets:
+                loop.call_soon_threadsafe(queue.put_nowait, payload)
+
+    async def listen(self, user_id):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        subscriber = (loop, queue)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscriber)
+        try:
+            yield None  # subscribed
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield None  # heartbeat
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(user_id)
+                if subscribers:
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._subscribers[user_id]
+
+
+class CacheBroker:
+    @staticmethod
+    def _seq_key(user_id):
+        return f"notif:stream:seq:{user_id}"
+
+    @staticmethod
+    def _msg_key(user_id, seq):
+        return f"notif:stream:msg:{user_id}:{seq}"
+
+    @staticmethod
+    def _presence_key(user_id):
+        return f"notif:stream:online:{user_id}"
+
+    def online(self, user_ids):
+        keys = {self._presence_key(pk): pk for pk in user_ids}
+        return {keys[key] for key in cache.get_many(list(keys))}
+
+    def publish_many(self, messages):
+        entries = {}
+        for user_id, payload in messages:
+            seq_key = self._seq_key(user_id)
+            cache.add(seq_key, 0, None)
+            entries[self._msg_key(user_id, cache.incr(seq_key))] = payload
+        if entries:
+            cache.set_many(entries, LOG_TTL)
+
+    async def listen(self, user_id):
+        seq_key, presence_key = self._seq_key(user_id), self._presence_key(user_id)
+        await cache.aset(presence_key, 1, PRESENCE_TTL)
+        seen = await cache.aget(seq_key, 0)
+        yield None  # subscribed
+        last_beat = time.monotonic()
+        while True:
+            await cache.aset(presence_key, 1, PRESENCE_TTL)
+            latest = await cache.aget(seq_key, 0)
+            if latest > seen:
+                keys = [self._msg_key(user_id, seq) for seq in range(seen + 1, latest + 1)]
+                found = await cache.aget_many(keys)
+                seen = latest
+                for key in keys:
+                    if key in found:
+                        yield found[key]
+                last_beat = time.monotonic()
+            elif time.monotonic() - last_beat >= HEARTBEAT_SECONDS:
+                last_beat = time.monotonic()
+                yield None  # heartbeat
+            await asyncio.sleep(POLL_SECONDS)
+
+
+_brokers = {"memory": MemoryBroker, "cache": CacheBroker}
+_broker = None
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        name = getattr(settings, "NOTIFICATION_BROKER", None) or "memory"
+        _broker = _brokers[name]()
+    return _broker
+
+
+def publish(notifications):
+    """
+    Push freshly committed Notification rows to their recipients' open streams.
+    Call after commit (transaction.on_commit); only online recipients are serialized.
+    """
+    from .serializers import NotificationSerializer
+
+    try:
+        broker = get_broker()
+        online = broker.online({n.recipient_id for n in notifications})
+        notifications = [n for n in notifications if n.recipient_id in online]
+        if not notifications:
+            return
+        prefetch_related_objects(notifications, "actor")
+        broker.publish_many([
+            (n.recipient_id, NotificationSerializer(n).data) for n in notifications
+        ])
+    except Exception as e:
+        # live push is best effort; the rows are committed either way
+        print(f"[WARN] Failed to publish notifications: {e}")
+
+
+def listen(user_id):
+    """
+    Async iterator of notification payloads for user_id. None is a heartbeat;
+    the first item is always None, once the subscription is in place.
+    """
+    return get_broker().listen(user_id)
@@ -0,0 +1,122 @@
+"""
+notifications/retention.py
+
+Pruning of old read notifications (prune_notifications command).
+
+The table is walked in primary-key ranges of chunk_size ids, one short
+transaction per range, so a run over millions of rows never holds long locks
+and can be stopped and restarted at any point. Unread notifications are never
+touched, so the unread counter needs no adjustment; each range is removed with
+one plain DELETE, without loading the rows or sending post_delete per row
+(nothing references Notification, so there is nothing to cascade either).
+
+With archive=True each range is first rolled up into NotificationArchive
+(per recipient, per month of the last event, the same timestamp the rows are
+selected by) in the same transaction as the delete.
+"""
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import Notification, NotificationArchive
+
+DEFAULT_RETENTION_DAYS = 90
+
+
+@dataclass
+class PruneResult:
+    deleted: int = 0
+    archived: int = 0  # archive rows created or updated
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.deleted / self.seconds if self.seconds else float(self.deleted)
+
+
+def retention_cutoff(days=None):
+    if days is None:
+        days = getattr(settings, "NOTIFICATION_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+    return timezone.now() - timedelta(days=days)
+
+
+def prunable(cutoff):
+    return Notification.objects.filter(read=True, last_event_at__lt=cutoff)
+
+
+def prune_notifications(days=None, chunk_size=5000, archive=False, dry_run=False, pause=0.0, on_chunk=None):
+    """
+    Delete read notifications older than `days` (default
+    settings.NOTIFICATION_RETENTION_DAYS). dry_run only counts.
+    `pause` sleeps between ranges to leave room for other writers;
+    on_chunk(result) is called after each range that deleted something.
+    """
+    cutoff = retention_cutoff(days)
+    result = PruneResult()
+    started = time.monotonic()
+
+    if dry_run:
+        result.deleted = prunable(cutoff).count()
+        return result
+
+    bounds = prunable(cutoff).aggregate(low=Min("id"), high=Max("id"))
+    if bounds["low"] is None:
+        return result
+
+    for start in range(bounds["low"], bounds["high"] + 1, chunk_size):
+        with transaction.atomic():
+            rows = prunable(cutoff).filter(id__gte=start, id__lt=start + chunk_size)
+            if archive:
+                result.archived += _archive(rows)
+            deleted = rows._raw_delete(rows.db)
+        result.chunks += 1
+        if deleted:
+            result.deleted += deleted
+            result.seconds = time.monotonic() - started
+            if on_chunk:
+                on_chunk(result)
+        if pause:
+            time.sleep(pause)
+
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def _archive(rows):
+    """Add rows' per-recipient, per-month totals to NotificationArchive. Returns rows touched."""
+    totals = {
+        (row["recipient_id"], row["month"].date()): (row["notifications"], row["events"] or 0)
+        for row in rows.annotate(month=TruncMonth("last_event_at"))
+        .values("recipient_id", "month")
+        .annotate(notifications=Count("id"), events=Sum("group_count"))
+        .order_by()
+    }
+    if not totals:
+        return 0
+
+    existing = NotificationArchive.objects.select_for_update().filter(
+        recipient_id__in={recipient_id for recipient_id, _ in totals},
+        month__in={month for _, month in totals},
+    )
+    now = timezone.now()
+    updated = []
+    for entry in existing:
+        added = totals.pop((entry.recipient_id, entry.month), None)
+        if added:
+            entry.notifications += added[0]
+            entry.events += added[1]
+            entry.updated_at = now  # bulk_update skips auto_now
+            updated.append(entry)
+    NotificationArchive.objects.bulk_update(updated, ["notifications", "events", "updated_at"])
+    NotificationArchive.objects.bulk_create([
+        NotificationArchive(recipient_id=recipient_id, month=month, notifications=count, events=events)
+        for (recipient_id, month), (count, events) in totals.items()
+    ])
+    return len(updated) + len(totals)
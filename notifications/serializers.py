@@ -4,8 +4,11 @@ from .models import Notification
 
 
 class NotificationSerializer(serializers.ModelSerializer):
+    """
+    Pass fields=[...] (or ?fields=id,verb,read on the list API) for a sparse
+    response; unknown names are ignored, and no valid name means all fields.
+    """
     actor = serializers.SerializerMethodField()
-    link = serializers.SerializerMethodField()
 
     class Meta:
         model = Notification
@@ -15,26 +18,23 @@ class NotificationSerializer(serializers.ModelSerializer):
             "verb",
             "read",
             "created_at",
+            "last_event_at",
             "extra",
             "link",
+            "group_count",
+            "target_ids",
         ]
+        read_only_fields = ["link", "group_count", "target_ids"]
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            wanted = set(fields) & set(self.fields)
+            if wanted:
+                for name in set(self.fields) - wanted:
+                    self.fields.pop(name)
 
     def get_actor(self, obj):
         if obj.actor:
             return obj.actor.username
         return "System"
-
-    def get_link(self, obj):
-        # Prefer the explicit link in 'extra' if provided by the hook
-        if obj.extra and "link" in obj.extra:
-            return obj.extra["link"]
-
-        # Otherwise, try building it from target info
-        if obj.target_content_type == "post" and obj.target_object_id:
-            from django.urls import reverse
-            try:
-                return reverse("post_detail", args=[obj.target_object_id])
-            except Exception:
-                pass
-
-        return None
@@ -5,20 +5,31 @@ Handles automatic notification creation for key events:
 1. When a Post or SeekerPost transitions from 'pending' → 'approved'
 2. When a Post or SeekerPost receives a comment (only if approved)
 3. Synchronization with the Board model on approval/reversion
+4. Feed cache invalidation (posts/feed_cache.py) on approve / reject / expire / delete
+5. The per-user unread notification counter (notifications/unread.py)
+   and the preference cache (notifications/preferences.py)
+6. Live push of new notifications to open streams (notifications/pubsub.py)
 """
 
 from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import Q
 
-from .models import Notification
+from .models import Notification, NotificationPreference
 from posts.models import Post
 from seekers.models import SeekerPost
 from comment.models import Comment
 from board.models import Board
 from .utils import remove_from_board
+from .unread import bump_unread, decrement_unread
+from .preferences import (
+    CATEGORY_COMMENTS, CATEGORY_NEW_POSTS, allowed_recipients, invalidate_preferences,
+)
+from .pubsub import publish
+from posts.feed_cache import invalidate_post_feeds
 from notifications.hooks.post_notifications import notify_post_approved, notify_post_rejected
 from notifications.hooks.seekers_notifications import notify_seeker_approved, notify_seeker_rejected
 
@@ -44,17 +55,24 @@ def add_to_board(instance, title_field):
     )
 
 
+def preference_category(verb):
+    """Which NotificationPreference flag gates a verb (None = always sent)."""
+    verb = (verb or "").lower()
+    if verb in ["post_published", "seeker_post_published"]:
+        return CATEGORY_NEW_POSTS
+    if verb.startswith("commented"):
+        return CATEGORY_COMMENTS
+    return None
+
+
 def create_notification_instance(recipient, actor, verb, target=None, extra=None):
     """Safely creates a notification with optional user preference checks."""
     if not recipient:
         return None
 
-    prefs = getattr(recipient, "notification_preferences", None)
-    if prefs:
-        if verb in ["post_published", "seeker_post_published"] and not prefs.allow_global_posts:
-            return None
-        if verb == "commented" and not prefs.allow_comments:
-            return None
+    category = preference_category(verb)
+    if category and not allowed_recipients([recipient.pk], category):
+        return None
 
     payload = {
         "recipient": recipient,
@@ -72,29 +90,38 @@ def create_notification_instance(recipient, actor, verb, target=None, extra=None
     return Notification.objects.create(**payload)
 
 
+def sync_feed_cache(instance):
+    """
+    Drop cached feed pages the post entered or left: approved, rejected/expired,
+    or still approved but moved to another audience (location/scope edit).
+    """
+    prev_status = getattr(instance, "_prev_status", "pending")
+    prev_key = getattr(instance, "_prev_audience_key", None)
+    was_live, is_live = prev_status == "approved", instance.status == "approved"
+
+    if was_live != is_live or (is_live and prev_key != instance.audience_key):
+        invalidate_post_feeds(instance, prev_key)
+
+
 # ----------------------------------------------------------------------
 # PRE-SAVE HOOKS (Track old status)
 # ----------------------------------------------------------------------
 @receiver(pre_save, sender=Post)
 def attach_prev_status_post(sender, instance, **kwargs):
+    instance._prev_status, instance._prev_audience_key = "pending", None
     if instance.pk:
-        try:
-            instance._prev_status = sender.objects.get(pk=instance.pk).status
-        except sender.DoesNotExist:
-            instance._prev_status = "pending"
-    else:
-        instance._prev_status = "pending"
+        prev = sender.objects.filter(pk=instance.pk).values_list("status", "audience_key").first()
+        if prev:
+            instance._prev_status, instance._prev_audience_key = prev
 
 
 @receiver(pre_save, sender=SeekerPost)
 def attach_prev_status_seeker(sender, instance, **kwargs):
+    instance._prev_status, instance._prev_audience_key = "pending", None
     if instance.pk:
-        try:
-            instance._prev_status = sender.objects.get(pk=instance.pk).status
-        except sender.DoesNotExist:
-            instance._prev_status = "pending"
-    else:
-        instance._prev_status = "pending"
+        prev = sender.objects.filter(pk=instance.pk).values_list("status", "audience_key").first()
+        if prev:
+            instance._prev_status, instance._prev_audience_key = prev
 
 
 # ----------------------------------------------------------------------
@@ -112,6 +139,8 @@ def notify_on_post_approval(sender, instance, created, **kwargs):
     elif not created and prev == "approved" and instance.status != "approved":
         notify_post_rejected(instance)
 
+    sync_feed_cache(instance)
+
 @receiver(post_save, sender=SeekerPost)
 
 def notify_on_seeker_post_approval(sender, instance, created, **kwargs):
@@ -128,6 +157,18 @@ def notify_on_seeker_post_approval(sender, instance, created, **kwargs):
     elif not created and prev == "approved" and instance.status != "approved":
         notify_seeker_rejected(instance)
 
+    sync_feed_cache(instance)
+
+
+# ----------------------------------------------------------------------
+# FEED CACHE: deleted posts leave their audience's cached pages
+# ----------------------------------------------------------------------
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=SeekerPost)
+def invalidate_feeds_on_delete(sender, instance, **kwargs):
+    if instance.status == "approved":
+        invalidate_post_feeds(instance)
+
 
 # # ----------------------------------------------------------------------
 # # DELETE CLEANUP
@@ -142,6 +183,29 @@ def notify_on_seeker_post_approval(sender, instance, created, **kwargs):
 #     remove_from_board(instance)
 
 
+# ----------------------------------------------------------------------
+# UNREAD COUNTER (notifications/unread.py)
+# ----------------------------------------------------------------------
+@receiver(post_save, sender=Notification)
+def count_new_unread_notification(sender, instance, created, **kwargs):
+    if created and not instance.read:
+        bump_unread([instance.recipient_id])
+    if created:
+        transaction.on_commit(lambda: publish([instance]))
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_deleted_unread_notification(sender, instance, **kwargs):
+    if not instance.read:
+        decrement_unread(instance.recipient_id)
+
+
+@receiver(post_save, sender=NotificationPreference)
+@receiver(post_delete, sender=NotificationPreference)
+def drop_cached_preferences(sender, instance, **kwargs):
+    invalidate_preferences(instance.user_id)
+
+
 # ----------------------------------------------------------------------
 # COMMENT NOTIFICATIONS
 # ----------------------------------------------------------------------
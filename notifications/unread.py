@@ -0,0 +1,57 @@
+"""
+notifications/unread.py
+
+Denormalized unread counter: CustomUser.unread_notification_count.
+
+The badge reads the counter straight off request.user instead of running
+COUNT(*) over the notifications table on every page. Every path that creates,
+reads or deletes a notification keeps it in step with single UPDATEs:
+
+- Notification.objects.create()      → post_save in notifications.signals
+- bulk_create (outbox fan-out)       → bump_unread() by the caller
+- mark_read / mark_as_read / delete  → decrement_unread()
+- MarkAllReadView                    → decrement_unread(by the rows it marked)
+
+recount_unread() rebuilds it from the (recipient, read, last_event_at) index if
+it ever drifts.
+"""
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+
+def bump_unread(recipient_ids):
+    """+1 for every occurrence of a recipient id (one UPDATE per distinct increment)."""
+    User = get_user_model()
+    by_amount = {}
+    for recipient_id, amount in Counter(recipient_ids).items():
+        by_amount.setdefault(amount, []).append(recipient_id)
+    for amount, ids in by_amount.items():
+        User.objects.filter(id__in=ids).update(
+            unread_notification_count=F("unread_notification_count") + amount
+        )
+
+
+def decrement_unread(recipient_id, amount=1):
+    get_user_model().objects.filter(id=recipient_id).update(
+        unread_notification_count=Greatest(F("unread_notification_count") - amount, 0)
+    )
+
+
+def recount_unread(users=None):
+    """Recompute the counter from the notifications table (all users, or a queryset)."""
+    from .models import Notification
+
+    User = get_user_model()
+    users = users if users is not None else User.objects.all()
+    users.update(unread_notification_count=0)
+    counted = (
+        Notification.objects.filter(read=False, recipient__in=users)
+        .values_list("recipient_id")
+        .annotate(unread=Count("id"))
+        .order_by()
+    )
+    for recipient_id, unread in counted.iterator():
+        User.objects.filter(id=recipient_id).update(unread_notification_count=unread)
@@ -2,7 +2,7 @@
 # file: notifications/urls.py
 # -------------------------
 from django.urls import path
-from .views import NotificationListView, MarkAllReadView, mark_read, NotificationPageView
+from .views import NotificationListView, MarkAllReadView, mark_read, unread_count, notification_stream, NotificationPageView
 
 app_name = "notifications" 
 
@@ -12,4 +12,6 @@ urlpatterns = [
     path("mark-all-read/", MarkAllReadView.as_view(), name="notifications-mark-all-read"),
     # path("prefs/", NotificationPreferenceView.as_view(), name="notifications-prefs"),
     path("<int:pk>/read/", mark_read, name="notifications-mark-read"),
+    path("unread-count/", unread_count, name="notifications-unread-count"),
+    path("stream/", notification_stream, name="notifications-stream"),          #live SSE
 ]
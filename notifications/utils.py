@@ -2,30 +2,26 @@ from django.apps import apps
 from django.db import transaction
 from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
-from board.models import Board
+from board.models import Board, BoardEntry
+from board.widget_cache import invalidate_board_widget
 
 def remove_from_board(obj):
     """
     Safely remove a Post or SeekerPost instance from any board it was previously added to.
-    Handles both 'posts' and 'seeker_posts'.
+    Two DELETEs on indexed columns (its M2M rows of its own type, its board
+    entries), whatever the number of boards.
     """
     try:
-        for board in Board.objects.all():
-            removed = False
+        through, column = Board.membership(obj)
+        removed, _ = through.objects.filter(**{column: obj.pk}).delete()
+        entries, _ = BoardEntry.objects.filter(
+            content_type=ContentType.objects.get_for_model(obj.__class__), object_id=obj.pk
+        ).delete()
+        if entries:
+            invalidate_board_widget()
 
-            # Remove from normal posts board
-            if board.posts.filter(pk=obj.pk).exists():
-                board.posts.remove(obj)
-                removed = True
-
-            # Remove from seekers board
-            if board.seeker_posts.filter(pk=obj.pk).exists():
-                board.seeker_posts.remove(obj)
-                removed = True
-
-            if removed:
-                board.save()
-                print(f"[INFO] Removed {obj.__class__.__name__} {obj.pk} from board '{board.name}'")
+        if removed:
+            print(f"[INFO] Removed {obj.__class__.__name__} {obj.pk} from {removed} board(s)")
 
     except Exception as e:
         print(f"[WARN] Failed to remove {obj.__class__.__name__} {getattr(obj, 'pk', '?')} from board: {e}")
@@ -1,12 +1,25 @@
 # notifications/views.py
+import json
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.db.models import Q
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 
 from .models import Notification, NotificationPreference
+from .pagination import NotificationCursorPagination
 from .serializers import NotificationSerializer
+from .pubsub import listen
+from .unread import decrement_unread
+
+User = get_user_model()
 
 from django.views.generic import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -25,6 +38,11 @@ class NotificationListView(generics.ListAPIView):
     Query params:
       - filter=relevant   -> returns only relevant notifications.
       - unread=true       -> only unread notifications.
+      - cursor=...        -> next page (take it from "next"; pages are keyset, see pagination.py)
+      - page_size=N       -> rows per page (default 20, max 100)
+      - fields=id,verb    -> sparse response with just these fields
+
+    Response: {"next": <url or null>, "results": [...]}, newest first.
 
     Each notification includes:
       - actor: username or 'System'
@@ -34,6 +52,17 @@ class NotificationListView(generics.ListAPIView):
     """
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
+
+    @property
+    def requested_fields(self):
+        raw = self.request.query_params.get("fields", "")
+        known = NotificationSerializer.Meta.fields
+        return [name for name in (part.strip() for part in raw.split(",")) if name in known]
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.requested_fields)
+        return super().get_serializer(*args, **kwargs)
 
     def get_queryset(self):
         user = self.request.user
@@ -52,7 +81,10 @@ class NotificationListView(generics.ListAPIView):
                 | Q(target_content_type__icontains="seekerpost", target_object_id__isnull=False)
             )
 
-        return qs.select_related("actor").order_by("-created_at")
+        fields = self.requested_fields
+        if not fields or "actor" in fields:
+            qs = qs.select_related("actor")
+        return qs.order_by("-last_event_at", "-id")
 
 class MarkAllReadView(generics.GenericAPIView):
     """
@@ -64,7 +96,10 @@ class MarkAllReadView(generics.GenericAPIView):
     def post(self, request, *args, **kwargs):
         user = request.user
         unread_qs = Notification.objects.filter(recipient=user, read=False)
-        updated_count = unread_qs.update(read=True)
+        with transaction.atomic():
+            updated_count = unread_qs.update(read=True)
+            # by what was actually marked: rows created meanwhile stay counted
+            decrement_unread(user.pk, updated_count)
         return Response({"marked": updated_count}, status=status.HTTP_200_OK)
 
 
@@ -90,14 +125,67 @@ def mark_read(request, pk):
     """
     notif = get_object_or_404(Notification, id=pk, recipient=request.user)
 
-    if notif.read:
+    if not notif.mark_as_read():
         return Response({"status": "already_read"}, status=status.HTTP_200_OK)
-
-    notif.read = True
-    notif.save(update_fields=["read"])
     return Response({"status": "ok"}, status=status.HTTP_200_OK)
 
 
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def unread_count(request):
+    """
+    Unread badge count (GET), read from the denormalized counter on the user.
+    URL: /notifications/unread-count/
+    """
+    return Response({"unread": request.user.unread_notification_count}, status=status.HTTP_200_OK)
+
+
+async def notification_stream(request):
+    """
+    Server-Sent Events stream of new notifications for the logged-in user.
+    URL: /notifications/stream/  (needs an ASGI server to hold many streams open)
+
+    Events: one "unread" event on connect, then a "notification" event per
+    new notification (same JSON as NotificationListView), plus keep-alive
+    comments while idle. The stream ends after NOTIFICATION_STREAM_MAX_SECONDS
+    and the browser reconnects, so no connection is held forever.
+
+    Off unless settings.NOTIFICATION_STREAM is set, and never served through
+    WSGI, where every open stream would pin a worker: both answer 204, which
+    tells EventSource not to reconnect (the script falls back to polling).
+    """
+    if not settings.NOTIFICATION_STREAM or "wsgi.version" in request.META:
+        return HttpResponse(status=204)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return HttpResponse(status=401)
+
+    async def events():
+        subscribed = False
+        deadline = time.monotonic() + settings.NOTIFICATION_STREAM_MAX_SECONDS
+        async for payload in listen(user.pk):
+            if time.monotonic() >= deadline:
+                return  # closing the generator unsubscribes; EventSource reconnects
+            if payload is None and not subscribed:
+                # read the counter only now, so nothing can slip in between
+                subscribed = True
+                unread = await User.objects.filter(pk=user.pk).values_list(
+                    "unread_notification_count", flat=True
+                ).aget()
+                yield f"event: unread\ndata: {json.dumps({'unread': unread})}\n\n"
+                continue
+            if payload is None:
+                yield ": keep-alive\n\n"
+                continue
+            data = json.dumps(payload, cls=DjangoJSONEncoder)
+            yield f"id: {payload['id']}\nevent: notification\ndata: {data}\n\n"
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # don't let nginx buffer the stream
+    return response
+
+
 # we are adding this to work with the notification listview, thats because the list view at the top returns json and therefore we need another that will get those json information and put out to us in a html or javascript format so that its readerable and useable in the frontend to users
 class NotificationPageView(LoginRequiredMixin, TemplateView):
     template_name = "notifications/notification_page.html"
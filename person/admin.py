@@ -5,6 +5,7 @@ from django.core.mail import send_mail
 
 from .models import Person, Availability, PendingLocationRequest
 from custom_search.models import Continent, Country, State, Town
+from custom_search.towns import ingest_pending_requests
 from . import emails
 
 # ✅ notification hooks imported here instead of accounts/admin.py
@@ -132,34 +133,18 @@ class PendingLocationRequestAdmin(admin.ModelAdmin):
     def approve_pending_towns(self, request, queryset):
         approved_count, skipped_count = 0, 0
 
-        for pending in queryset.filter(is_reviewed=False, approved=False):
-            typed_town = pending.typed_town
-            parent_state = pending.parent_state
+        pending_requests = list(
+            queryset.filter(is_reviewed=False, approved=False).select_related("person__user")
+        )
+        # 🏘 Create every missing town in one go (block-allocated ids, de-duplicated)
+        _, towns = ingest_pending_requests(pending_requests)
 
-            if not typed_town or not parent_state:
+        for pending in pending_requests:
+            town = towns.get(pending.pk)
+            if town is None:
                 skipped_count += 1
                 continue
 
-            normalized_name = typed_town.strip().title()
-
-            town = Town.objects.filter(
-                state=parent_state, name__iexact=normalized_name
-            ).first()
-
-            if not town:
-                with transaction.atomic():
-                    last_town = Town.objects.order_by("-id").first()
-                    next_id = (last_town.id + 1) if last_town else 1
-                    prefix = normalized_name[:2].lower()
-                    code = f"{prefix}{next_id}"
-
-                    town = Town.objects.create(
-                        id=next_id,
-                        code=code,
-                        name=normalized_name,
-                        state=parent_state
-                    )
-
             person = pending.person
             person.town = town
             person.approval_status = "approved"
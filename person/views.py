@@ -1,7 +1,9 @@
 import logging
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from media_app.models import MediaFile
 from media_app.utils import validate_video_duration, format_duration
+from media_app.validation import scan_file, validate_files
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth import logout
@@ -213,6 +215,27 @@ def gallery_view(request):
     return render(request, 'person/gallery.html', context)
 
 
+def _check_gallery_file(file, file_type):
+    """Per-file gallery checks (run by media_app.validation.validate_files); raises ValidationError."""
+    if file_type == 'video':
+        # Check video file size (as backup limit)
+        if file.size > MAX_VIDEO_SIZE:
+            raise ValidationError(f"Exceeds {MAX_VIDEO_SIZE // (1024 * 1024)}MB limit")
+        
+        # Validate video duration (primary limit)
+        is_valid, duration, error_msg = validate_video_duration(file, MAX_VIDEO_DURATION)
+        if not is_valid:
+            if duration:
+                raise ValidationError(
+                    f"Too long ({format_duration(duration)}, max {format_duration(MAX_VIDEO_DURATION)})"
+                )
+            raise ValidationError(error_msg)
+    elif file.size > MAX_IMAGE_SIZE:
+        raise ValidationError(f"Exceeds {MAX_IMAGE_SIZE // (1024 * 1024)}MB limit")
+    
+    scan_file(file)
+
+
 @login_required
 def gallery_upload(request):
     """Handle multiple file uploads to gallery using MediaFile."""
@@ -254,64 +277,35 @@ def gallery_upload(request):
     video_extensions = ['mp4', 'mov', 'avi', 'mkv', 'webm', 'flv']
     allowed_extensions = image_extensions + video_extensions
     
+    to_check = []
     for file in files:
+        extension = file.name.lower().split('.')[-1]
+        
+        # Validate file extension
+        if extension not in allowed_extensions:
+            failed_count += 1
+            failed_reasons.append(f"{file.name}: Invalid file type")
+            logger.warning("File %s has invalid extension for user %s", file.name, request.user.pk)
+            continue
+        to_check.append((file, 'video' if extension in video_extensions else 'image'))
+    
+    # Size / duration / antivirus checks run in parallel; saving stays in this thread
+    for result in validate_files(to_check, check=_check_gallery_file):
+        file = result.file
+        if not result.ok:
+            failed_count += 1
+            failed_reasons.append(f"{file.name}: {result.error}")
+            logger.warning("Gallery file %s rejected for user %s: %s", file.name, request.user.pk, result.error)
+            continue
+        
         try:
-            extension = file.name.lower().split('.')[-1]
-            
-            # Validate file extension
-            if extension not in allowed_extensions:
-                failed_count += 1
-                failed_reasons.append(f"{file.name}: Invalid file type")
-                logger.warning("File %s has invalid extension for user %s", file.name, request.user.pk)
-                continue
-            
-            # Determine file type and validate
-            if extension in video_extensions:
-                file_type = 'video'
-                
-                # Check video file size (as backup limit)
-                if file.size > MAX_VIDEO_SIZE:
-                    failed_count += 1
-                    size_mb = MAX_VIDEO_SIZE // (1024 * 1024)
-                    failed_reasons.append(f"{file.name}: Exceeds {size_mb}MB limit")
-                    logger.warning("Video %s exceeds size limit for user %s", file.name, request.user.pk)
-                    continue
-                
-                # Validate video duration (primary limit)
-                is_valid, duration, error_msg = validate_video_duration(file, MAX_VIDEO_DURATION)
-                
-                if not is_valid:
-                    failed_count += 1
-                    if duration:
-                        duration_str = format_duration(duration)
-                        max_duration_str = format_duration(MAX_VIDEO_DURATION)
-                        failed_reasons.append(f"{file.name}: Too long ({duration_str}, max {max_duration_str})")
-                    else:
-                        failed_reasons.append(f"{file.name}: {error_msg}")
-                    logger.warning(
-                        "Video %s exceeds duration limit (%.1fs) for user %s", 
-                        file.name, duration or 0, request.user.pk
-                    )
-                    continue
-                    
-            else:
-                file_type = 'image'
-                
-                # Check image file size
-                if file.size > MAX_IMAGE_SIZE:
-                    failed_count += 1
-                    size_mb = MAX_IMAGE_SIZE // (1024 * 1024)
-                    failed_reasons.append(f"{file.name}: Exceeds {size_mb}MB limit")
-                    logger.warning("Image %s exceeds size limit for user %s", file.name, request.user.pk)
-                    continue
-            
             # Create MediaFile with generic relation to Person
             MediaFile.objects.create(
                 owner=request.user,
                 content_type=person_content_type,
                 object_id=person.pk,
                 file=file,
-                file_type=file_type,
+                file_type=result.file_type,
                 is_public=True
             )
             uploaded_count += 1
@@ -353,9 +347,8 @@ def gallery_delete(request, pk):
     
     if request.method == 'POST':
         try:
-            # Delete the actual file from storage
-            if item.file:
-                item.file.delete(save=False)
+            # the stored file may be shared with other uploads (media_app/blobs.py):
+            # post_delete releases it once the last reference is gone
             item.delete()
             messages.success(request, 'Gallery item deleted successfully!')
             logger.info("User %s deleted media item %s", request.user.pk, pk)
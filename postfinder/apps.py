@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PostfinderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'postfinder'
+
+    def ready(self):
+        import postfinder.signals
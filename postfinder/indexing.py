@@ -0,0 +1,102 @@
+# postfinder/indexing.py
+"""
+Inverted keyword index for Post search.
+
+Every Post is broken into lowercase word tokens taken from INDEXED_FIELDS and
+stored as PostSearchToken rows. A search query is tokenized the same way and
+each query word resolves to a posting list (the post IDs of every token that
+starts with that word). Candidate posts are the intersection of those lists,
+computed in the database as a subquery, so the main posts table is only
+touched for rows that already match.
+"""
+import re
+
+from django.db import transaction
+
+from .models import PostSearchToken
+
+INDEXED_FIELDS = (
+    "product_name",
+    "description",
+    "brand",
+    "business_name",
+    "service_details",
+)
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+MAX_TOKEN_LENGTH = 64
+TOKEN_RANGE_END = "\U0010ffff"  # sorts after any character a token can continue with
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens (order preserved, duplicates kept)."""
+    if not text:
+        return []
+    if not isinstance(text, str):
+        text = str(text)
+    return [t[:MAX_TOKEN_LENGTH] for t in TOKEN_RE.findall(text.lower())]
+
+
+def post_tokens(post):
+    """Return the distinct set of tokens for a Post instance."""
+    tokens = set()
+    for field in INDEXED_FIELDS:
+        tokens.update(tokenize(getattr(post, field, None)))
+    return tokens
+
+
+def index_post(post):
+    """
+    Bring the posting lists for a single post up to date.
+    Only the tokens that were added or removed are written.
+    """
+    new_tokens = post_tokens(post)
+
+    with transaction.atomic():
+        existing = set(
+            PostSearchToken.objects.filter(post_id=post.pk).values_list("token", flat=True)
+        )
+        stale = existing - new_tokens
+        if stale:
+            PostSearchToken.objects.filter(post_id=post.pk, token__in=stale).delete()
+
+        fresh = new_tokens - existing
+        if fresh:
+            PostSearchToken.objects.bulk_create(
+                [PostSearchToken(post_id=post.pk, token=token) for token in fresh],
+                ignore_conflicts=True,
+            )
+
+
+def rebuild_index(queryset, batch_size=1000):
+    """Re-index every post in queryset. Returns the number of posts processed."""
+    processed = 0
+    for post in queryset.only("pk", *INDEXED_FIELDS).iterator(chunk_size=batch_size):
+        index_post(post)
+        processed += 1
+    return processed
+
+
+def _postings(word):
+    """Posting list of one query word: every (token, post) row whose token starts with it."""
+    # A range rather than token__startswith: LIKE is case-insensitive on SQLite
+    # and cannot use the (token, post) index, a range on token can.
+    return PostSearchToken.objects.filter(token__gte=word, token__lt=word + TOKEN_RANGE_END)
+
+
+def candidate_post_ids(query):
+    """
+    Resolve a free-text query to the post IDs containing every query word (as
+    a token prefix), as a lazy subquery for pk__in. Returns None when the query
+    has no words, so callers can tell "no keyword filter" apart from "no matches".
+    """
+    words = sorted(set(tokenize(query)), key=len, reverse=True)
+    if not words:
+        return None
+
+    # Longest word drives the scan (shortest posting list); each further word
+    # is a nested post_id IN (...) filter, so the intersection happens in SQL.
+    candidates = _postings(words[0])
+    for word in words[1:]:
+        candidates = candidates.filter(post_id__in=_postings(word).values("post_id"))
+    return candidates.values_list("post_id", flat=True).distinct()
@@ -0,0 +1,52 @@
+import re
+
+from django.db import migrations
+
+# Frozen copies of postfinder.indexing at the time of this migration, so later
+# changes to the live tokenizer don't change what it backfills.
+INDEXED_FIELDS = (
+    "product_name",
+    "description",
+    "brand",
+    "business_name",
+    "service_details",
+)
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+MAX_TOKEN_LENGTH = 64
+
+
+def tokenize(text):
+    if not text:
+        return []
+    if not isinstance(text, str):
+        text = str(text)
+    return [t[:MAX_TOKEN_LENGTH] for t in TOKEN_RE.findall(text.lower())]
+
+
+def backfill_tokens(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    PostSearchToken = apps.get_model("postfinder", "PostSearchToken")
+
+    batch = []
+    for post in Post.objects.only("pk", *INDEXED_FIELDS).iterator(chunk_size=1000):
+        tokens = set()
+        for field in INDEXED_FIELDS:
+            tokens.update(tokenize(getattr(post, field, None)))
+        batch.extend(PostSearchToken(post_id=post.pk, token=token) for token in tokens)
+        if len(batch) >= 5000:
+            PostSearchToken.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        PostSearchToken.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('postfinder', '0001_initial'),
+        ('posts', '0003_remove_post_auto_approve_at_delete_approvalqueue'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tokens, migrations.RunPython.noop),
+    ]
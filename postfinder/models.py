@@ -1,3 +1,21 @@
 from django.db import models
 
-# Create your models here.
+
+class PostSearchToken(models.Model):
+    """
+    One row per (token, post) pair: the posting lists of the inverted keyword
+    index used by postfinder search. Maintained by postfinder.signals.
+    """
+    token = models.CharField(max_length=64)
+    post = models.ForeignKey(
+        "posts.Post",
+        on_delete=models.CASCADE,
+        related_name="search_tokens",
+    )
+
+    class Meta:
+        # (token, post) doubles as the lookup index for token/prefix scans
+        unique_together = ("token", "post")
+
+    def __str__(self):
+        return f"{self.token} → Post #{self.post_id}"
@@ -1,5 +1,7 @@
 from django.db.models import Q
 from posts.models import Post
+from search.backends import full_text_search
+from .indexing import candidate_post_ids
 
 
 def normalize(val):
@@ -117,22 +119,6 @@ def search_posts(params):
 
     posts = Post.objects.all()
 
-    # ✅ keyword search
-    if query:
-        keywords = query.split()
-        q_objects = Q()
-        for word in keywords:
-            q_objects |= (
-                Q(product_name__icontains=word) |
-                Q(description__icontains=word) |
-                Q(author_phone_number__icontains=word) |
-                Q(author_email__icontains=word) |
-                Q(business_name__icontains=word) |
-                Q(service_details__icontains=word) |
-                Q(brand__icontains=word)
-            )
-        posts = posts.filter(q_objects)
-
     # ✅ category filter
     if category:
         posts = posts.filter(category_id=category)
@@ -159,25 +145,19 @@ def search_posts(params):
             post_town_id=town,
         )
 
-    return posts
+    # ✅ full-text search last: results come back ranked by relevance (search_rank)
+    return full_text_search(posts, query)
 
 def build_keyword_filter(query):
     """
-    Build a Q object for keyword search across relevant Post fields.
+    Build a Q object for keyword search across the indexed Post fields.
+    Candidate IDs come from the postfinder token index (posting-list
+    intersection), so the filter is a primary-key lookup, not a table scan.
     """
-    keywords = query.split()
-    q_objects = Q()
-    for word in keywords:
-        q_objects |= (
-            Q(product_name__icontains=word) |
-            Q(description__icontains=word) |
-            Q(author_phone_number__icontains=word) |
-            Q(author_email__icontains=word) |
-            Q(business_name__icontains=word) |
-            Q(service_details__icontains=word) |
-            Q(brand__icontains=word)
-        )
-    return q_objects
+    candidate_ids = candidate_post_ids(query)
+    if candidate_ids is None:
+        return Q()
+    return Q(pk__in=candidate_ids)
 
 # ------------------------------
 # Context builder
@@ -1,29 +1,21 @@
 # postfinder/services.py
 from django.db.models import Q
 from posts.models import Post
-
-SEARCH_FIELDS = [
-    "product_name__icontains",
-    "description__icontains",
-    "brand__icontains",
-    "business_name__icontains",
-    "technical_specifications__icontains",
-    "warranty__icontains",
-]
+from search.backends import full_text_search
+from custom_search.gazetteer import get_gazetteer
+from .indexing import candidate_post_ids
 
 def build_keyword_filter(query):
-    q = Q()
+    """
+    Every query word must match somewhere in the post (AND across words).
+    Resolved through the postfinder token index instead of LIKE scans.
+    """
     if not query:
-        return q
-    if not isinstance(query, str):   # ✅ safeguard
-        query = str(query)
-    tokens = [t.strip() for t in query.split() if t.strip()]
-    for token in tokens:
-        token_q = Q()
-        for fld in SEARCH_FIELDS:
-            token_q |= Q(**{fld: token})
-        q &= token_q
-    return q
+        return Q()
+    candidate_ids = candidate_post_ids(query)   # ✅ tokenizer handles non-str input
+    if candidate_ids is None:
+        return Q()
+    return Q(pk__in=candidate_ids)
 
 def search_posts(query=None, user=None, bypass=False, location_filters=None):
     """
@@ -48,19 +40,17 @@ def search_posts(query=None, user=None, bypass=False, location_filters=None):
         state = location_filters.get("state")
         town = location_filters.get("town")
         if continent:
-            loc_q |= Q(availability_scope="continent", post_continent__name__iexact=continent)
+            loc_q |= Q(availability_scope="continent", post_continent_id__in=get_gazetteer().resolve("continent", continent))
         if country:
-            loc_q |= Q(availability_scope="country", post_country__name__iexact=country)
+            loc_q |= Q(availability_scope="country", post_country_id__in=get_gazetteer().resolve("country", country))
         if state:
-            loc_q |= Q(availability_scope="state", post_state__name__iexact=state)
+            loc_q |= Q(availability_scope="state", post_state_id__in=get_gazetteer().resolve("state", state))
         if town:
-            loc_q |= Q(availability_scope="town", post_town__name__iexact=town)
+            loc_q |= Q(availability_scope="town", post_town_id__in=get_gazetteer().resolve("town", town))
         qs = qs.filter(loc_q)
 
-    # apply query keywords
-    if query:
-        kw_q = build_keyword_filter(query)
-        if kw_q:
-            qs = qs.filter(kw_q)
+    # apply query keywords, ranked by relevance
+    if query and query.strip():
+        return full_text_search(qs, query)
 
-    return qs.distinct().order_by("-created_at")
+    return qs.order_by("-created_at")
@@ -0,0 +1,18 @@
+# postfinder/signals.py
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from posts.models import Post
+from .indexing import INDEXED_FIELDS, index_post
+
+
+@receiver(post_save, sender=Post)
+def update_post_search_index(sender, instance, update_fields=None, **kwargs):
+    """
+    Keep the keyword index in sync with Post writes.
+    Saves that only touch non-indexed columns (status, expiry, ...) are skipped.
+    Deletes are handled by the CASCADE on PostSearchToken.post.
+    """
+    if update_fields is not None and not set(update_fields) & set(INDEXED_FIELDS):
+        return
+    index_post(instance)
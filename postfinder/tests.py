@@ -1,3 +1,57 @@
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import CustomUser
+from person.models import Person
+from posts.models import Category, Post
+
+from .indexing import candidate_post_ids
+
+
+class KeywordIndexTests(TestCase):
+    """
+    The token index matches every query word as a word prefix (AND across
+    words) over INDEXED_FIELDS; contact fields are not indexed.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        author = CustomUser.objects.create(username="seller", email="seller@example.com")
+        # the auto-created profile's location defaults (0) point at no row
+        Person.objects.filter(user=author).update(continent=None, country=None, state=None, town=None)
+        category = Category.objects.create(name="Gadgets")
+        common = dict(
+            author=author,
+            category=category,
+            author_phone_number="+2348012345678",
+            author_email="sales@example.com",
+            post_continent=None,
+            post_country=None,
+            post_state=None,
+            post_town=None,
+        )
+        cls.iphone = Post.objects.create(product_name="iPhone 13 Pro", brand="Apple", description="Great phone", **common)
+        cls.tv = Post.objects.create(product_name="Samsung TV", description="Big screen", **common)
+
+    def search(self, query):
+        return set(candidate_post_ids(query))
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.search("apple phone"), {self.iphone.pk})
+        self.assertEqual(self.search("apple screen"), set())
+
+    def test_words_match_as_prefixes(self):
+        self.assertEqual(self.search("IPH"), {self.iphone.pk})
+        self.assertEqual(self.search("phone"), {self.iphone.pk})  # not a substring of "iphone"
+
+    def test_contact_fields_are_not_searchable(self):
+        self.assertEqual(self.search("sales"), set())
+        self.assertEqual(self.search("2348012345678"), set())
+
+    def test_empty_query_means_no_filter(self):
+        self.assertIsNone(candidate_post_ids("  !? "))
+
+    def test_index_follows_edits(self):
+        self.tv.product_name = "LG Monitor"
+        self.tv.save()
+        self.assertEqual(self.search("samsung"), set())
+        self.assertEqual(self.search("monitor"), {self.tv.pk})
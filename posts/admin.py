@@ -5,7 +5,7 @@ from django.db.models import Q
 from django.contrib.contenttypes.admin import GenericTabularInline
 
 from .models import Post, Category, PendingLocationRequest, SocialMediaHandle
-from custom_search.models import Town
+from custom_search.towns import ingest_pending_requests
 from media_app.models import MediaFile
 
 # --- Inline for attached media (Generic relation) ---
@@ -136,13 +136,12 @@ class PostAdmin(admin.ModelAdmin):
 
     @admin.action(description="Mark selected posts as Approved")
     def approve_selected_posts(self, request, queryset):
-        from notifications.hooks.post_notifications import notify_post_approved
-
         updated = 0
         for post in queryset.exclude(status="approved"):
             post.status = "approved"
-            post.save(update_fields=["status"])
-            notify_post_approved(post)
+            # 🔔 notifications.signals queues the notifications in this same transaction
+            with transaction.atomic():
+                post.save(update_fields=["status"])
             updated += 1
         self.message_user(request, f"✅ {updated} post(s) marked as approved.")
 
@@ -202,33 +201,24 @@ class PendingLocationRequestAdmin(admin.ModelAdmin):
     def approve_pending_towns(self, request, queryset):
         approved_count, skipped_count = 0, 0
 
-        for pending in queryset.filter(is_reviewed=False, approved=False):
-            typed_town = (pending.typed_town or "").strip().title()
-            parent_state = pending.parent_state
-
-            if not typed_town or not parent_state:
+        pending_requests = list(
+            queryset.filter(is_reviewed=False, approved=False).select_related("post")
+        )
+        try:
+            # 🏘 Create every missing town in one go (block-allocated ids, de-duplicated)
+            _, towns = ingest_pending_requests(pending_requests)
+        except Exception as e:
+            self.message_user(request, f"❌ Error creating towns: {e}", level=messages.ERROR)
+            return
+
+        for pending in pending_requests:
+            town = towns.get(pending.pk)
+            if town is None:
                 skipped_count += 1
                 continue
 
             try:
                 with transaction.atomic():
-                    town = Town.objects.filter(
-                        Q(state=parent_state) & Q(name__iexact=typed_town)
-                    ).first()
-
-                    if not town:
-                        last_town = Town.objects.order_by("-id").first()
-                        next_id = (last_town.id + 1) if last_town else 1
-                        prefix = typed_town[:2].lower()
-                        code = f"{prefix}{next_id}"
-
-                        town = Town.objects.create(
-                            id=next_id,
-                            code=code,
-                            name=typed_town,
-                            state=parent_state,
-                        )
-
                     post = pending.post
                     post.post_town = town
                     post.status = "approved"
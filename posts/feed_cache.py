@@ -0,0 +1,104 @@
+# posts/feed_cache.py
+"""
+Cache for the home feed pages (PostListView / SeekerPostListView).
+
+Everybody with the same location sees the same feed, so a page is cached once
+per (audience keys, cursor) and stores only the ordered post IDs. Serving a
+cached page is one cache read plus a `pk__in` fetch for the rows themselves.
+
+Invalidation is by version counter: every audience key (see
+posts/utils/audience.py) has a version in the cache, and page entries are
+keyed by the versions of all the keys they were built from. When a post is
+approved, rejected/expired or deleted, notifications.signals bumps its key
+(plus ALL_AUDIENCES), which orphans exactly the pages that could contain it.
+Orphaned entries simply age out after FEED_CACHE_TIMEOUT.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .pagination import KeysetPaginationMixin, keyset_page
+
+# Pseudo audience for the unfiltered "every approved post" feed
+ALL_AUDIENCES = "*"
+
+FEED_CACHE_TIMEOUT = getattr(settings, "FEED_CACHE_TIMEOUT", 300)
+
+
+def _version_key(label, audience_key):
+    return f"feed:v:{label}:{audience_key}"
+
+
+def _versions(label, audience_keys):
+    keys = [_version_key(label, key) for key in audience_keys]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # A fresh (or evicted) counter starts from the clock, never from 0,
+            # so it can't line up with versions used by older page entries.
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _page_key(label, audience_keys, cursor, page_size):
+    audience_keys = sorted(audience_keys)
+    parts = [label, str(page_size), cursor or ""]
+    parts += [f"{key}={version}" for key, version in zip(audience_keys, _versions(label, audience_keys))]
+    return "feed:page:" + hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def cached_feed_page(queryset, audience_keys, cursor=None, page_size=20):
+    """
+    keyset_page() with the post IDs cached per audience.
+    Returns (rows, next_cursor) exactly like keyset_page().
+    """
+    label = queryset.model._meta.label_lower
+    key = _page_key(label, audience_keys, cursor, page_size)
+
+    hit = cache.get(key)
+    if hit is None:
+        rows, next_cursor = keyset_page(queryset, cursor=cursor, page_size=page_size)
+        cache.set(key, ([row.pk for row in rows], next_cursor), FEED_CACHE_TIMEOUT)
+        return rows, next_cursor
+
+    ids, next_cursor = hit
+    by_id = queryset.in_bulk(ids)
+    return [by_id[pk] for pk in ids if pk in by_id], next_cursor
+
+
+def bump_audiences(model, audience_keys):
+    """Invalidate every cached page built from any of audience_keys (after commit)."""
+    label = model._meta.label_lower
+    keys = {_version_key(label, key) for key in (*audience_keys, ALL_AUDIENCES) if key}
+
+    def bump():
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:  # counter not in the cache → nothing cached against it
+                pass
+
+    transaction.on_commit(bump)
+
+
+def invalidate_post_feeds(post, *extra_keys):
+    """A post entered or left the feed: drop the pages of its audience."""
+    bump_audiences(post.__class__, (post.audience_key, *extra_keys))
+
+
+class CachedFeedMixin(KeysetPaginationMixin):
+    """
+    KeysetPaginationMixin that serves pages through the feed cache.
+    get_queryset() sets self.feed_audience to the viewer's audience keys
+    (or [ALL_AUDIENCES]); leaving it None (e.g. ad-hoc filters) skips the cache.
+    """
+    feed_audience = None
+
+    def paginate_keyset(self, queryset, cursor):
+        if not self.feed_audience:
+            return super().paginate_keyset(queryset, cursor)
+        return cached_feed_page(queryset, self.feed_audience, cursor=cursor, page_size=self.page_size)
@@ -9,6 +9,7 @@ from .models import SocialMediaHandle
 from posts.utils.location_assignment import assign_location_fields
 from posts.utils.location_scope_guard import apply_location_scope_fallback
 from custom_search.models import Continent, Country, State, Town  
+from custom_search.gazetteer import UNSPECIFIED_ID, get_gazetteer
 
 # forms.py
 
@@ -47,11 +48,6 @@ class ProductPostForm(forms.ModelForm, LocationFieldsSetupMixin):
         self.fields["post_state"].queryset = State.objects.all()
         self.fields["post_town"].queryset = Town.objects.all()
 
-        # ✅ Force "Unspecified" to exist in querysets
-        self.fields['post_continent'].queryset = Continent.objects.filter(id=0) | Continent.objects.all()
-        self.fields['post_country'].queryset = Country.objects.filter(id=0) | Country.objects.all()
-        self.fields['post_state'].queryset = State.objects.filter(id=0) | State.objects.all()
-        self.fields['post_town'].queryset = Town.objects.filter(id=0) | Town.objects.all()
 
 
         # 🔹 Remove Django's default "------" choice
@@ -60,10 +56,10 @@ class ProductPostForm(forms.ModelForm, LocationFieldsSetupMixin):
                 self.fields[field].empty_label = None  
 
         # 🔹 Default to "Unspecified" (id=0) if seeded
-        self.fields["post_continent"].initial = Continent.objects.filter(id=0).first()
-        self.fields["post_country"].initial = Country.objects.filter(id=0).first()
-        self.fields["post_state"].initial = State.objects.filter(id=0).first()
-        self.fields["post_town"].initial = Town.objects.filter(id=0).first()
+        self.fields["post_continent"].initial = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        self.fields["post_country"].initial = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        self.fields["post_state"].initial = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        self.fields["post_town"].initial = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # Labels and placeholders
         self.fields['product_name'].label = "Name of the product you're selling"
@@ -93,10 +89,10 @@ class ProductPostForm(forms.ModelForm, LocationFieldsSetupMixin):
         scope = cleaned.get("availability_scope")
 
         # Always guarantee Unspecified fallback
-        unspecified_continent = Continent.objects.filter(id=0).first()
-        unspecified_country = Country.objects.filter(id=0).first()
-        unspecified_state = State.objects.filter(id=0).first()
-        unspecified_town = Town.objects.filter(id=0).first()
+        unspecified_continent = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        unspecified_country = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        unspecified_state = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        unspecified_town = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # Reset fields depending on chosen scope
         if scope == "continent":
@@ -168,11 +164,6 @@ class ServicePostForm(forms.ModelForm, LocationFieldsSetupMixin):
         self.fields["post_state"].queryset = State.objects.all()
         self.fields["post_town"].queryset = Town.objects.all()
 
-        # ✅ Force "Unspecified" to exist in querysets
-        self.fields['post_continent'].queryset = Continent.objects.filter(id=0) | Continent.objects.all()
-        self.fields['post_country'].queryset = Country.objects.filter(id=0) | Country.objects.all()
-        self.fields['post_state'].queryset = State.objects.filter(id=0) | State.objects.all()
-        self.fields['post_town'].queryset = Town.objects.filter(id=0) | Town.objects.all()
 
         # 🔹 Remove Django's default "------" choice
         for field in ["post_continent", "post_country", "post_state", "post_town"]:
@@ -180,10 +171,10 @@ class ServicePostForm(forms.ModelForm, LocationFieldsSetupMixin):
                 self.fields[field].empty_label = None  
 
         # 🔹 Default to "Unspecified" (id=0) if seeded
-        self.fields["post_continent"].initial = Continent.objects.filter(id=0).first()
-        self.fields["post_country"].initial = Country.objects.filter(id=0).first()
-        self.fields["post_state"].initial = State.objects.filter(id=0).first()
-        self.fields["post_town"].initial = Town.objects.filter(id=0).first()
+        self.fields["post_continent"].initial = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        self.fields["post_country"].initial = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        self.fields["post_state"].initial = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        self.fields["post_town"].initial = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # 🔹 Labels & placeholders
         self.fields['product_name'].label = "What services are you offering?"
@@ -219,10 +210,10 @@ class ServicePostForm(forms.ModelForm, LocationFieldsSetupMixin):
         scope = cleaned.get("availability_scope")
 
         # Always guarantee Unspecified fallback
-        unspecified_continent = Continent.objects.filter(id=0).first()
-        unspecified_country = Country.objects.filter(id=0).first()
-        unspecified_state = State.objects.filter(id=0).first()
-        unspecified_town = Town.objects.filter(id=0).first()
+        unspecified_continent = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        unspecified_country = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        unspecified_state = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        unspecified_town = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # Reset fields depending on chosen scope
         if scope == "continent":
@@ -293,11 +284,6 @@ class LaborPostForm(forms.ModelForm, LocationFieldsSetupMixin):
         self.fields["post_state"].queryset = State.objects.all()
         self.fields["post_town"].queryset = Town.objects.all()
 
-        # ✅ Force "Unspecified" to exist in querysets
-        self.fields['post_continent'].queryset = Continent.objects.filter(id=0) | Continent.objects.all()
-        self.fields['post_country'].queryset = Country.objects.filter(id=0) | Country.objects.all()
-        self.fields['post_state'].queryset = State.objects.filter(id=0) | State.objects.all()
-        self.fields['post_town'].queryset = Town.objects.filter(id=0) | Town.objects.all()
 
         # 🔹 Remove Django's default "------" choice
         for field in ["post_continent", "post_country", "post_state", "post_town"]:
@@ -305,10 +291,10 @@ class LaborPostForm(forms.ModelForm, LocationFieldsSetupMixin):
                 self.fields[field].empty_label = None  
 
         # 🔹 Default to "Unspecified" (id=0) if seeded
-        self.fields["post_continent"].initial = Continent.objects.filter(id=0).first()
-        self.fields["post_country"].initial = Country.objects.filter(id=0).first()
-        self.fields["post_state"].initial = State.objects.filter(id=0).first()
-        self.fields["post_town"].initial = Town.objects.filter(id=0).first()
+        self.fields["post_continent"].initial = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        self.fields["post_country"].initial = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        self.fields["post_state"].initial = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        self.fields["post_town"].initial = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # 🔹 Labels & placeholders
         self.fields["product_name"].label = "What labor work do you do"
@@ -335,10 +321,10 @@ class LaborPostForm(forms.ModelForm, LocationFieldsSetupMixin):
         scope = cleaned.get("availability_scope")
 
         # Always guarantee Unspecified fallback
-        unspecified_continent = Continent.objects.filter(id=0).first()
-        unspecified_country = Country.objects.filter(id=0).first()
-        unspecified_state = State.objects.filter(id=0).first()
-        unspecified_town = Town.objects.filter(id=0).first()
+        unspecified_continent = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        unspecified_country = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        unspecified_state = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        unspecified_town = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # Reset fields depending on chosen scope
         if scope == "continent":
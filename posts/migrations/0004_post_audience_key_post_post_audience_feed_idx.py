@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_search', '0002_alter_town_code'),
+        ('posts', '0003_remove_post_auto_approve_at_delete_approvalqueue'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='audience_key',
+            field=models.CharField(default='global', editable=False, max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['status', 'audience_key', '-created_at'], name='post_audience_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+from posts.utils.audience import audience_key_for
+
+FIELDS = ("availability_scope", "post_continent", "post_country", "post_state", "post_town")
+
+
+def backfill_audience_key(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+
+    batch = []
+    for post in Post.objects.only("pk", *FIELDS).iterator(chunk_size=1000):
+        post.audience_key = audience_key_for(post)
+        batch.append(post)
+        if len(batch) >= 1000:
+            Post.objects.bulk_update(batch, ["audience_key"])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ["audience_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0004_post_audience_key_post_post_audience_feed_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_audience_key, migrations.RunPython.noop),
+    ]
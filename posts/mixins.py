@@ -1,7 +1,9 @@
 # forms/mixins.py
 from django import forms
 # forms/mixins.py or wherever appropriate
-from custom_search.models import Continent, Country, State, Town
+from django.db.models import Q
+
+from custom_search.gazetteer import LEVELS, MODELS, PARENT, UNSPECIFIED_ID, get_gazetteer
 
 
 class LocationFieldsSetupMixin:
@@ -35,17 +37,29 @@ class LocationFieldsSetupMixin:
                 })
 
     def init_location_queryset(self):
-        # ⛓ Dynamically filter dropdowns based on parent selection
-        data = self.data if hasattr(self, "data") else {}
-
-        if "post_continent" in data:
-            continent_id = data.get("post_continent")
-            self.fields["post_country"].queryset = Country.objects.filter(continent_id=continent_id)
+        # ⛓ Render only what the current selection needs: the chosen place on
+        # each level plus the children of its parent (location_dropdown.js
+        # fetches the rest on change). Validation stays a single pk lookup
+        # (still scoped to the submitted parent), so no <option> list is ever
+        # built from the DB.
+        gazetteer = get_gazetteer()
+        parent_id = None
+        for level in LEVELS:
+            name = f"post_{level}"
+            if name not in self.fields:
+                continue
+            field = self.fields[name]
+            queryset = MODELS[level].objects.all()
+            if self.is_bound and PARENT[level] and gazetteer.exists(PARENT[level], parent_id):
+                queryset = queryset.filter(
+                    Q(pk=UNSPECIFIED_ID) | Q(**{f"{PARENT[level]}_id": parent_id})
+                )
+            field.queryset = queryset
 
-        if "post_country" in data:
-            country_id = data.get("post_country")
-            self.fields["post_state"].queryset = State.objects.filter(country_id=country_id)
+            selected_id = self[name].value()
+            choices = gazetteer.scoped_choices(level, parent_id, selected_id)
+            if field.empty_label is not None:
+                choices.insert(0, ("", field.empty_label))
+            field.widget.choices = choices
 
-        if "post_state" in data:
-            state_id = data.get("post_state")
-            self.fields["post_town"].queryset = Town.objects.filter(state_id=state_id)
\ No newline at end of file
+            parent_id = selected_id
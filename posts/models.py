@@ -10,6 +10,7 @@ from django.contrib.contenttypes.fields import GenericRelation
 from media_app.models import MediaFile   # ✅ proper import
 from datetime import timedelta
 from .managers import PostQuerySet
+from .utils.audience import refresh_audience_key
 
 
 
@@ -64,6 +65,9 @@ class Post(models.Model):
     # Status
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
 
+    # 🔑 scope + location path in one column (see posts/utils/audience.py), kept in sync by save()
+    audience_key = models.CharField(max_length=64, default="global", editable=False)
+
     # New auto-approval / audit fields
     approved_at = models.DateTimeField(blank=True, null=True)
     # small helper flag (you can also compute from reports)
@@ -130,10 +134,17 @@ class Post(models.Model):
 
     expires_at = models.DateTimeField(default=default_expiry)
 
+    class Meta:
+        indexes = [
+            # visibility feed: status="approved" AND audience_key IN (...) ORDER BY created_at DESC
+            models.Index(fields=["status", "audience_key", "-created_at"], name="post_audience_feed_idx"),
+        ]
+
     # ----------------------
     # override save to set auto_approve_at on creation
     # ----------------------
     def save(self, *args, **kwargs):
+        kwargs["update_fields"] = refresh_audience_key(self, kwargs.get("update_fields"))
         super().save(*args, **kwargs)
 
         # Keep only your location request logic
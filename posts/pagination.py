@@ -0,0 +1,98 @@
+# posts/pagination.py
+"""
+Keyset (cursor) pagination for the home feeds.
+
+Pages are cut on (created_at, id) instead of OFFSET, so page N is the same
+index range scan as page 1: "the next 20 rows older than the last one I saw".
+The cursor is that last row's (created_at, id), base64-encoded so it can sit
+in a URL untouched. keyset_page(field=...) pages on another timestamp the
+same way (notifications use last_event_at).
+"""
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+
+def encode_cursor(created_at, pk):
+    raw = f"{created_at.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Return (created_at, pk), or None for a missing/garbled cursor (→ first page)."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def keyset_page(queryset, cursor=None, page_size=20, field="created_at"):
+    """
+    Slice one page off queryset, newest `field` first.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    queryset = queryset.order_by(f"-{field}", "-id")
+    position = decode_cursor(cursor)
+    if position:
+        value, pk = position
+        queryset = queryset.filter(
+            Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk})
+        )
+
+    # one extra row tells us whether there is a next page, without a COUNT(*)
+    rows = list(queryset[: page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, field), last.pk)
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin: paginates get_queryset() with keyset_page().
+
+    Context gets `next_cursor` and `next_page_url` (current GET params + cursor).
+    Requests with ?partial=1 render `partial_template_name` (just the cards)
+    for the infinite-scroll loader.
+    """
+    page_size = 20
+    cursor_param = "cursor"
+    partial_template_name = None
+
+    @property
+    def is_partial(self):
+        return bool(self.request.GET.get("partial"))
+
+    def get_template_names(self):
+        if self.is_partial and self.partial_template_name:
+            return [self.partial_template_name]
+        return super().get_template_names()
+
+    def paginate_keyset(self, queryset, cursor):
+        return keyset_page(queryset, cursor=cursor, page_size=self.page_size)
+
+    def get_context_data(self, **kwargs):
+        rows, next_cursor = self.paginate_keyset(
+            self.object_list, self.request.GET.get(self.cursor_param)
+        )
+        kwargs["object_list"] = rows
+        context = super().get_context_data(**kwargs)
+
+        next_page_url = None
+        if next_cursor:
+            params = self.request.GET.copy()
+            params[self.cursor_param] = next_cursor
+            params.pop("partial", None)
+            next_page_url = f"{self.request.path}?{params.urlencode()}"
+
+        context.update({
+            "next_cursor": next_cursor,
+            "next_page_url": next_page_url,
+        })
+        return context
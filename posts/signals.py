@@ -1,8 +1,8 @@
 # posts/signals.py
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from board.models import Board
+from board.models import Board, POST_BOARD
 from .models import Post
 
 
@@ -10,24 +10,27 @@ from .models import Post
 def sync_post_board(sender, instance, created, **kwargs):
     """
     Automatically add/remove Post from PostBoard when approval status changes.
-    Keeps the board in sync with the `is_approved` field.
+    Keeps the board in sync with the `status` field: approved posts are on the
+    board (entry refreshed on each save, so edits show), others are taken off.
+    Posts that neither are nor were approved cost no queries.
     """
     try:
-        board, _ = Board.objects.get_or_create(
-            name="PostBoard",
-            defaults={"description": "Board for all approved posts."}
-        )
+        # _prev_status comes from the pre_save receiver in notifications.signals
+        prev_status = getattr(instance, "_prev_status", None)
 
-        if getattr(instance, "is_approved", False):
-            # ✅ Add approved posts to board
-            if instance not in board.posts.all():
-                board.add_item(instance)
-                print(f"[INFO] Added approved Post {instance.pk} to PostBoard.")
-        else:
+        if instance.status == "approved":
+            # ✅ Add approved posts to board (idempotent)
+            Board.named(POST_BOARD).add_item(instance)
+        elif prev_status in (None, "approved"):
             # 🧹 Remove unapproved posts
-            if instance in board.posts.all():
-                board.posts.remove(instance)
-                print(f"[INFO] Removed unapproved Post {instance.pk} from PostBoard.")
+            Board.named(POST_BOARD).remove_item(instance)
 
     except Exception as e:
         print(f"[WARN] Failed to sync Post {instance.pk}: {e}")
+
+
+@receiver(post_delete, sender=Post)
+def remove_deleted_post_from_board(sender, instance, **kwargs):
+    """M2M rows cascade on their own; the generic board entry doesn't."""
+    if instance.status == "approved":
+        Board.named(POST_BOARD).remove_item(instance)
@@ -0,0 +1,69 @@
+# posts/utils/audience.py
+"""
+Audience keys: availability scope + location path squashed into one indexed
+column, so feed visibility is an `audience_key__in` lookup instead of an OR
+over five scope/FK combinations.
+
+    global                        → "global"
+    continent-wide                → "continent:<continent_id>"
+    country-wide                  → "country:<continent_id>/<country_id>"
+    state-wide                    → "state:<continent_id>/<country_id>/<state_id>"
+    town-specific                 → "town:<continent_id>/<country_id>/<state_id>/<town_id>"
+
+A viewer sees a post when the post's key is one of the viewer's keys (global
+plus one key per location level they have filled in). Shared by Post and
+SeekerPost, which use the same post_* location fields.
+"""
+
+LEVELS = ("continent", "country", "state", "town")
+
+# Fields that feed into the key; saving any of them must refresh it.
+AUDIENCE_FIELDS = frozenset({"availability_scope", *(f"post_{level}" for level in LEVELS)})
+
+GLOBAL_KEY = "global"
+MISSING = "-"   # location level the post's scope needs but doesn't have
+
+
+def build_audience_key(scope, path):
+    if not scope or scope == GLOBAL_KEY:
+        return GLOBAL_KEY
+    depth = LEVELS.index(scope) + 1
+    return f"{scope}:" + "/".join(
+        MISSING if pk is None else str(pk) for pk in path[:depth]
+    )
+
+
+def audience_key_for(post):
+    """Audience key for a Post/SeekerPost instance (uses *_id, no queries)."""
+    path = [getattr(post, f"post_{level}_id") for level in LEVELS]
+    return build_audience_key(post.availability_scope, path)
+
+
+def refresh_audience_key(post, update_fields=None):
+    """
+    Recompute post.audience_key before a save. Returns the update_fields to
+    save with: audience_key is added when a partial save touches a location field.
+    """
+    post.audience_key = audience_key_for(post)
+    if update_fields is not None and AUDIENCE_FIELDS & set(update_fields):
+        update_fields = {*update_fields, "audience_key"}
+    return update_fields
+
+
+def audience_keys_for_profile(profile):
+    """
+    Every key visible to a profile: global, then one key per location level,
+    stopping at the first level the profile hasn't filled in (a state-wide post
+    only shows to people whose continent + country + state all match).
+    """
+    keys = [GLOBAL_KEY]
+    if profile is None:
+        return keys
+    path = []
+    for level in LEVELS:
+        pk = getattr(profile, f"{level}_id", None)
+        if pk is None:
+            break
+        path.append(pk)
+        keys.append(build_audience_key(level, path))
+    return keys
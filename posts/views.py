@@ -19,7 +19,10 @@ from comment.forms import CommentForm
 from person.models import Person  # Make sure this is imported
 from posts.utils.location_assignment import assign_location_fields
 from posts.utils.location_scope_guard import apply_location_scope_fallback
+from posts.utils.audience import audience_keys_for_profile
 from board.mixins import BoardItemsMixin
+from custom_search.gazetteer import LEVELS, get_gazetteer
+from posts.feed_cache import ALL_AUDIENCES, CachedFeedMixin
 from django.db.models import Prefetch
 logger = logging.getLogger(__name__)
 
@@ -28,14 +31,16 @@ class CategoryListView(ListView):
     template_name = "posts/category_list.html"
     context_object_name = "categories"
 
-class PostListView(BoardItemsMixin, ListView):
+class PostListView(CachedFeedMixin, BoardItemsMixin, ListView):
     model = Post
     template_name = "posts/post_list.html"
+    partial_template_name = "posts/includes/feed_page.html"  # infinite-scroll pages
     context_object_name = "posts"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['board_items'] = self.get_board_items(7)
+        if not self.is_partial:  # scroll pages only need the cards
+            context['board_items'] = self.get_board_items(7)
         return context
 
     def get_queryset(self):
@@ -54,6 +59,9 @@ class PostListView(BoardItemsMixin, ListView):
         user = self.request.user
         profile = getattr(user, "profile", None)
 
+        # cached feed pages are shared by everyone with the same audience keys
+        self.feed_audience = [ALL_AUDIENCES]
+
         # start from approved posts only
         qs = Post.objects.filter(status="approved")
 
@@ -87,18 +95,19 @@ class PostListView(BoardItemsMixin, ListView):
         town_q = self.request.GET.get("town")
 
         if continent_q or country_q or state_q or town_q:
+            self.feed_audience = None  # ad-hoc filters: not cached
             filters = Q()
             # Always include global posts in search results
             filters |= Q(availability_scope="global")
 
             if town_q:
-                filters |= Q(availability_scope="town", post_town__name__iexact=town_q)
+                filters |= Q(availability_scope="town", post_town_id__in=get_gazetteer().resolve("town", town_q))
             if state_q:
-                filters |= Q(availability_scope="state", post_state__name__iexact=state_q)
+                filters |= Q(availability_scope="state", post_state_id__in=get_gazetteer().resolve("state", state_q))
             if country_q:
-                filters |= Q(availability_scope="country", post_country__name__iexact=country_q)
+                filters |= Q(availability_scope="country", post_country_id__in=get_gazetteer().resolve("country", country_q))
             if continent_q:
-                filters |= Q(availability_scope="continent", post_continent__name__iexact=continent_q)
+                filters |= Q(availability_scope="continent", post_continent_id__in=get_gazetteer().resolve("continent", continent_q))
 
             return qs.filter(filters).order_by("-created_at")
 
@@ -106,44 +115,13 @@ class PostListView(BoardItemsMixin, ListView):
         if profile and profile.approval_status != "approved":
             return qs.order_by("-created_at")
 
-        # Default feed: enforce strict visibility based on user's profile location
+        # Default feed: enforce strict visibility based on user's profile location.
+        # Each post carries one audience key (scope + location path), so this is an
+        # index lookup on (status, audience_key, created_at) — no OR, no distinct.
         if profile:
-            filters = Q()
-
-            # 1) global always visible
-            filters |= Q(availability_scope="global")
-
-            # 2) continent posts — visible if user's continent matches (regardless of other fields)
-            if getattr(profile, "continent", None):
-                filters |= Q(availability_scope="continent", post_continent=profile.continent)
-
-            # 3) country posts — visible if continent + country match
-            if getattr(profile, "country", None) and getattr(profile, "continent", None):
-                filters |= Q(
-                    availability_scope="country",
-                    post_continent=profile.continent,
-                    post_country=profile.country,
-                )
-
-            # 4) state posts — visible if continent + country + state match
-            if getattr(profile, "state", None) and getattr(profile, "country", None) and getattr(profile, "continent", None):
-                filters |= Q(
-                    availability_scope="state",
-                    post_continent=profile.continent,
-                    post_country=profile.country,
-                    post_state=profile.state,
-                )
+            self.feed_audience = audience_keys_for_profile(profile)
+            qs = qs.filter(audience_key__in=self.feed_audience)
 
-            # 5) town posts — visible only if all 4 levels match
-            if getattr(profile, "town", None) and getattr(profile, "state", None) and getattr(profile, "country", None) and getattr(profile, "continent", None):
-                filters |= Q(
-                    availability_scope="town",
-                    post_continent=profile.continent,
-                    post_country=profile.country,
-                    post_state=profile.state,
-                    post_town=profile.town,
-                )
-            
         # User has no profile/location info -> only show global posts
         return qs.order_by("-created_at")
 
@@ -636,85 +614,40 @@ def home(request):
     
 @require_GET
 def location_autocomplete(request):
-    from custom_search.models import Continent, Country, State, Town
-
     location_type = request.GET.get("type", "").lower()
     query = request.GET.get("q", "")
 
-    model_map = {
-        "continent": Continent,
-        "country": Country,
-        "state": State,
-        "town": Town,
-    }
-
-    model = model_map.get(location_type)
-    if not model:
+    if location_type not in LEVELS:
         return JsonResponse({"results": []})
 
-    results = model.objects.filter(name__icontains=query).values_list("name", flat=True)[:10]
-    return JsonResponse({"results": list(results)})
+    # 🗺️ served from the in-memory gazetteer, no DB round trip
+    results = get_gazetteer().search(location_type, query, limit=10)
+    return JsonResponse({"results": results})
 
 # ----------------------------
 # Location API Endpoints
 # ----------------------------
+# All served from the in-memory gazetteer (custom_search/gazetteer.py):
+# children of the selected parent + "Unspecified" (id=0), sorted by name.
 @require_GET
 def continents_api(request):
-    from custom_search.models import Continent
-    continents = Continent.objects.all().order_by("name")
-
-    # Include Unspecified (id=0) first if it exists
-    unspecified = Continent.objects.filter(id=0)
-    continents = (unspecified | continents).distinct()
-
-    data = [{"id": c.id, "name": c.name} for c in continents]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("continent"), safe=False)
 
 
 @require_GET
 def countries_api(request):
-    from custom_search.models import Country
     continent_id = request.GET.get("continent_id")
-
-    countries = Country.objects.none()
-    if continent_id:
-        countries = Country.objects.filter(continent_id=continent_id)
-
-    unspecified = Country.objects.filter(id=0)
-    countries = (unspecified | countries).distinct().order_by("name")
-
-    data = [{"id": c.id, "name": c.name} for c in countries]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("country", continent_id), safe=False)
 
 
 @require_GET
 def states_api(request):
-    from custom_search.models import State
     country_id = request.GET.get("country_id")
-
-    states = State.objects.none()
-    if country_id:
-        states = State.objects.filter(country_id=country_id)
-
-    unspecified = State.objects.filter(id=0)
-    states = (unspecified | states).distinct().order_by("name")
-
-    data = [{"id": s.id, "name": s.name} for s in states]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("state", country_id), safe=False)
 
 
 @require_GET
 def towns_api(request):
-    from custom_search.models import Town
     state_id = request.GET.get("state_id")
-
-    towns = Town.objects.none()
-    if state_id:
-        towns = Town.objects.filter(state_id=state_id)
-
-    unspecified = Town.objects.filter(id=0)
-    towns = (unspecified | towns).distinct().order_by("name")
-
-    data = [{"id": t.id, "name": t.name} for t in towns]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("town", state_id), safe=False)
 
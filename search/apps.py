@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class SearchConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'search'
+
+    def ready(self):
+        from .backends import repair_sqlite_fts_triggers
+        post_migrate.connect(repair_sqlite_fts_triggers, sender=self)
@@ -0,0 +1,175 @@
+# search/backends.py
+"""
+Pluggable full-text search for Post and SeekerPost.
+
+Backends:
+  - "sqlite_fts": FTS5 external-content tables (see search/migrations), bm25 ranking.
+  - "postgres":   SearchVector/SearchRank over a GIN expression index.
+  - "keyword":    no full-text engine; Post uses the postfinder token index,
+                  other models fall back to icontains. Results are unranked.
+
+The backend is chosen by settings.SEARCH_BACKEND, or from the database vendor
+when that is unset. Every backend returns the queryset filtered to matches,
+annotated with `search_rank` (higher is more relevant) and ordered by it.
+"""
+from dataclasses import dataclass
+from functools import reduce
+import operator
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from postfinder.indexing import tokenize
+from . import sqlite_fts
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    fields: tuple
+    fts_table: str
+
+
+# Keyed by "<app_label>.<model_name>". Field order matters: the FTS tables and
+# the PostgreSQL GIN indexes are built from these tuples.
+SEARCH_SPECS = {
+    "posts.post": SearchSpec(
+        fields=("product_name", "description", "brand", "business_name", "service_details"),
+        fts_table="posts_post_fts",
+    ),
+    "seekers.seekerpost": SearchSpec(
+        fields=("title", "description", "business_name"),
+        fts_table="seeker_post_fts",
+    ),
+}
+
+SEARCH_CONFIG = getattr(settings, "SEARCH_CONFIG", "english")
+
+
+def get_spec(model):
+    return SEARCH_SPECS[model._meta.label_lower]
+
+
+def ranked(queryset, rank_expression):
+    return queryset.annotate(search_rank=rank_expression).order_by("-search_rank", "-created_at")
+
+
+class KeywordBackend:
+    name = "keyword"
+
+    def search(self, queryset, query):
+        words = tokenize(query)
+        if not words:
+            return queryset
+
+        if queryset.model._meta.label_lower == "posts.post":
+            from postfinder.indexing import candidate_post_ids
+            queryset = queryset.filter(pk__in=candidate_post_ids(query))
+        else:
+            # AND across words, OR across fields
+            fields = get_spec(queryset.model).fields
+            for word in words:
+                queryset = queryset.filter(
+                    reduce(operator.or_, (Q(**{f"{f}__icontains": word}) for f in fields))
+                )
+        return ranked(queryset, Value(0.0, output_field=FloatField()))
+
+
+class SQLiteFTSBackend:
+    name = "sqlite_fts"
+
+    @staticmethod
+    def match_expression(query):
+        # Every word must match as a token prefix: "iph" finds "iphone".
+        # tokenize() only yields \w+ runs, so nothing needs escaping.
+        return " ".join(f'"{word}"*' for word in tokenize(query))
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return queryset
+
+        model = queryset.model
+        qn = connections[queryset.db].ops.quote_name
+        table = qn(get_spec(model).fts_table)
+        pk_column = f"{qn(model._meta.db_table)}.{qn(model._meta.pk.column)}"
+
+        matches = RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", (match,))
+        # bm25() is lower-is-better; negate it so search_rank sorts like the other backends.
+        score = RawSQL(
+            f"SELECT -bm25({table}) FROM {table} WHERE {table} MATCH %s AND {table}.rowid = {pk_column}",
+            (match,),
+            output_field=FloatField(),
+        )
+        return ranked(queryset.filter(pk__in=matches), score)
+
+
+class PostgresFTSBackend:
+    name = "postgres"
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+        if not tokenize(query):
+            return queryset
+
+        vector = SearchVector(*get_spec(queryset.model).fields, config=SEARCH_CONFIG)
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        # The filter expression matches the GIN index built in search/migrations.
+        queryset = queryset.annotate(search_vector=vector).filter(search_vector=search_query)
+        return ranked(queryset, SearchRank(vector, search_query))
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (KeywordBackend, SQLiteFTSBackend, PostgresFTSBackend)
+}
+
+_fts_tables = {}
+
+
+def sqlite_fts_available(alias):
+    """True when the FTS5 tables exist (they are skipped if SQLite lacks FTS5)."""
+    if alias not in _fts_tables:
+        _fts_tables[alias] = sqlite_fts.table_exists(
+            connections[alias], SEARCH_SPECS["posts.post"].fts_table
+        )
+    return _fts_tables[alias]
+
+
+def repair_sqlite_fts_triggers(sender, using="default", **kwargs):
+    """post_migrate hook: table re-creation during migrations drops the FTS triggers."""
+    from django.apps import apps
+
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    for label, spec in SEARCH_SPECS.items():
+        if not sqlite_fts.table_exists(connection, spec.fts_table):
+            continue
+        model = apps.get_model(label)
+        sqlite_fts.ensure_triggers(connection, spec.fts_table, model._meta.db_table, spec.fields)
+
+
+def get_backend(alias="default"):
+    name = getattr(settings, "SEARCH_BACKEND", None)
+    if not name:
+        vendor = connections[alias].vendor
+        if vendor == "postgresql":
+            name = "postgres"
+        elif vendor == "sqlite" and sqlite_fts_available(alias):
+            name = "sqlite_fts"
+        else:
+            name = "keyword"
+    return BACKENDS[name]()
+
+
+def full_text_search(queryset, query):
+    """
+    Filter queryset to rows matching query, ranked by relevance.
+    An empty query returns the queryset unchanged (no search_rank annotation).
+    """
+    if not query or not query.strip():
+        return queryset
+    return get_backend(queryset.db).search(queryset, query)
@@ -0,0 +1,66 @@
+"""
+Full-text indexes for search.backends.
+
+SQLite:     FTS5 external-content tables over posts_post / seeker_post, kept in
+            sync by triggers and populated with the FTS5 'rebuild' command.
+            Skipped when the SQLite build has no FTS5 (the keyword backend is
+            used instead).
+PostgreSQL: GIN expression indexes on the same SearchVector the backend queries.
+"""
+from django.db import migrations
+
+from search import sqlite_fts
+
+# Mirrors search.backends.SEARCH_SPECS; frozen here so later edits to the
+# specs need their own migration.
+SPECS = (
+    ("posts", "Post", "posts_post_fts", ("product_name", "description", "brand", "business_name", "service_details")),
+    ("seekers", "SeekerPost", "seeker_post_fts", ("title", "description", "business_name")),
+)
+SEARCH_CONFIG = "english"
+
+
+def gin_index(fields, fts_table):
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector(*fields, config=SEARCH_CONFIG), name=f"{fts_table}_gin")
+
+
+def forwards(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite" and not sqlite_fts.has_fts5(connection):
+        return
+
+    for app_label, model_name, fts_table, fields in SPECS:
+        model = apps.get_model(app_label, model_name)
+        content_table = model._meta.db_table
+        if connection.vendor == "sqlite":
+            schema_editor.execute(sqlite_fts.create_table_sql(fts_table, content_table, fields))
+            sqlite_fts.ensure_triggers(connection, fts_table, content_table, fields)
+        elif connection.vendor == "postgresql":
+            schema_editor.add_index(model, gin_index(fields, fts_table))
+
+
+def backwards(apps, schema_editor):
+    connection = schema_editor.connection
+    for app_label, model_name, fts_table, fields in SPECS:
+        model = apps.get_model(app_label, model_name)
+        if connection.vendor == "sqlite":
+            for sql in sqlite_fts.drop_sql(fts_table):
+                schema_editor.execute(sql)
+        elif connection.vendor == "postgresql":
+            schema_editor.remove_index(model, gin_index(fields, fts_table))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('posts', '0003_remove_post_auto_approve_at_delete_approvalqueue'),
+        ('seekers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,79 @@
+# search/sqlite_fts.py
+"""
+SQL helpers for the SQLite FTS5 tables behind search.backends.SQLiteFTSBackend.
+
+Each indexed model gets an external-content FTS5 table (the text lives only in
+the model's own table) plus three triggers that mirror inserts, deletes and
+updates into it. SQLite drops a table's triggers whenever Django re-creates the
+table during a migration, so ensure_triggers() runs after every migrate.
+"""
+
+
+def has_fts5(connection):
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+            cursor.execute("DROP TABLE temp.fts5_probe")
+        except Exception:
+            return False
+    return True
+
+
+def table_exists(connection, name):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def create_table_sql(fts_table, content_table, fields):
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5({', '.join(fields)}, "
+        f"content='{content_table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')"
+    )
+
+
+def trigger_sql(fts_table, content_table, fields):
+    cols = ", ".join(fields)
+    new_cols = ", ".join(f"new.{f}" for f in fields)
+    old_cols = ", ".join(f"old.{f}" for f in fields)
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});"
+    )
+    insert_new = f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_cols});"
+    return {
+        f"{fts_table}_ai": f"AFTER INSERT ON {content_table} BEGIN {insert_new} END",
+        f"{fts_table}_ad": f"AFTER DELETE ON {content_table} BEGIN {delete_old} END",
+        f"{fts_table}_au": f"AFTER UPDATE OF {cols} ON {content_table} BEGIN {delete_old} {insert_new} END",
+    }
+
+
+def rebuild_sql(fts_table):
+    return f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"
+
+
+def drop_sql(fts_table):
+    return [f"DROP TRIGGER IF EXISTS {name}" for name in trigger_sql(fts_table, "", ("x",))] + [
+        f"DROP TABLE IF EXISTS {fts_table}"
+    ]
+
+
+def ensure_triggers(connection, fts_table, content_table, fields):
+    """
+    Re-create any missing sync triggers. If some were missing, writes may have
+    bypassed the index, so the FTS table is rebuilt from its content table.
+    Returns True when a repair was needed.
+    """
+    triggers = trigger_sql(fts_table, content_table, fields)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s",
+            [content_table],
+        )
+        present = {row[0] for row in cursor.fetchall()}
+        missing = [name for name in triggers if name not in present]
+        for name in missing:
+            cursor.execute(f"CREATE TRIGGER {name} {triggers[name]}")
+        if missing:
+            cursor.execute(rebuild_sql(fts_table))
+    return bool(missing)
@@ -2,8 +2,9 @@ from django.db.models import Q
 from django.views.generic import ListView
 from django.http import JsonResponse, HttpResponseBadRequest
 from posts.models import Post
+from .backends import full_text_search
 from person.models import Person
-from custom_search.models import Continent, Country, State, Town
+from custom_search.gazetteer import LEVELS, get_gazetteer
 
 # View to handle post search
 class PostSearchView(ListView):
@@ -21,22 +22,19 @@ class PostSearchView(ListView):
         if not query:
             return Post.objects.none()
 
-        queryset = Post.objects.filter(
-            Q(category__name__icontains=query) |
-            Q(product_name__icontains=query) |
-            Q(description__icontains=query)
-        )
+        queryset = Post.objects.all()
 
         if continent:
-            queryset = queryset.filter(continent__name__icontains=continent)
+            queryset = queryset.filter(post_continent__name__icontains=continent)
         if country:
-            queryset = queryset.filter(country__name__icontains=country)
+            queryset = queryset.filter(post_country__name__icontains=country)
         if state:
-            queryset = queryset.filter(state__name__icontains=state)
+            queryset = queryset.filter(post_state__name__icontains=state)
         if town:
-            queryset = queryset.filter(town__name__icontains=town)
+            queryset = queryset.filter(post_town__name__icontains=town)
 
-        return queryset
+        # ranked by relevance, best match first (search_rank on each post)
+        return full_text_search(queryset, query)
 
 # View to handle person search
 class PersonSearchView(ListView):
@@ -88,17 +86,10 @@ def location_autocomplete(request):
     if not field or not query:
         return JsonResponse({"suggestions": []})
 
-    model_mapping = {
-        "continent": Continent,
-        "country": Country,
-        "state": State,
-        "town": Town
-    }
-
-    if field not in model_mapping:
+    if field not in LEVELS:
         return JsonResponse({"suggestions": []})
 
-    results = model_mapping[field].objects.filter(name__icontains=query)[:10]
-    suggestions = list(results.values_list("name", flat=True))
+    # 🗺️ in-memory gazetteer, no DB round trip
+    suggestions = get_gazetteer().search(field, query, limit=10)
 
     return JsonResponse({"suggestions": suggestions})
@@ -14,6 +14,7 @@ from django.core.exceptions import ValidationError
 from django.forms import modelformset_factory
 
 from custom_search.models import Continent, Country, State, Town
+from custom_search.gazetteer import UNSPECIFIED_ID, get_gazetteer
 from .models import SeekerPost, SeekerSocialMediaHandle
 from .mixins import LocationFieldsSetupMixin
 # from .utils.location_assignment import assign_location_fields
@@ -71,11 +72,6 @@ class BaseSeekerPostForm(forms.ModelForm, LocationFieldsSetupMixin):
         self.fields["post_town"].queryset = Town.objects.all()
 
 
-        # ✅ Force "Unspecified" to exist in querysets
-        self.fields['post_continent'].queryset = Continent.objects.filter(id=0) | Continent.objects.all()
-        self.fields['post_country'].queryset = Country.objects.filter(id=0) | Country.objects.all()
-        self.fields['post_state'].queryset = State.objects.filter(id=0) | State.objects.all()
-        self.fields['post_town'].queryset = Town.objects.filter(id=0) | Town.objects.all()
 
 
         # Remove Django's default "------" empty option for select fields (if they exist)
@@ -84,10 +80,10 @@ class BaseSeekerPostForm(forms.ModelForm, LocationFieldsSetupMixin):
                 self.fields[f].empty_label = None
 
         # Default initial to an "Unspecified" sentinel if present (id=0). If missing, initial becomes None.
-        self.fields["post_continent"].initial = Continent.objects.filter(id=0).first()
-        self.fields["post_country"].initial = Country.objects.filter(id=0).first()
-        self.fields["post_state"].initial = State.objects.filter(id=0).first()
-        self.fields["post_town"].initial = Town.objects.filter(id=0).first()
+        self.fields["post_continent"].initial = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        self.fields["post_country"].initial = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        self.fields["post_state"].initial = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        self.fields["post_town"].initial = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         self.fields["title"].label = "What are you seeking?"
         self.fields["title"].widget.attrs["placeholder"] = "E.g., iPhone 13, Plumbing service"
@@ -116,10 +112,10 @@ class BaseSeekerPostForm(forms.ModelForm, LocationFieldsSetupMixin):
         cleaned = super().clean()
         scope = cleaned.get("availability_scope")
 
-        unspecified_continent = Continent.objects.filter(id=0).first()
-        unspecified_country = Country.objects.filter(id=0).first()
-        unspecified_state = State.objects.filter(id=0).first()
-        unspecified_town = Town.objects.filter(id=0).first()
+        unspecified_continent = get_gazetteer().instance("continent", UNSPECIFIED_ID)
+        unspecified_country = get_gazetteer().instance("country", UNSPECIFIED_ID)
+        unspecified_state = get_gazetteer().instance("state", UNSPECIFIED_ID)
+        unspecified_town = get_gazetteer().instance("town", UNSPECIFIED_ID)
 
         # Apply scope fallback rules (same semantics as posts forms)
         if scope == "continent":
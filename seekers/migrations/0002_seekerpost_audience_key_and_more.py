@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_search', '0002_alter_town_code'),
+        ('seekers', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seekerpost',
+            name='audience_key',
+            field=models.CharField(default='global', editable=False, max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='seekerpost',
+            index=models.Index(fields=['status', 'audience_key', '-created_at'], name='seeker_audience_feed_idx'),
+        ),
+    ]
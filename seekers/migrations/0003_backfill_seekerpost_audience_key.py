@@ -0,0 +1,30 @@
+from django.db import migrations
+
+from posts.utils.audience import audience_key_for
+
+FIELDS = ("availability_scope", "post_continent", "post_country", "post_state", "post_town")
+
+
+def backfill_audience_key(apps, schema_editor):
+    SeekerPost = apps.get_model("seekers", "SeekerPost")
+
+    batch = []
+    for post in SeekerPost.objects.only("pk", *FIELDS).iterator(chunk_size=1000):
+        post.audience_key = audience_key_for(post)
+        batch.append(post)
+        if len(batch) >= 1000:
+            SeekerPost.objects.bulk_update(batch, ["audience_key"])
+            batch = []
+    if batch:
+        SeekerPost.objects.bulk_update(batch, ["audience_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seekers', '0002_seekerpost_audience_key_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_audience_key, migrations.RunPython.noop),
+    ]
@@ -3,7 +3,8 @@ from django import forms
 from django.core.exceptions import ValidationError
 from PIL import Image  # Optional: check image dimensions
 
-from custom_search.models import Continent, Country, State, Town
+from django.db.models import Q
+from custom_search.gazetteer import LEVELS, MODELS, PARENT, UNSPECIFIED_ID, get_gazetteer
 class LocationFieldsSetupMixin:
     def init_location_labels_and_placeholders(self):
         fields = [
@@ -35,25 +36,29 @@ class LocationFieldsSetupMixin:
                 })
 
     def init_location_queryset(self):
-        # ⛓ Dynamically filter dropdowns based on parent selection
-        data = self.data if hasattr(self, "data") else {}
-
-        if "post_continent" in data:
-            continent_id = data.get("post_continent")
-            self.fields["post_country"].queryset = Country.objects.filter(
-                continent_id=continent_id
-            )
-
-        if "post_country" in data:
-            country_id = data.get("post_country")
-            self.fields["post_state"].queryset = State.objects.filter(
-                country_id=country_id
-            )
-
-        if "post_state" in data:
-            state_id = data.get("post_state")
-            self.fields["post_town"].queryset = Town.objects.filter(
-                state_id=state_id
-            )
+        # ⛓ Render only what the current selection needs: the chosen place on
+        # each level plus the children of its parent (location_dropdown.js
+        # fetches the rest on change). Validation stays a single pk lookup
+        # (still scoped to the submitted parent), so no <option> list is ever
+        # built from the DB.
+        gazetteer = get_gazetteer()
+        parent_id = None
+        for level in LEVELS:
+            name = f"post_{level}"
+            if name not in self.fields:
+                continue
+            field = self.fields[name]
+            queryset = MODELS[level].objects.all()
+            if self.is_bound and PARENT[level] and gazetteer.exists(PARENT[level], parent_id):
+                queryset = queryset.filter(
+                    Q(pk=UNSPECIFIED_ID) | Q(**{f"{PARENT[level]}_id": parent_id})
+                )
+            field.queryset = queryset
 
+            selected_id = self[name].value()
+            choices = gazetteer.scoped_choices(level, parent_id, selected_id)
+            if field.empty_label is not None:
+                choices.insert(0, ("", field.empty_label))
+            field.widget.choices = choices
 
+            parent_id = selected_id
@@ -9,6 +9,7 @@ from django.utils import timezone
 from django.contrib.contenttypes.fields import GenericRelation
 from media_app.models import MediaFile
 from datetime import timedelta
+from posts.utils.audience import refresh_audience_key
 
 User = get_user_model()
 
@@ -53,6 +54,10 @@ class SeekerPost(models.Model):
         related_name="seeker_posts"
     )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+
+    # 🔑 scope + location path in one column (see posts/utils/audience.py), kept in sync by save()
+    audience_key = models.CharField(max_length=64, default="global", editable=False)
+
     category = models.ForeignKey(
         SeekerCategory,
         on_delete=models.CASCADE,
@@ -115,6 +120,10 @@ class SeekerPost(models.Model):
     class Meta:
         db_table = "seeker_post"
         ordering = ["-date"]
+        indexes = [
+            # visibility feed: status="approved" AND audience_key IN (...) ORDER BY created_at DESC
+            models.Index(fields=["status", "audience_key", "-created_at"], name="seeker_audience_feed_idx"),
+        ]
         verbose_name = "Seeker Post"
         verbose_name_plural = "Seeker Posts"
 
@@ -126,6 +135,7 @@ class SeekerPost(models.Model):
         return reverse("seekers:seeker_detail", kwargs={"pk": self.pk})
 
     def save(self, *args, **kwargs):
+        kwargs["update_fields"] = refresh_audience_key(self, kwargs.get("update_fields"))
         super().save(*args, **kwargs)
 
         if self.post_town_input:
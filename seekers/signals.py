@@ -1,8 +1,8 @@
 # seekers/signals.py
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from board.models import Board
+from board.models import Board, SEEKERS_BOARD
 from .models import SeekerPost
 
 
@@ -10,24 +10,27 @@ from .models import SeekerPost
 def sync_seekerpost_board(sender, instance, created, **kwargs):
     """
     Automatically add/remove SeekerPost from SeekersBoard when approval status changes.
-    Keeps the board in sync with the `is_approved` field.
+    Keeps the board in sync with the `status` field: approved requests are on
+    the board (entry refreshed on each save), others are taken off.
+    Requests that neither are nor were approved cost no queries.
     """
     try:
-        board, _ = Board.objects.get_or_create(
-            name="SeekersBoard",
-            defaults={"description": "Board for all approved seeker requests."}
-        )
+        # _prev_status comes from the pre_save receiver in notifications.signals
+        prev_status = getattr(instance, "_prev_status", None)
 
-        if getattr(instance, "is_approved", False):
-            # ✅ Add approved seeker posts to the board
-            if instance not in board.seeker_posts.all():
-                board.add_item(instance)
-                print(f"[INFO] Added approved SeekerPost {instance.pk} to SeekersBoard.")
-        else:
+        if instance.status == "approved":
+            # ✅ Add approved seeker posts to the board (idempotent)
+            Board.named(SEEKERS_BOARD).add_item(instance)
+        elif prev_status in (None, "approved"):
             # 🧹 Remove unapproved seeker posts
-            if instance in board.seeker_posts.all():
-                board.seeker_posts.remove(instance)
-                print(f"[INFO] Removed unapproved SeekerPost {instance.pk} from SeekersBoard.")
+            Board.named(SEEKERS_BOARD).remove_item(instance)
 
     except Exception as e:
         print(f"[WARN] Failed to sync SeekerPost {instance.pk}: {e}")
+
+
+@receiver(post_delete, sender=SeekerPost)
+def remove_deleted_seekerpost_from_board(sender, instance, **kwargs):
+    """M2M rows cascade on their own; the generic board entry doesn't."""
+    if instance.status == "approved":
+        Board.named(SEEKERS_BOARD).remove_item(instance)
@@ -10,6 +10,8 @@ from django.db.models import Q
 from django.contrib.contenttypes.models import ContentType
 from django.views import View
 from board.mixins import BoardItemsMixin
+from custom_search.gazetteer import LEVELS, get_gazetteer
+from posts.feed_cache import ALL_AUDIENCES, CachedFeedMixin
 from django.db.models import Prefetch
 import logging
 from comment.models import Comment
@@ -17,6 +19,7 @@ from comment.forms import CommentForm
 from person.models import Person  # assumes same as posts app
 from seekers.utils.location_assignment import assign_location_fields
 from seekers.utils.location_scope_guard import apply_location_scope_fallback
+from posts.utils.audience import audience_keys_for_profile
 from media_app.models import MediaFile
 from .models import (
     SeekerPost,
@@ -59,15 +62,17 @@ class SeekerCommentCreateView(LoginRequiredMixin, View):
 
         return redirect(post.get_absolute_url())
 
-class SeekerPostListView(BoardItemsMixin, ListView):
+class SeekerPostListView(CachedFeedMixin, BoardItemsMixin, ListView):
     model = SeekerPost
     template_name = "seekers/seeker_list.html"
+    partial_template_name = "seekers/includes/feed_page.html"  # infinite-scroll pages
     context_object_name = "posts"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # ✅ match posts.PostListView and your templates
-        context["board_items"] = self.get_board_items(7)
+        if not self.is_partial:  # scroll pages only need the cards
+            # ✅ match posts.PostListView and your templates
+            context["board_items"] = self.get_board_items(7)
         return context
 
     def get_queryset(self):
@@ -86,6 +91,9 @@ class SeekerPostListView(BoardItemsMixin, ListView):
         user = self.request.user
         profile = getattr(user, "profile", None)
 
+        # cached feed pages are shared by everyone with the same audience keys
+        self.feed_audience = [ALL_AUDIENCES]
+
         # start from approved seeker posts only
         qs = SeekerPost.objects.filter(status="approved")
 
@@ -118,18 +126,19 @@ class SeekerPostListView(BoardItemsMixin, ListView):
         town_q = self.request.GET.get("town")
 
         if continent_q or country_q or state_q or town_q:
+            self.feed_audience = None  # ad-hoc filters: not cached
             filters = Q()
             # Always include global posts in search results
             filters |= Q(availability_scope="global")
 
             if town_q:
-                filters |= Q(availability_scope="town", post_town__name__iexact=town_q)
+                filters |= Q(availability_scope="town", post_town_id__in=get_gazetteer().resolve("town", town_q))
             if state_q:
-                filters |= Q(availability_scope="state", post_state__name__iexact=state_q)
+                filters |= Q(availability_scope="state", post_state_id__in=get_gazetteer().resolve("state", state_q))
             if country_q:
-                filters |= Q(availability_scope="country", post_country__name__iexact=country_q)
+                filters |= Q(availability_scope="country", post_country_id__in=get_gazetteer().resolve("country", country_q))
             if continent_q:
-                filters |= Q(availability_scope="continent", post_continent__name__iexact=continent_q)
+                filters |= Q(availability_scope="continent", post_continent_id__in=get_gazetteer().resolve("continent", continent_q))
 
             return qs.filter(filters).order_by("-created_at")
 
@@ -138,55 +147,10 @@ class SeekerPostListView(BoardItemsMixin, ListView):
             return qs.order_by("-created_at")
 
         # --- Default feed: filter by user's profile location ---
+        # One indexed audience key per post (see posts/utils/audience.py), same as PostListView.
         if profile:
-            filters = Q()
-
-            # 1) global always visible
-            filters |= Q(availability_scope="global")
-
-            # 2) continent scope
-            if getattr(profile, "continent", None):
-                filters |= Q(availability_scope="continent", post_continent=profile.continent)
-
-            # 3) country scope
-            if getattr(profile, "continent", None) and getattr(profile, "country", None):
-                filters |= Q(
-                    availability_scope="country",
-                    post_continent=profile.continent,
-                    post_country=profile.country,
-                )
-
-            # 4) state scope
-            if (
-                getattr(profile, "continent", None)
-                and getattr(profile, "country", None)
-                and getattr(profile, "state", None)
-            ):
-                filters |= Q(
-                    availability_scope="state",
-                    post_continent=profile.continent,
-                    post_country=profile.country,
-                    post_state=profile.state,
-                )
-
-            # 5) town scope
-            if (
-                getattr(profile, "continent", None)
-                and getattr(profile, "country", None)
-                and getattr(profile, "state", None)
-                and getattr(profile, "town", None)
-            ):
-                filters |= Q(
-                    availability_scope="town",
-                    post_continent=profile.continent,
-                    post_country=profile.country,
-                    post_state=profile.state,
-                    post_town=profile.town,
-                )
-
-            # NOTE: prototype posts view also doesn’t apply filters here explicitly.
-            # To stay faithful to the prototype, we keep the same pattern and just
-            # return qs ordered. If you later fix it in PostListView, mirror that fix here too.
+            self.feed_audience = audience_keys_for_profile(profile)
+            qs = qs.filter(audience_key__in=self.feed_audience)
 
         # --- Fallback: user has no profile/location info -> only global posts ---
         return qs.order_by("-created_at")
@@ -663,83 +627,39 @@ def home(request):
 
 @require_GET
 def seeker_location_autocomplete(request):
-    from custom_search.models import Continent, Country, State, Town
-
     location_type = request.GET.get("type", "").lower()
     query = request.GET.get("q", "")
 
-    model_map = {
-        "continent": Continent,
-        "country": Country,
-        "state": State,
-        "town": Town,
-    }
-
-    model = model_map.get(location_type)
-    if not model:
+    if location_type not in LEVELS:
         return JsonResponse({"results": []})
 
-    results = model.objects.filter(name__icontains=query).values_list("name", flat=True)[:10]
-    return JsonResponse({"results": list(results)})
+    # 🗺️ served from the in-memory gazetteer, no DB round trip
+    results = get_gazetteer().search(location_type, query, limit=10)
+    return JsonResponse({"results": results})
 
 # ----------------------------
 # Location API Endpoints
 # ----------------------------
+# All served from the in-memory gazetteer (custom_search/gazetteer.py):
+# children of the selected parent + "Unspecified" (id=0), sorted by name.
 @require_GET
 def continents_api(request):
-    from custom_search.models import Continent
-    continents = Continent.objects.all().order_by("name")
-
-    # Include Unspecified (id=0) first if it exists
-    unspecified = Continent.objects.filter(id=0)
-    continents = (unspecified | continents).distinct()
+    return JsonResponse(get_gazetteer().options("continent"), safe=False)
 
-    data = [{"id": c.id, "name": c.name} for c in continents]
-    return JsonResponse(data, safe=False)
 
 @require_GET
 def countries_api(request):
-    from custom_search.models import Country
     continent_id = request.GET.get("continent_id")
-
-    countries = Country.objects.none()
-    if continent_id:
-        countries = Country.objects.filter(continent_id=continent_id)
-
-    unspecified = Country.objects.filter(id=0)
-    countries = (unspecified | countries).distinct().order_by("name")
-
-    data = [{"id": c.id, "name": c.name} for c in countries]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("country", continent_id), safe=False)
 
 
 @require_GET
 def states_api(request):
-    from custom_search.models import State
     country_id = request.GET.get("country_id")
-
-    states = State.objects.none()
-    if country_id:
-        states = State.objects.filter(country_id=country_id)
-
-    unspecified = State.objects.filter(id=0)
-    states = (unspecified | states).distinct().order_by("name")
-
-    data = [{"id": s.id, "name": s.name} for s in states]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("state", country_id), safe=False)
 
 
 @require_GET
 def towns_api(request):
-    from custom_search.models import Town
     state_id = request.GET.get("state_id")
-
-    towns = Town.objects.none()
-    if state_id:
-        towns = Town.objects.filter(state_id=state_id)
-
-    unspecified = Town.objects.filter(id=0)
-    towns = (unspecified | towns).distinct().order_by("name")
-
-    data = [{"id": t.id, "name": t.name} for t in towns]
-    return JsonResponse(data, safe=False)
+    return JsonResponse(get_gazetteer().options("town", state_id), safe=False)
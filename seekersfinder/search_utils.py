@@ -1,5 +1,6 @@
 from django.db.models import Q
 from seekers.models import SeekerPost
+from search.backends import full_text_search
 
 def normalize(val):
     """Turn '0' or '' into None, keep valid IDs."""
@@ -109,20 +110,6 @@ def search_seeker_posts(params):
 
     seeker_posts = SeekerPost.objects.all()
 
-    # ✅ keyword search
-    if query:
-        keywords = query.split()
-        q_objects = Q()
-        for word in keywords:
-            q_objects |= (
-                Q(business_name__icontains=word) |
-                Q(title__icontains=word) |
-                Q(description__icontains=word) |
-                Q(author_phone_number__icontains=word) |
-                Q(author_email__icontains=word)
-            )
-        seeker_posts = seeker_posts.filter(q_objects)
-
     # ✅ category filter
     if category:
         seeker_posts = seeker_posts.filter(category_id=category)
@@ -152,7 +139,8 @@ def search_seeker_posts(params):
             post_town_id=town,
         )
 
-    return seeker_posts
+    # ✅ full-text search last: results come back ranked by relevance (search_rank)
+    return full_text_search(seeker_posts, query)
 
 def build_keyword_filter(query):
     """
@@ -1,6 +1,9 @@
 # seekerfinder/services.py
 from django.db.models import Q
 from seekers.models import SeekerPost
+from search.backends import full_text_search
+from custom_search.gazetteer import get_gazetteer
+from posts.utils.audience import audience_keys_for_profile
 
 SEARCH_FIELDS = [
     "title__icontains",
@@ -33,39 +36,10 @@ def visible_to(queryset, user):
 
     # If no profile, only show global
     if not profile:
-        return qs.filter(availability_scope="global")
+        return qs.filter(audience_key="global")
 
-    filters = Q()
-    filters |= Q(availability_scope="global")
-
-    if getattr(profile, "continent", None):
-        filters |= Q(availability_scope="continent", post_continent=profile.continent)
-
-    if getattr(profile, "country", None):
-        filters |= Q(
-            availability_scope="country",
-            post_continent=profile.continent,
-            post_country=profile.country,
-        )
-
-    if getattr(profile, "state", None):
-        filters |= Q(
-            availability_scope="state",
-            post_continent=profile.continent,
-            post_country=profile.country,
-            post_state=profile.state,
-        )
-
-    if getattr(profile, "town", None):
-        filters |= Q(
-            availability_scope="town",
-            post_continent=profile.continent,
-            post_country=profile.country,
-            post_state=profile.state,
-            post_town=profile.town,
-        )
-
-    return qs.filter(filters).distinct()
+    # Global plus one audience key per location level (see posts/utils/audience.py)
+    return qs.filter(audience_key__in=audience_keys_for_profile(profile))
 
 def search_seeker_posts(query=None, user=None, bypass=False, location_filters=None):
     """
@@ -87,20 +61,18 @@ def search_seeker_posts(query=None, user=None, bypass=False, location_filters=No
         town = location_filters.get("town")
 
         if continent:
-            loc_q |= Q(availability_scope="continent", post_continent__name__iexact=continent)
+            loc_q |= Q(availability_scope="continent", post_continent_id__in=get_gazetteer().resolve("continent", continent))
         if country:
-            loc_q |= Q(availability_scope="country", post_country__name__iexact=country)
+            loc_q |= Q(availability_scope="country", post_country_id__in=get_gazetteer().resolve("country", country))
         if state:
-            loc_q |= Q(availability_scope="state", post_state__name__iexact=state)
+            loc_q |= Q(availability_scope="state", post_state_id__in=get_gazetteer().resolve("state", state))
         if town:
-            loc_q |= Q(availability_scope="town", post_town__name__iexact=town)
+            loc_q |= Q(availability_scope="town", post_town_id__in=get_gazetteer().resolve("town", town))
 
         qs = qs.filter(loc_q)
 
-    # Apply keyword query
-    if query:
-        kw_q = build_keyword_filter(query)
-        if kw_q:
-            qs = qs.filter(kw_q)
+    # Apply keyword query, ranked by relevance
+    if query and query.strip():
+        return full_text_search(qs, query)
 
-    return qs.distinct().order_by("-created_at")
+    return qs.order_by("-created_at")
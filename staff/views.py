@@ -12,7 +12,7 @@ from person.models import Person, PendingLocationRequest as PersonPendingLocatio
 from seekers.models import SeekerPost, PendingSeekerLocationRequest
 from comment.models import Comment
 from accounts.models import CustomUser
-from custom_search.models import Town
+from custom_search.towns import ingest_pending_requests
 from .models import StaffBoardPost, AuditLog
 from django.contrib.auth import get_user_model
 from staff.utils import log_action
@@ -109,7 +109,8 @@ def post_detail_view(request, pk):
 def approve_post(request, pk):
     post = get_object_or_404(Post, pk=pk)
     post.status = 'approved'
-    post.save()
+    with transaction.atomic():  # status change + queued notifications commit together
+        post.save()
     # log staff action
     log_action(request, "Approved Post", post, f"Approved post '{post.product_name}' by {post.author.username}")
     
@@ -144,7 +145,8 @@ def seeker_post_detail_view(request, pk):
 def approve_seeker_post(request, pk):
     seeker_post = get_object_or_404(SeekerPost, pk=pk)
     seeker_post.status = 'approved'
-    seeker_post.save()
+    with transaction.atomic():  # status change + queued notifications commit together
+        seeker_post.save()
 
     # ✅ Log staff action
     log_action(request, "Approved SeekerPost", seeker_post, f"Approved seeker post '{seeker_post.title}' by {seeker_post.author.username}")
@@ -241,24 +243,9 @@ def approve_location(request, pk):
 
     try:
         with transaction.atomic():
-            # 1️⃣ Check for existing Town under the same state
-            town = Town.objects.filter(
-                Q(state=parent_state) & Q(name__iexact=typed_town)
-            ).first()
-
-            # 2️⃣ Create a new Town if it doesn’t exist
-            if not town:
-                last_town = Town.objects.order_by("-id").first()
-                next_id = (last_town.id + 1) if last_town else 1
-                prefix = typed_town[:2].lower()
-                code = f"{prefix}{next_id}"
-
-                town = Town.objects.create(
-                    id=next_id,
-                    code=code,
-                    name=typed_town,
-                    state=parent_state,
-                )
+            # 1️⃣ + 2️⃣ Reuse the Town under the same state, or create it (sequence-allocated id)
+            _, towns = ingest_pending_requests([pending])
+            town = towns[pending.pk]
 
             # 3️⃣ Link the Town to the related post (Post or Seeker)
             related_post = pending.post
@@ -0,0 +1,65 @@
+// static/js/01-frontend/infinite_scroll.js
+// Infinite scroll for the keyset-paginated feeds (posts/pagination.py).
+// Watches the .js-feed-sentinel rendered by templates/infinite_scroll.html and,
+// when it comes into view, fetches the next page with ?partial=1 and appends the cards.
+(function() {
+    'use strict';
+
+    let loading = false;
+
+    function partialUrl(url) {
+        const next = new URL(url, window.location.origin);
+        next.searchParams.set('partial', '1');
+        return next.toString();
+    }
+
+    async function loadNextPage(sentinel, observer) {
+        const nextUrl = sentinel.dataset.nextUrl;
+        if (loading || !nextUrl) return;
+        loading = true;
+
+        try {
+            const response = await fetch(partialUrl(nextUrl), {
+                headers: { 'X-Requested-With': 'XMLHttpRequest' },
+                credentials: 'same-origin',
+            });
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+            const template = document.createElement('template');
+            template.innerHTML = await response.text();
+
+            // The page carries its own sentinel when there is another page after it
+            const nextSentinel = template.content.querySelector('.js-feed-sentinel');
+            if (nextSentinel) nextSentinel.remove();
+
+            sentinel.before(template.content);
+
+            if (nextSentinel) {
+                sentinel.dataset.nextUrl = nextSentinel.dataset.nextUrl;
+            } else {
+                observer.disconnect();
+                sentinel.remove();
+            }
+
+            // media_carousel.js re-initialises carousels on this event
+            document.dispatchEvent(new Event('contentLoaded'));
+        } catch (e) {
+            console.warn('Failed to load more posts:', e);
+        } finally {
+            loading = false;
+        }
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        const sentinel = document.querySelector('.js-feed-sentinel');
+        if (!sentinel || !('IntersectionObserver' in window)) return;
+
+        const observer = new IntersectionObserver((entries) => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                loadNextPage(sentinel, observer);
+            }
+        }, { rootMargin: '600px 0px' });
+
+        observer.observe(sentinel);
+    });
+})();
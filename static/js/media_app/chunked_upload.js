@@ -0,0 +1,135 @@
+// static/js/media_app/chunked_upload.js
+// Resumable uploads for large videos (/media-api/uploads/, see media_app/uploads.py).
+// On a <form data-chunked-upload data-target="person.person" data-object-id="…">,
+// videos bigger than data-chunked-min bytes are sent in chunks before the form
+// submits the remaining files as usual. A failed chunk is retried from the
+// offset the server reports, and the session id is kept in localStorage, so a
+// dropped connection or a page reload resumes instead of starting from zero.
+(function() {
+    'use strict';
+
+    const API = '/media-api/uploads/';
+    const MAX_RETRIES = 8;
+    const CHUNKED_EXTENSIONS = ['mp4', 'webm', 'ogg'];
+
+    function csrfToken(form) {
+        const input = form.querySelector('input[name="csrfmiddlewaretoken"]');
+        return input ? input.value : '';
+    }
+
+    function storageKey(file, form) {
+        return ['chunked-upload', form.dataset.target, form.dataset.objectId, file.name, file.size, file.lastModified].join(':');
+    }
+
+    function sleep(ms) {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    async function api(url, options, form) {
+        const response = await fetch(url, {
+            credentials: 'same-origin',
+            ...options,
+            headers: { 'X-CSRFToken': csrfToken(form), ...(options.headers || {}) },
+        });
+        const body = response.status === 204 ? null : await response.json();
+        if (!response.ok && response.status !== 409) {
+            const error = new Error((body && body.detail) || `Upload failed (${response.status})`);
+            error.fatal = response.status >= 400 && response.status < 500;
+            throw error;
+        }
+        return body;
+    }
+
+    async function openSession(file, form) {
+        const key = storageKey(file, form);
+        const saved = localStorage.getItem(key);
+        if (saved) {
+            try {
+                const session = await api(`${API}${saved}/`, { method: 'GET' }, form);
+                if (session.status === 'uploading') return session;
+            } catch (e) { /* expired or gone: start over */ }
+            localStorage.removeItem(key);
+        }
+        const session = await api(API, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                target: form.dataset.target,
+                object_id: form.dataset.objectId,
+                filename: file.name,
+                size: file.size,
+            }),
+        }, form);
+        localStorage.setItem(key, session.id);
+        return session;
+    }
+
+    async function uploadFile(file, form, onProgress) {
+        let session = await openSession(file, form);
+        let retries = 0;
+        while (session.status === 'uploading' && session.offset < file.size) {
+            const chunk = file.slice(session.offset, session.offset + session.chunk_size);
+            try {
+                session = await api(`${API}${session.id}/`, {
+                    method: 'PATCH',
+                    headers: { 'Upload-Offset': String(session.offset), 'Content-Type': 'application/offset+octet-stream' },
+                    body: chunk,
+                }, form);
+                retries = 0;
+                onProgress(session.offset / file.size);
+            } catch (error) {
+                if (error.fatal || ++retries > MAX_RETRIES) throw error;
+                await sleep(Math.min(30000, 1000 * 2 ** retries));
+                try {
+                    session = await api(`${API}${session.id}/`, { method: 'GET' }, form);  // resume point
+                } catch (e) { /* still offline: retry from the offset we have */ }
+            }
+        }
+        localStorage.removeItem(storageKey(file, form));
+        if (session.status !== 'complete') throw new Error(session.error || 'Upload failed');
+        return session;
+    }
+
+    function isChunked(file, minSize) {
+        const extension = file.name.split('.').pop().toLowerCase();
+        return file.type.startsWith('video/') && file.size > minSize && CHUNKED_EXTENSIONS.includes(extension);
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        document.querySelectorAll('form[data-chunked-upload]').forEach(form => {
+            const input = form.querySelector('input[type="file"]');
+            const status = form.querySelector('[data-chunked-status]');
+            const minSize = Number(form.dataset.chunkedMin || 5 * 1024 * 1024);
+            if (!input || !window.fetch || !window.DataTransfer) return;
+
+            form.addEventListener('submit', async event => {
+                const large = Array.from(input.files).filter(file => isChunked(file, minSize));
+                if (!large.length) return;  // nothing big: plain multipart submit
+                event.preventDefault();
+
+                const submit = form.querySelector('[type="submit"]');
+                if (submit) submit.disabled = true;
+                const failures = [];
+                for (const file of large) {
+                    try {
+                        await uploadFile(file, form, fraction => {
+                            if (status) status.textContent = `⏫ ${file.name}: ${Math.round(fraction * 100)}%`;
+                        });
+                    } catch (error) {
+                        failures.push(`${file.name}: ${error.message}`);
+                    }
+                }
+                if (failures.length) alert(`Some videos were not uploaded:\n${failures.join('\n')}`);
+
+                const rest = new DataTransfer();
+                Array.from(input.files).filter(file => !large.includes(file)).forEach(file => rest.items.add(file));
+                if (rest.files.length) {
+                    input.files = rest.files;
+                    form.submit();  // the remaining (small) files go the usual way
+                } else {
+                    window.location.reload();
+                }
+            });
+        });
+    });
+})();
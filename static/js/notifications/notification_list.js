@@ -1,28 +1,55 @@
 //              ${!n.read ? '<span class="notification-card__badge">new</span>' : ""}
 //
 // notification_list.js — FINAL 100% WORKING VERSION (GUARANTEED)
+// The API is keyset-paginated ({next, results}, see notifications/pagination.py):
+// the first page loads right away, older pages when #notifications-sentinel scrolls into view.
+let loadedCount = 0;
+let loadingPage = false;
+
 document.addEventListener("DOMContentLoaded", () => {
-  fetch("/notifications/api/?unread=true")
+  const container = document.getElementById("notifications-container");
+  const sentinel = document.getElementById("notifications-sentinel");
+  container.innerHTML = "";
+
+  loadNotificationPage("/notifications/api/?unread=true", sentinel);
+
+  if (sentinel && "IntersectionObserver" in window) {
+    new IntersectionObserver(entries => {
+      if (entries.some(entry => entry.isIntersecting) && sentinel.dataset.nextUrl) {
+        loadNotificationPage(sentinel.dataset.nextUrl, sentinel);
+      }
+    }, { rootMargin: "400px 0px" }).observe(sentinel);
+  }
+});
+
+function loadNotificationPage(url, sentinel) {
+  if (loadingPage) return;
+  loadingPage = true;
+
+  fetch(url)
     .then(r => r.json())
     .then(data => {
       const container = document.getElementById("notifications-container");
       const countEl = document.getElementById("notification-count");
       const emptyEl = document.getElementById("no-notifications");
+      const results = (data && data.results) || [];
 
-      container.innerHTML = "";
+      if (sentinel) sentinel.dataset.nextUrl = data.next || "";
 
-      if (!data || data.length === 0) {
+      if (loadedCount === 0 && results.length === 0) {
         countEl.textContent = "0 notifications";
         emptyEl.style.display = "block";
         return;
       }
 
-      countEl.textContent = `${data.length}`;
+      const firstIndex = loadedCount;
+      loadedCount += results.length;
+      countEl.textContent = `${loadedCount}${data.next ? "+" : ""}`;
 
-      data.forEach((n, i) => {
+      results.forEach((n, i) => {
         const actor = n.actor || "Someone";
         const verb = (n.verb || "").replace(/^\d+|\bnull\b/gi, "").trim();
-        const timestamp = formatTimeAgo(n.created_at);
+        const timestamp = formatTimeAgo(n.last_event_at || n.created_at);
 
         // === BUILD URL — MULTIPLE FALLBACKS (THIS IS BULLETPROOF) ===
         let targetUrl = n.link || n.extra?.link;
@@ -98,8 +125,8 @@ document.addEventListener("DOMContentLoaded", () => {
         container.appendChild(card);
       });
 
-      // Animation
-      container.querySelectorAll(".notification-card").forEach((el, i) => {
+      // Animation (just the cards this page added)
+      Array.from(container.querySelectorAll(".notification-card")).slice(firstIndex).forEach((el, i) => {
         el.style.opacity = "0";
         el.style.transform = "translateY(20px)";
         setTimeout(() => {
@@ -113,8 +140,11 @@ document.addEventListener("DOMContentLoaded", () => {
     .catch(err => {
       console.error("Failed to load notifications:", err);
       document.getElementById("notification-count").textContent = "Error";
+    })
+    .finally(() => {
+      loadingPage = false;
     });
-});
+}
 
 // Your perfect helpers
 function formatTimeAgo(dateString) {
@@ -0,0 +1,66 @@
+// static/js/notifications/notification_stream.js
+// Live notifications over Server-Sent Events (/notifications/stream/).
+// Keeps the sidebar badge in step and re-broadcasts every new notification as a
+// "notification:new" DOM event (detail = same JSON as /notifications/api/).
+// The stream is only used when base.html marks this script data-live (an ASGI
+// deployment, settings.NOTIFICATION_STREAM); otherwise, or once the server
+// closes the stream for good, the badge is polled from /notifications/unread-count/.
+(function() {
+    'use strict';
+
+    const POLL_MS = 60000;
+    const live = document.currentScript && 'live' in document.currentScript.dataset;
+
+    function setBadge(count) {
+        const link = document.querySelector('.sidebar-nav-item[data-tooltip="Notifications"] .sidebar-nav-item-container');
+        if (!link) return;
+        let badge = link.querySelector('.sidebar-nav-badge');
+        if (!count) {
+            if (badge) badge.remove();
+            return;
+        }
+        if (!badge) {
+            badge = document.createElement('span');
+            badge.className = 'sidebar-nav-badge';
+            link.appendChild(badge);
+        }
+        badge.textContent = String(count);
+    }
+
+    function poll() {
+        const refresh = () => {
+            if (document.hidden) return;
+            fetch('/notifications/unread-count/', { credentials: 'same-origin' })
+                .then(response => response.ok ? response.json() : null)
+                .then(body => { if (body) setBadge(body.unread || 0); })
+                .catch(() => {});
+        };
+        setInterval(refresh, POLL_MS);
+        document.addEventListener('visibilitychange', refresh);
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        if (!live || !('EventSource' in window)) {
+            poll();
+            return;
+        }
+        let unread = 0;
+        const source = new EventSource('/notifications/stream/');
+
+        source.addEventListener('error', () => {
+            // CLOSED means the browser gave up (e.g. a 204): stop and poll instead
+            if (source.readyState === EventSource.CLOSED) poll();
+        });
+
+        source.addEventListener('unread', (e) => {
+            unread = JSON.parse(e.data).unread || 0;
+            setBadge(unread);
+        });
+
+        source.addEventListener('notification', (e) => {
+            const notification = JSON.parse(e.data);
+            if (!notification.read) setBadge(++unread);
+            document.dispatchEvent(new CustomEvent('notification:new', { detail: notification }));
+        });
+    });
+})();